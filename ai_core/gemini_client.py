@@ -7,31 +7,18 @@ from config import settings
 from utils.json_utils import safe_load_json_from_text
 from utils.validator import validate_json
 from utils.logging_config import logger
+# Same backend selection (LLM_BACKEND: gemini / stub / record / replay) as the rest of the app
+from utils.ai_bridge import get_genai_model
+from utils.llm_backends import ReplayMiss, needs_api_key
 
 MAX_RETRIES = 2
 
-def get_genai_model():
-    """Lazy load GenAI to avoid import conflicts and configure it."""
-    try:
-        import google.generativeai as genai
-        if settings.GEMINI_API_KEY:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-        else:
-            logger.warning("GEMINI_API_KEY is missing.")
-        return genai.GenerativeModel(settings.LLM_MODEL)
-    except ImportError:
-        logger.error("google-generativeai package not found.")
-        raise
-    except Exception as e:
-        logger.error(f"Failed to initialize GenAI: {e}")
-        raise
-
 def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Dict[str, Any]:
     """
     Call LLM, extract first balanced JSON, validate against schema.
     """
-    if not settings.GEMINI_API_KEY:
-        raise ValueError("GEMINI_API_KEY not configured.")
+    if needs_api_key() and not settings.GEMINI_API_KEY:
+        raise ValueError("GEMINI_API_KEY not configured (or set LLM_BACKEND=stub / replay to run offline).")
 
     try:
         model = get_genai_model()
@@ -74,6 +61,9 @@ def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Di
             last_err = f"Validation error: {err}"
             logger.warning(f"LLM Schema Validation Failed: {err}")
             
+        except ReplayMiss:
+            # A recording won't appear by retrying
+            raise
         except Exception as e:
             last_err = f"LLM error: {str(e)}"
             logger.error(f"LLM error: {e}")
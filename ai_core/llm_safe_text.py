@@ -1,13 +1,11 @@
-import os
-from google.generativeai import GenerativeModel
-from config import settings
+from utils.ai_bridge import get_genai_model
 
 def call_small_llm_text(prompt: str, timeout=10):
     """
     Simple text-only LLM call for non-critical heuristic tasks like bullet optimization.
     """
     try:
-        model = GenerativeModel(settings.LLM_MODEL)
+        model = get_genai_model()
         resp = model.generate_content(prompt)
         return resp.text.strip()
     except Exception as e:
@@ -1,4 +1,3 @@
-import numpy as np
 from typing import List, Dict, Any, Tuple
 from collections import Counter
 from utils.logging_config import logger
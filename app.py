@@ -7,20 +7,21 @@ from config import settings
 from utils.logging_config import logger
 from utils.loaders import extract_resume_text
 from utils.models import UserProfile
+from utils.tracing import request_trace, export_metrics
+from utils.warmup import start_background_warmup
+from utils.jobs import get_job_queue, PENDING, DONE, FAILED
 
 # NLP Core
 from nlp.nlp_engine import analyze_text
-from intelligence.ontology import normalize_skills
+from intelligence.ontology import normalize_skills, get_canonical_skills
 from intelligence.role_matcher import calculate_role_fit
 from intelligence.gap_analysis import gap_analysis
 
 # New Analytics & Vis
 from analytics.vector_analytics import calculate_skill_vector
 from visualization.radar_chart import render_radar_chart
-from visualization.network_graph import render_skill_network
+from visualization.network_graph import render_skill_network, skill_network_angles
 from visualization.heatmap import render_resume_heatmap
-from ai_core.synthesis import generate_roadmap
-from ai_core.explorer import suggest_exploration, generate_projects
 
 # --- PAGE CONFIG ---
 st.set_page_config(
@@ -132,6 +133,47 @@ if "exploration_data" not in st.session_state:
     st.session_state.exploration_data = None
 if "project_data" not in st.session_state:
     st.session_state.project_data = None
+if "roadmap_data" not in st.session_state:
+    st.session_state.roadmap_data = None
+if "jobs" not in st.session_state:
+    st.session_state.jobs = {} # job kind -> job id (see utils.jobs)
+
+# Session-state slot each background job's result lands in
+JOB_RESULT_KEYS = {"exploration": "exploration_data", "projects": "project_data", "roadmap": "roadmap_data"}
+
+def submit_job(kind, **params):
+    """Queue generative work in the background, replacing any earlier job of the same kind."""
+    jobs = get_job_queue()
+    previous = st.session_state.jobs.get(kind)
+    if previous:
+        jobs.cancel(previous)
+    st.session_state[JOB_RESULT_KEYS[kind]] = None
+    st.session_state.jobs[kind] = jobs.submit(kind, **params)
+
+def sync_jobs():
+    """Copy finished job results into session state. Returns the kinds still running."""
+    pending = []
+    for kind, job_id in list(st.session_state.jobs.items()):
+        job = get_job_queue().get(job_id)
+        if job is None:
+            st.session_state.jobs.pop(kind)
+        elif job["status"] in PENDING:
+            pending.append(kind)
+        else:
+            if job["status"] == DONE:
+                st.session_state[JOB_RESULT_KEYS[kind]] = job["result"]
+            elif job["status"] == FAILED:
+                st.session_state[JOB_RESULT_KEYS[kind]] = {"error": job["error"]}
+            st.session_state.jobs.pop(kind)
+    return pending
+
+def render_pending_job(kind, label):
+    """Placeholder shown while a job runs, with a cancel button."""
+    st.info(f"⏳ {label}...")
+    if st.button("Cancel", key=f"cancel_{kind}"):
+        get_job_queue().cancel(st.session_state.jobs[kind])
+        st.session_state.jobs.pop(kind, None)
+        st.rerun()
 
 # --- SIDEBAR: FLOW CONTROL ---
 with st.sidebar:
@@ -160,36 +202,34 @@ with st.sidebar:
                 """, unsafe_allow_html=True)
                 
                 try:
-                    raw_text, redacted = extract_resume_text(uploaded_file)
-                    
-                    # NLP Engine
-                    signals = analyze_text(raw_text)
-                    raw_skills = [s.get('skill', s.get('name')) for s in signals['skills']]
-                    normalized = normalize_skills(raw_skills)
-                    skill_list = [s if isinstance(s, str) else s.get('name') for s in normalized]
+                    with request_trace("resume_analysis"):
+                        raw_text, redacted = extract_resume_text(uploaded_file)
+                        if not raw_text:
+                            st.error("Could not read text from this file (unsupported, too large or corrupted).")
+                            st.stop()
                     
-                    # Create Profile
-                    profile = UserProfile(
-                        name="Candidate",
-                        raw_text=raw_text,
-                        skills=skill_list,
-                        target_role=target_role,
-                        confidence_score=signals.get("confidence_score", 0),
-                        is_manual=False
-                    )
-                    st.session_state.user_profile = profile
-                    st.session_state.analysis_complete = True
+                        # NLP Engine
+                        signals = analyze_text(raw_text, get_canonical_skills())
+                        raw_skills = [s.get('skill', s.get('name')) for s in signals['skills']]
+                        normalized = normalize_skills(raw_skills)
+                        skill_list = [s if isinstance(s, str) else s.get('name') for s in normalized]
                     
-                    # Trigger GenAI
-                    loader.markdown(f"""
-                        <div class="cyber-loader-container">
-                            <div class="cyber-loader"></div>
-                            <div class="cyber-loader-text">SYNTHESIZING FUTURE PATHWAYS...</div>
-                        </div>
-                    """, unsafe_allow_html=True)
+                        # Create Profile
+                        profile = UserProfile(
+                            name="Candidate",
+                            raw_text=raw_text,
+                            skills=skill_list,
+                            skill_spans=sorted(m for s in signals['skills'] for m in s.get('mentions', [])),
+                            target_role=target_role,
+                            confidence_score=signals.get("confidence_score", 0),
+                            is_manual=False
+                        )
+                        st.session_state.user_profile = profile
+                        st.session_state.analysis_complete = True
                     
-                    st.session_state.exploration_data = suggest_exploration(skill_list, ["Tech"])
-                    st.session_state.project_data = generate_projects(skill_list, target_role)
+                        # Trigger GenAI (background jobs; the dashboard polls for results)
+                        submit_job("exploration", skills=skill_list, interests=["Tech"])
+                        submit_job("projects", skills=skill_list, ambition=target_role)
                     
                 finally:
                     loader.empty()
@@ -210,32 +250,39 @@ with st.sidebar:
                 render_cyber_loader("CONSTRUCTING NEURAL STRATEGY...")
             
             try:
-                skill_list = [s.strip() for s in manual_skills.split(",") if s.strip()]
-                interest_list = [s.strip() for s in interests.split(",") if s.strip()]
+                with request_trace("manual_strategy"):
+                    skill_list = [s.strip() for s in manual_skills.split(",") if s.strip()]
+                    interest_list = [s.strip() for s in interests.split(",") if s.strip()]
                 
-                # Normalize manually entered skills too
-                normalized = normalize_skills(skill_list)
-                norm_skill_list = [s if isinstance(s, str) else s.get('name') for s in normalized]
+                    # Normalize manually entered skills too
+                    normalized = normalize_skills(skill_list)
+                    norm_skill_list = [s if isinstance(s, str) else s.get('name') for s in normalized]
 
-                profile = UserProfile(
-                    name=name,
-                    skills=norm_skill_list,
-                    interests=interest_list,
-                    target_role=target_role,
-                    ambition=ambition,
-                    is_manual=True,
-                    confidence_score=8.5 # High initial confidence for manual entry
-                )
-                st.session_state.user_profile = profile
-                st.session_state.analysis_complete = True
+                    profile = UserProfile(
+                        name=name,
+                        skills=norm_skill_list,
+                        interests=interest_list,
+                        target_role=target_role,
+                        ambition=ambition,
+                        is_manual=True,
+                        confidence_score=8.5 # High initial confidence for manual entry
+                    )
+                    st.session_state.user_profile = profile
+                    st.session_state.analysis_complete = True
                 
-                # Trigger GenAI
-                st.session_state.exploration_data = suggest_exploration(norm_skill_list, interest_list)
-                st.session_state.project_data = generate_projects(norm_skill_list, ambition)
+                    # Trigger GenAI (background jobs; the dashboard polls for results)
+                    submit_job("exploration", skills=norm_skill_list, interests=interest_list)
+                    submit_job("projects", skills=norm_skill_list, ambition=ambition)
             finally:
                 loader.empty()
 
+    if settings.DEBUG:
+        with st.expander("⏱️ Pipeline Metrics"):
+            st.code(export_metrics("prometheus"), language="text")
+
 # --- MAIN DASHBOARD ---
+pending_jobs = sync_jobs()
+
 if st.session_state.analysis_complete and st.session_state.user_profile:
     profile = st.session_state.user_profile
     
@@ -290,7 +337,10 @@ if st.session_state.analysis_complete and st.session_state.user_profile:
         }
         reqs = ROLE_REQUIREMENTS.get(profile.target_role, ["Python"])
         missing = gap_analysis(profile.skills, reqs)
-        st.plotly_chart(render_skill_network(profile.skills, missing), use_container_width=True)
+        # Laid out from the angles this session saw last, so edits barely move the graph
+        angles = skill_network_angles(profile.skills, missing, st.session_state.get("skill_network_angles"))
+        st.session_state.skill_network_angles = angles
+        st.plotly_chart(render_skill_network(profile.skills, missing, angles), use_container_width=True)
 
     # --- TABS: DEEP DIVE ---
     st.markdown("### 🧠 Generative Compass")
@@ -304,7 +354,7 @@ if st.session_state.analysis_complete and st.session_state.user_profile:
     # Resume Heatmap (Conditional)
     if not profile.is_manual:
         with tab_objs[0]:
-            st.markdown(render_resume_heatmap(profile.raw_text, profile.skills), unsafe_allow_html=True)
+            st.markdown(render_resume_heatmap(profile.raw_text, profile.skills, profile.skill_spans), unsafe_allow_html=True)
             
     # Projects & Exploration
     idx_proj = 1 if not profile.is_manual else 0
@@ -313,7 +363,9 @@ if st.session_state.analysis_complete and st.session_state.user_profile:
         
         with col_p1:
             st.markdown("#### 🛠️ Recommended Projects")
-            if st.session_state.project_data:
+            if "projects" in pending_jobs:
+                render_pending_job("projects", "Designing projects")
+            elif st.session_state.project_data:
                 if "error" in st.session_state.project_data:
                     err_msg = st.session_state.project_data['error']
                     st.error(f"Project Logic Failed: {err_msg}")
@@ -328,7 +380,9 @@ if st.session_state.analysis_complete and st.session_state.user_profile:
             
         with col_p2:
             st.markdown("#### 🔭 Nearby Interactions")
-            if st.session_state.exploration_data:
+            if "exploration" in pending_jobs:
+                render_pending_job("exploration", "Scanning nearby interests")
+            elif st.session_state.exploration_data:
                 if "error" in st.session_state.exploration_data:
                     err_msg = st.session_state.exploration_data['error']
                     st.error(f"Explorer Logic Failed: {err_msg}")
@@ -345,10 +399,13 @@ if st.session_state.analysis_complete and st.session_state.user_profile:
     # Roadmap
     idx_map = 2 if not profile.is_manual else 1
     with tab_objs[idx_map]:
-        if st.button("Generate Detailed Month-by-Month Plan"):
-             with st.spinner("Synthesizing..."):
-                roadmap = generate_roadmap(profile.target_role, missing, "10h/week")
-                st.json(roadmap)
+        if "roadmap" in pending_jobs:
+            render_pending_job("roadmap", "Synthesizing roadmap")
+        elif st.button("Generate Detailed Month-by-Month Plan"):
+            submit_job("roadmap", role=profile.target_role, missing_skills=missing, time_commitment="10h/week")
+            st.rerun()
+        if st.session_state.roadmap_data and "roadmap" not in pending_jobs:
+            st.json(st.session_state.roadmap_data)
 
 else:
     # LANDING (No Analysis Yet)
@@ -358,3 +415,20 @@ else:
         <p style="color: #888; font-size: 20px;">The Generative Engine for Professional Strategy</p>
     </div>
     """, unsafe_allow_html=True)
+
+# --- BACKGROUND WARM-UP ---
+# scripts/serve_app.py starts warm-up when the server starts. Under a plain
+# `streamlit run` this is the fallback: it runs at the end of the script, after
+# the page above has been sent, so first paint never waits on model loading.
+@st.cache_resource(show_spinner=False)
+def _start_worker_warmup():
+    return start_background_warmup()
+
+_start_worker_warmup()
+
+# --- JOB POLLING ---
+# Streamlit has no push channel: while generation jobs run, rerun on an interval
+# (the page above is already rendered) until their results land in session state.
+if pending_jobs:
+    time.sleep(settings.JOB_POLL_INTERVAL)
+    st.rerun()
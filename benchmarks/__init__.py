@@ -0,0 +1,2 @@
+# Benchmarks Package
+# Reproducible performance measurements (run as `python -m benchmarks.<name>`).
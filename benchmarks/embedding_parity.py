@@ -0,0 +1,149 @@
+"""
+Embedding Backend Parity Check
+
+Compares a candidate embedding backend (onnx / quantized) against the
+full-precision PyTorch reference on the phrases the extractor actually sees
+for data/demo_profiles.json, plus the canonical ontology:
+
+- cosine similarity between reference and candidate phrase embeddings
+- top-1 ontology match and >= threshold decision agreement
+- extracted skill set per profile
+- encode latency and resident memory growth per backend
+
+Usage:
+    python -m benchmarks.embedding_parity --backend onnx --model-dir models/all-MiniLM-L6-v2
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROFILES_PATH = REPO_ROOT / "data" / "demo_profiles.json"
+
+
+def _rss_mb() -> float:
+    """Current resident set size (Linux /proc), falling back to peak RSS."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def collect_phrases(profiles: List[Dict]) -> Dict[str, List[str]]:
+    """Candidate phrases per profile, exactly as layers 1-2 of the extractor emit them."""
+    from nlp.model_loader import get_spacy_pipeline
+    from nlp.preprocess import clean_text
+    from nlp.skill_extractor import _extract_candidates, _filter_negations
+
+    nlp = get_spacy_pipeline()
+    phrases = {}
+    for p in profiles:
+        doc = nlp(clean_text(p["text"]))
+        cands = _filter_negations(_extract_candidates(doc), doc)
+        phrases[p["id"]] = list(dict.fromkeys(c["text"] for c in cands))
+    return phrases
+
+
+def profile_backend(backend: str, model_dir: str, phrases: List[str], ontology: List[str], repeats: int) -> Dict:
+    from nlp.model_loader import load_embedding_model
+
+    rss_before = _rss_mb()
+    t0 = time.perf_counter()
+    model = load_embedding_model(backend, model_dir)
+    load_s = time.perf_counter() - t0
+    rss_after = _rss_mb()
+
+    onto_emb = model.encode(ontology, normalize_embeddings=True)
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        phrase_emb = model.encode(phrases, normalize_embeddings=True)
+        timings.append(time.perf_counter() - t0)
+
+    return {
+        "backend": backend,
+        "load_s": round(load_s, 2),
+        "rss_growth_mb": round(rss_after - rss_before, 1),
+        "encode_ms_per_phrase": round(statistics.median(timings) * 1000 / max(1, len(phrases)), 3),
+        "phrase_emb": phrase_emb,
+        "onto_emb": onto_emb,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["onnx", "quantized"], required=True)
+    parser.add_argument("--model-dir", help="Local model directory (default: settings / hub id)")
+    parser.add_argument("--threshold", type=float, default=0.75, help="Match threshold used by _semantic_matching")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-cosine", type=float, default=0.99, help="Fail if any phrase falls below this")
+    parser.add_argument("--min-agreement", type=float, default=1.0, help="Fail if match agreement falls below this")
+    args = parser.parse_args(argv)
+
+    import numpy as np
+    from intelligence.ontology import get_canonical_skills
+
+    profiles = json.loads(PROFILES_PATH.read_text(encoding="utf-8"))
+    ontology = get_canonical_skills()
+    per_profile = collect_phrases(profiles)
+    phrases = sorted({ph for lst in per_profile.values() for ph in lst} | set(ontology))
+
+    # Candidate first so its memory growth is not masked by torch already being resident
+    cand = profile_backend(args.backend, args.model_dir, phrases, ontology, args.repeats)
+    ref = profile_backend("torch", args.model_dir, phrases, ontology, args.repeats)
+
+    cosines = np.sum(ref["phrase_emb"] * cand["phrase_emb"], axis=1)
+    ref_sims = ref["phrase_emb"] @ ref["onto_emb"].T
+    cand_sims = cand["phrase_emb"] @ cand["onto_emb"].T
+    ref_top, cand_top = ref_sims.argmax(axis=1), cand_sims.argmax(axis=1)
+    rows = np.arange(len(phrases))
+    ref_hit = ref_sims[rows, ref_top] >= args.threshold
+    cand_hit = cand_sims[rows, cand_top] >= args.threshold
+    # A phrase agrees when both reject it, or both accept it as the same skill
+    agree = (ref_hit == cand_hit) & (~ref_hit | (ref_top == cand_top))
+
+    index = {ph: i for i, ph in enumerate(phrases)}
+    profile_diffs = {}
+    for pid, lst in per_profile.items():
+        ref_skills = {ontology[ref_top[index[ph]]] for ph in lst if ref_hit[index[ph]]}
+        cand_skills = {ontology[cand_top[index[ph]]] for ph in lst if cand_hit[index[ph]]}
+        if ref_skills != cand_skills:
+            profile_diffs[pid] = {"torch": sorted(ref_skills), args.backend: sorted(cand_skills)}
+
+    report = {
+        "phrases": len(phrases),
+        "cosine_min": round(float(cosines.min()), 5),
+        "cosine_mean": round(float(cosines.mean()), 5),
+        "match_agreement": round(float(agree.mean()), 4),
+        "max_confidence_delta": round(float(np.abs(ref_sims[rows, ref_top] - cand_sims[rows, ref_top]).max()), 4),
+        "profile_skill_diffs": profile_diffs,
+        "latency_speedup": round(ref["encode_ms_per_phrase"] / max(cand["encode_ms_per_phrase"], 1e-9), 2),
+    }
+    for r in (ref, cand):
+        report[r["backend"]] = {k: r[k] for k in ("load_s", "rss_growth_mb", "encode_ms_per_phrase")}
+    print(json.dumps(report, indent=2))
+
+    failures = []
+    if report["cosine_min"] < args.min_cosine:
+        failures.append(f"cosine_min {report['cosine_min']} < {args.min_cosine}")
+    if report["match_agreement"] < args.min_agreement:
+        failures.append(f"match_agreement {report['match_agreement']} < {args.min_agreement}")
+    if failures:
+        print("PARITY FAILED: " + "; ".join(failures))
+        return 1
+    print("PARITY OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
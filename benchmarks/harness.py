@@ -0,0 +1,129 @@
+"""
+Benchmark Harness
+
+Shared pieces for the benchmark suite: a synthetic resume generator,
+latency statistics, peak-RSS sampling and baseline comparison.
+"""
+
+import math
+import random
+import resource
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Roughly one page of resume text
+WORDS_PER_PAGE = 450
+
+SECTIONS = ["Experience", "Projects", "Education", "Skills", "Certifications"]
+
+ACTIONS = [
+    "Built", "Designed", "Implemented", "Developed", "Deployed", "Optimized",
+    "Led", "Automated", "Refactored", "Architected", "Maintained", "Scaled",
+]
+OBJECTS = [
+    "REST APIs", "data pipelines", "a billing service", "CI/CD workflows",
+    "an event-driven platform", "internal dashboards", "ML models", "search indexing",
+]
+OUTCOMES = [
+    "reducing latency by {n}%", "serving {n}k daily users", "cutting costs by {n}%",
+    "improving throughput {n}x", "across {n} teams",
+]
+HEDGES = [
+    "Familiar with {skill}.", "Some exposure to {skill} and basic {skill2}.",
+    "Interested in learning {skill}.", "Helped with various {skill} tasks.",
+    "No experience in {skill} yet.",
+]
+
+
+def synthetic_resume(pages: float, skills: Sequence[str], seed: int = 0) -> str:
+    """
+    A resume-shaped document of about `pages` pages: a contact header, section
+    headings, action-verb bullets naming real ontology skills, plus hedged and
+    negated sentences so every pipeline branch does work.
+    """
+    rng = random.Random(seed)
+    target_words = int(pages * WORDS_PER_PAGE)
+    lines = [
+        "Jordan Example",
+        "jordan.example@mail.com | +1 555 123 4567 | https://github.com/jordan-example",
+    ]
+    words = 0
+    while words < target_words:
+        lines.append("")
+        lines.append(rng.choice(SECTIONS))
+        for _ in range(rng.randint(4, 8)):
+            skill, skill2 = rng.choice(skills), rng.choice(skills)
+            if rng.random() < 0.2:
+                line = rng.choice(HEDGES).format(skill=skill, skill2=skill2)
+            else:
+                outcome = rng.choice(OUTCOMES).format(n=rng.randint(2, 90))
+                line = f"- {rng.choice(ACTIONS)} {rng.choice(OBJECTS)} using {skill} and {skill2}, {outcome}."
+            lines.append(line)
+            words += len(line.split())
+    return "\n".join(lines)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_stats(samples_s: Sequence[float], items_per_call: int = 1) -> Dict[str, float]:
+    """p50 / p95 / mean latency in ms and throughput (items per second)."""
+    mean = statistics.fmean(samples_s) if samples_s else 0.0
+    return {
+        "n": len(samples_s),
+        "p50_ms": round(percentile(samples_s, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples_s, 95) * 1000, 3),
+        "mean_ms": round(mean * 1000, 3),
+        "throughput_per_s": round(items_per_call / mean, 2) if mean else 0.0,
+    }
+
+
+def measure(
+    fn: Callable[[], Any],
+    repeats: int,
+    warmup: int = 1,
+    items_per_call: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Dict[str, float]:
+    """Time `fn` `repeats` times after `warmup` untimed calls; `setup` runs untimed before each timed call."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return latency_stats(samples, items_per_call)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (ru_maxrss is KiB on Linux)."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def compare(
+    report: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    rss_tolerance: Optional[float] = None,
+) -> List[str]:
+    """Regressions: a case's p50/p95 (or peak RSS) above baseline * (1 + tolerance)."""
+    rss_tolerance = tolerance if rss_tolerance is None else rss_tolerance
+    problems = []
+    for case, cur in report.items():
+        base = baseline.get(case)
+        if not isinstance(base, dict):
+            continue
+        for metric, tol in (("p50_ms", tolerance), ("p95_ms", tolerance), ("peak_rss_mb", rss_tolerance)):
+            if metric in cur and base.get(metric) and cur[metric] > base[metric] * (1 + tol):
+                problems.append(f"{case}: {metric} {cur[metric]} vs baseline {base[metric]}")
+    return problems
@@ -0,0 +1,71 @@
+"""
+Heatmap Annotation Benchmark
+
+Times `render_resume_heatmap` (render cache bypassed) on synthetic resumes
+of increasing length (benchmarks.harness) against the previous per-pattern
+`re.sub` implementation, and reports how many words were highlighted.
+
+Usage:
+    python -m benchmarks.heatmap                  # 1, 5, 20 page resumes
+    python -m benchmarks.heatmap --pages 50 --skills 200
+"""
+
+import argparse
+import json
+import re
+import sys
+from typing import Dict, List
+
+from benchmarks.harness import measure, synthetic_resume
+from visualization.heatmap import FLUFF_WORDS, POWER_WORDS, render_resume_heatmap
+
+
+def legacy_render(text: str, detected_skills: List[str]) -> str:
+    """The pre-annotator implementation: one compiled regex and `sub` per pattern."""
+    annotated = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    for skill in detected_skills:
+        pattern = re.compile(re.escape(skill), re.IGNORECASE)
+        annotated = pattern.sub(f'<span class="skill">{skill}</span>', annotated)
+    for word in POWER_WORDS:
+        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+        annotated = pattern.sub(f'<span class="power">{word}</span>', annotated)
+    for word in FLUFF_WORDS:
+        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+        annotated = pattern.sub(f'<span class="fluff">{word}</span>', annotated)
+    return annotated
+
+
+def run(pages_list: List[float], n_skills: int, repeats: int) -> Dict[str, Dict]:
+    from intelligence.ontology import get_canonical_skills
+
+    render = render_resume_heatmap.__wrapped__  # bypass the render cache
+    skills = get_canonical_skills()[:n_skills]
+    report = {}
+    for pages in pages_list:
+        text = synthetic_resume(pages, skills, seed=int(pages * 10))
+        html = render(text, skills)
+        new = measure(lambda: render(text, skills), repeats)
+        old = measure(lambda: legacy_render(text, skills), repeats)
+        report[f"{pages}_pages"] = {
+            "chars": len(text),
+            "highlights": html.count("<span "),
+            "annotator": new,
+            "legacy": old,
+            "speedup": round(old["p50_ms"] / max(new["p50_ms"], 1e-6), 1),
+        }
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=float, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--skills", type=int, default=50, help="Number of detected skills to highlight")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.pages, args.skills, args.repeats), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
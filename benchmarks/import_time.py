@@ -0,0 +1,128 @@
+"""
+Cold-Start Import Benchmark
+
+Measures, in fresh interpreters, how long the modules app.py imports take
+to load and which heavy third-party packages they drag in eagerly.
+
+Usage:
+    python -m benchmarks.import_time                      # print report
+    python -m benchmarks.import_time --save baseline.json # record baseline
+    python -m benchmarks.import_time --baseline baseline.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Everything app.py imports at module level (landing-page critical path)
+APP_IMPORTS = [
+    "config",
+    "utils.logging_config",
+    "utils.loaders",
+    "utils.models",
+    "utils.tracing",
+    "utils.warmup",
+    "nlp.nlp_engine",
+    "intelligence.ontology",
+    "intelligence.role_matcher",
+    "intelligence.gap_analysis",
+    "analytics.vector_analytics",
+    "visualization.radar_chart",
+    "visualization.network_graph",
+    "visualization.heatmap",
+    "ai_core.synthesis",
+    "ai_core.explorer",
+]
+
+# Packages that must NOT be imported just to render the landing page
+HEAVY_PACKAGES = [
+    "spacy", "torch", "sentence_transformers", "sklearn", "pdfplumber",
+    "PyPDF2", "docx", "networkx", "plotly", "textstat",
+]
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"seconds": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(modules: List[str], repeats: int) -> Dict:
+    """Import `modules` in `repeats` fresh interpreters; return median time and heavy deps."""
+    env = dict(os.environ)
+    env.setdefault("GEMINI_API_KEY", "benchmark-placeholder")
+    code = _PROBE.format(modules=modules, heavy=HEAVY_PACKAGES)
+    timings, heavy = [], []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+            capture_output=True, text=True, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        heavy = result["heavy"]
+    return {"median_s": round(statistics.median(timings), 4), "heavy": heavy}
+
+
+def run(repeats: int) -> Dict[str, Dict]:
+    report = {"app_cold_start": measure(APP_IMPORTS, repeats)}
+    for mod in APP_IMPORTS:
+        report[mod] = measure([mod], repeats)
+    return report
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Return regressions: slower than baseline*(1+tolerance) or newly-eager heavy deps."""
+    problems = []
+    for key, cur in report.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        if cur["median_s"] > base["median_s"] * (1 + tolerance):
+            problems.append(f"{key}: {cur['median_s']}s vs baseline {base['median_s']}s")
+        new_heavy = sorted(set(cur["heavy"]) - set(base["heavy"]))
+        if new_heavy:
+            problems.append(f"{key}: now eagerly imports {', '.join(new_heavy)}")
+    return problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--save", type=Path, help="Write report as a new baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown ratio")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeats)
+    for key, cur in report.items():
+        heavy = ", ".join(cur["heavy"]) or "-"
+        print(f"{key:32s} {cur['median_s'] * 1000:8.1f} ms   heavy: {heavy}")
+
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2))
+        print(f"\nBaseline written to {args.save}")
+
+    if args.baseline:
+        problems = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        if problems:
+            print("\nREGRESSIONS:")
+            for p in problems:
+                print(f"  - {p}")
+            return 1
+        print("\nNo cold-start regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Pipeline Benchmark Suite
+
+Reproducible timings for the NLP and intelligence hot paths on synthetic
+resumes of 0.5-20 pages:
+
+- analyze_text, end to end and per stage (from request-trace spans)
+- _semantic_matching on the candidates each resume produces
+- normalize_skills with the local LLM stub (ontology hits and LLM misses)
+- calculate_role_fit over role catalogs of increasing size
+- PDF parsing (synthetic PDFs rendered with fpdf)
+- heatmap rendering (render cache bypassed)
+
+analyze_text and _semantic_matching run cold (sentence and phrase-embedding
+caches cleared before every timed call, as for a resume never seen before)
+under the plain case name, and warm (the same resume again, all cache hits)
+as `<case>[warm]`.
+
+Every case reports p50/p95/mean latency, throughput and the process's peak
+RSS so far. Save a baseline and compare later runs against it:
+
+Usage:
+    python -m benchmarks.pipeline --save bench_baseline.json
+    python -m benchmarks.pipeline --baseline bench_baseline.json --tolerance 0.25
+    python -m benchmarks.pipeline --quick --only analyze_text heatmap
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.harness import compare, latency_stats, measure, peak_rss_mb, synthetic_resume
+
+PAGE_SIZES = [0.5, 1, 2, 5, 10, 20]
+QUICK_PAGE_SIZES = [0.5, 2, 10]
+CATALOG_SIZES = [10, 100, 1000]
+
+
+def bench_analyze_text(pages_list: List[float], skills: List[str], repeats: int) -> Dict[str, Dict]:
+    from nlp.nlp_engine import analyze_text, clear_analysis_caches
+    from utils.tracing import request_trace
+
+    report = {}
+    for pages in pages_list:
+        text = synthetic_resume(pages, skills, seed=int(pages * 10))
+        analyze_text(text, skills)  # warm-up: model loading and ontology embeddings
+        for suffix, cold in (("", True), ("[warm]", False)):
+            totals, stages = [], defaultdict(list)
+            for _ in range(repeats):
+                if cold:
+                    clear_analysis_caches()
+                with request_trace("benchmark") as trace:
+                    analyze_text(text, skills)
+                totals.append(trace.summary()["duration_ms"] / 1000)
+                for s in trace.spans:
+                    if s["depth"] == 1:
+                        stages[s["stage"]].append(s["duration_ms"] / 1000)
+            case = f"analyze_text[{pages}p]{suffix}"
+            report[case] = {**latency_stats(totals), "chars": len(text), "peak_rss_mb": peak_rss_mb()}
+            for stage, samples in stages.items():
+                report[f"{case}.{stage}"] = latency_stats(samples)
+    return report
+
+
+def bench_semantic_matching(pages_list: List[float], skills: List[str], repeats: int) -> Dict[str, Dict]:
+    from nlp.model_loader import get_spacy_pipeline
+    from nlp.preprocess import clean_text
+    from nlp.skill_extractor import PHRASE_EMBEDDINGS, _extract_candidates, _filter_negations, _semantic_matching
+
+    nlp = get_spacy_pipeline()
+    report = {}
+    for pages in pages_list:
+        doc = nlp(clean_text(synthetic_resume(pages, skills, seed=int(pages * 10))))
+        candidates = _filter_negations(_extract_candidates(doc), doc)
+
+        def match():
+            return _semantic_matching(candidates, skills)
+
+        cold = measure(match, repeats, items_per_call=len(candidates), setup=PHRASE_EMBEDDINGS.clear)
+        warm = measure(match, repeats, items_per_call=len(candidates))
+        report[f"semantic_matching[{pages}p]"] = {**cold, "candidates": len(candidates), "peak_rss_mb": peak_rss_mb()}
+        report[f"semantic_matching[{pages}p][warm]"] = {**warm, "candidates": len(candidates)}
+    return report
+
+
+def bench_normalize(skills: List[str], repeats: int) -> Dict[str, Dict]:
+    from config import settings
+    from intelligence import ontology
+
+    settings.LLM_STUB = True  # never spend real LLM calls in a benchmark
+    known = list(ontology.ONTOLOGY)[:50]
+    unknown = [f"internal framework {i}" for i in range(10)]
+    mixed = known + unknown
+
+    def uncached():
+        ontology.SESSION_CACHE.clear()
+        ontology.normalize_skills(mixed)
+
+    return {
+        "normalize_skills[ontology_hits]": measure(lambda: ontology.normalize_skills(known), repeats, items_per_call=len(known)),
+        "normalize_skills[llm_stub_misses]": {**measure(uncached, repeats, items_per_call=len(mixed)), "peak_rss_mb": peak_rss_mb()},
+    }
+
+
+def bench_role_fit(catalog_sizes: List[int], skills: List[str], repeats: int) -> Dict[str, Dict]:
+    from intelligence import role_matcher
+
+    base_roles = list(role_matcher.LOCAL_ROLES.items())
+    profile = skills[:25]
+    report = {}
+    original = role_matcher.LOCAL_ROLES
+    try:
+        for size in catalog_sizes:
+            catalog = {f"{name} #{i}": baseline for i in range(size // len(base_roles) + 1)
+                       for name, baseline in base_roles}
+            catalog = dict(list(catalog.items())[:size])
+            role_matcher.LOCAL_ROLES = catalog
+
+            def score_catalog():
+                for role in catalog:
+                    role_matcher.calculate_role_fit(profile, role, 7.0)
+
+            report[f"role_fit[{size}_roles]"] = {**measure(score_catalog, repeats, items_per_call=size), "peak_rss_mb": peak_rss_mb()}
+    finally:
+        role_matcher.LOCAL_ROLES = original
+    return report
+
+
+def _render_pdf(text: str) -> bytes:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_auto_page_break(True, margin=15)
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    for line in text.splitlines():
+        pdf.multi_cell(0, 5, line.encode("latin-1", "replace").decode("latin-1") or " ")
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def bench_pdf(pages_list: List[float], skills: List[str], repeats: int) -> Dict[str, Dict]:
+    try:
+        import fpdf  # noqa: F401
+    except ImportError:
+        logging.getLogger(__name__).warning("fpdf not installed; skipping PDF parsing benchmark")
+        return {}
+    from utils.loaders import parse_pdf
+
+    report = {}
+    for pages in pages_list:
+        data = _render_pdf(synthetic_resume(pages, skills, seed=int(pages * 10)))
+        stats = measure(lambda: parse_pdf(data), repeats)
+        report[f"parse_pdf[{pages}p]"] = {**stats, "bytes": len(data), "peak_rss_mb": peak_rss_mb()}
+    return report
+
+
+def bench_heatmap(pages_list: List[float], skills: List[str], repeats: int) -> Dict[str, Dict]:
+    from visualization.heatmap import render_resume_heatmap
+
+    render = render_resume_heatmap.__wrapped__  # bypass the render cache
+    detected = skills[:40]
+    report = {}
+    for pages in pages_list:
+        text = synthetic_resume(pages, skills, seed=int(pages * 10))
+        report[f"heatmap[{pages}p]"] = {**measure(lambda: render(text, detected), repeats), "peak_rss_mb": peak_rss_mb()}
+    return report
+
+
+CASES: Dict[str, Callable[..., Dict[str, Dict]]] = {
+    "analyze_text": lambda a, s: bench_analyze_text(a.pages, s, a.repeats),
+    "semantic_matching": lambda a, s: bench_semantic_matching(a.pages, s, a.repeats),
+    "normalize": lambda a, s: bench_normalize(s, a.repeats),
+    "role_fit": lambda a, s: bench_role_fit(a.catalogs, s, a.repeats),
+    "pdf": lambda a, s: bench_pdf(a.pages, s, a.repeats),
+    "heatmap": lambda a, s: bench_heatmap(a.pages, s, a.repeats),
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=list(CASES), help="Run only these case groups")
+    parser.add_argument("--pages", type=float, nargs="+", default=PAGE_SIZES)
+    parser.add_argument("--catalogs", type=int, nargs="+", default=CATALOG_SIZES)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--quick", action="store_true", help="Fewer sizes and repeats (CI smoke run)")
+    parser.add_argument("--save", type=Path, help="Write report as a new baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed latency slowdown ratio")
+    parser.add_argument("--rss-tolerance", type=float, default=0.15, help="Allowed peak-RSS growth ratio")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.pages, args.catalogs, args.repeats = QUICK_PAGE_SIZES, CATALOG_SIZES[:2], 3
+
+    # The first app import runs setup_logging(), which sets INFO; lower the level only after it
+    from intelligence.ontology import get_canonical_skills
+    # Per-request trace logs would dominate the output
+    logging.getLogger("career_nlp").setLevel(logging.WARNING)
+    skills = get_canonical_skills()
+
+    report: Dict[str, Any] = {}
+    for name in args.only or CASES:
+        print(f"running {name}...", file=sys.stderr)
+        report.update(CASES[name](args, skills))
+
+    for case, stats in report.items():
+        print(f"{case:42s} p50 {stats['p50_ms']:10.2f} ms   p95 {stats['p95_ms']:10.2f} ms   "
+              f"{stats['throughput_per_s']:10.1f}/s" + (f"   rss {stats['peak_rss_mb']} MB" if "peak_rss_mb" in stats else ""))
+
+    if args.save:
+        meta = {"python": platform.python_version(), "machine": platform.machine(), "repeats": args.repeats}
+        args.save.write_text(json.dumps({"_meta": meta, **report}, indent=2))
+        print(f"\nBaseline written to {args.save}")
+
+    if args.baseline:
+        problems = compare(report, json.loads(args.baseline.read_text()), args.tolerance, args.rss_tolerance)
+        if problems:
+            print("\nREGRESSIONS:")
+            for p in problems:
+                print(f"  - {p}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,13 +16,85 @@ class Settings(BaseSettings):
     SCHEMA_DIR: Path = Field(default_factory=lambda: Path(__file__).resolve().parent / "schemas")
     LOG_DIR: Path = Field(default_factory=lambda: Path(__file__).resolve().parent / "logs")
 
+    # Logging
+    LOG_ASYNC: bool = True              # Queue records; write from a background thread
+    LOG_FORMAT: str = "text"            # "text" | "json" (one JSON object per line)
+    LOG_ROTATION: str = "size"          # "size" | "time"
+    LOG_MAX_BYTES: int = 5 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 5
+    LOG_ROTATE_WHEN: str = "midnight"   # TimedRotatingFileHandler interval when LOG_ROTATION="time"
+
+    # Embedding Model (skill matching)
+    EMBEDDING_BACKEND: str = "torch"                        # "torch" | "onnx" | "quantized" (int8 dynamic)
+    EMBEDDING_MODEL_DIR: Optional[Path] = None              # Local model directory; hub id when unset
+    EMBEDDING_ONNX_FILE: str = "onnx/model.onnx"            # Relative to model dir; e.g. onnx/model_quint8_avx2.onnx for int8
+    SKILL_MATCH_THRESHOLD: float = 0.75                     # Min cosine similarity for a candidate to match a skill
+
+    # Incremental re-analysis: per-sentence results and phrase embeddings keyed by content
+    SENTENCE_CACHE_MAX_ENTRIES: int = 50_000
+    PHRASE_EMBEDDING_CACHE_MAX_ENTRIES: int = 100_000
+
+    # Upload Limits
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024            # Larger uploads are rejected
+    UPLOAD_SPOOL_THRESHOLD: int = 2 * 1024 * 1024       # Larger uploads spool to a temp file (memory-mapped)
+    EXTRACT_MAX_CHARS: int = 100_000                    # Extracted text is truncated to this length
+    DOCX_MAX_UNCOMPRESSED_BYTES: int = 50 * 1024 * 1024
+    DOCX_MAX_COMPRESSION_RATIO: int = 100
+    DOCX_MAX_ENTRIES: int = 1000
+
+    # Extracted-text cache (keyed by SHA-256 of the uploaded file)
+    TEXT_CACHE_MAX_ENTRIES: int = 128
+    TEXT_CACHE_MAX_CHARS: int = 20_000_000
+
+    # Memoized chart / HTML renders (serialized payload bytes)
+    RENDER_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # PDF Extraction
+    PDF_MAX_PAGES: int = 30             # Pages beyond this are ignored
+    PDF_PAGE_TIMEOUT: float = 10.0      # Seconds to wait for one page before falling back / skipping
+    PDF_WORKERS: int = 4                # Shared page-extraction thread pool size
+    # Fast text-layer pages below these quality bars escalate to pdfplumber layout analysis
+    PDF_FAST_MIN_CHARS: int = 200
+    PDF_FAST_MIN_WORDS: int = 30
+    PDF_FAST_MAX_MEAN_WORD_LEN: float = 12.0
+
+    # Background generation jobs (exploration / projects / roadmap)
+    JOBS_DB_PATH: Path = Field(default_factory=lambda: Path(__file__).resolve().parent / "data" / "jobs.sqlite3")
+    JOB_WORKERS: int = 2
+    JOB_RETENTION_S: float = 7 * 24 * 3600  # finished jobs older than this are purged
+    JOB_POLL_INTERVAL: float = 1.0          # dashboard re-check interval while jobs run
+
+    # Headless analysis service (service.api)
+    SERVICE_HOST: str = "127.0.0.1"
+    SERVICE_PORT: int = 8080
+    SERVICE_WORKERS: int = 4             # Pipeline threads (CPU-bound NLP runs here)
+    SERVICE_MAX_PENDING: int = 128       # Requests (batch items count singly) queued beyond this get 503
+    SERVICE_MAX_BATCH: int = 100         # Items per batch request
+    SERVICE_MAX_BODY_BYTES: int = 16 * 1024 * 1024
+
+    # Worker warm-up: file written once models are loaded (for process-manager readiness checks)
+    WARMUP_READY_FILE: Optional[Path] = None
+
     # LLM Configuration
     LLM_MODEL: str = Field(default="gemini-3-flash-preview", env="LLM_MODEL")
-    GEMINI_API_KEY: str = Field(..., env="GEMINI_API_KEY") # Required field
+    GEMINI_API_KEY: Optional[str] = Field(default=None, env="GEMINI_API_KEY")  # Needed by the "gemini" / "record" backends only
+    LLM_BACKEND: str = "gemini"        # "gemini" | "stub" | "record" | "replay" (utils.llm_backends)
+    LLM_STUB: bool = False             # Shorthand for LLM_BACKEND="stub"
+    LLM_STUB_LATENCY_S: float = 0.0    # Simulated per-call latency for the stub
+    LLM_REPLAY_DIR: Path = Field(default_factory=lambda: Path(__file__).resolve().parent / "data" / "llm_replay")
+    LLM_REPLAY_ON_MISS: str = "error"  # Replay miss: "error" | "stub"
+    # Fault injection in front of any backend (load tests)
+    LLM_INJECT_LATENCY_S: float = 0.0
+    LLM_INJECT_JITTER_S: float = 0.0        # Extra uniform random latency, 0..JITTER
+    LLM_INJECT_FAILURE_RATE: float = 0.0    # Fraction of calls failing with a transient error
+    LLM_INJECT_QUOTA_RATE: float = 0.0      # Fraction of calls failing with a 429 (exercises key rotation)
+    LLM_INJECT_SEED: Optional[int] = None   # Fixed seed -> reproducible fault sequence
 
-    # Privacy / Regex Patterns
+    # Privacy / Regex Patterns (combined into one scanner by nlp.pii)
     REDACT_PATTERN: str = r'[\w\.-]+@[\w\.-]+'
-    PHONE_PATTERN: str = r'\d[\d -]{8,12}\d'
+    PHONE_PATTERN: str = r'\+?\d[\d -]{8,12}\d'           # Detection (ATS contact check, cleaning)
+    REDACT_PHONE_PATTERN: str = r'\+?\d[\d\-\s]{7,}\d'     # Redaction: any length, hyphens, line breaks
+    URL_PATTERN: str = r'(?:https?://|www\.)\S+'
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -2,7 +2,9 @@ import json
 from typing import List, Dict, Union, Any, Optional
 # from llm.gemini_client import call_llm_with_schema (Moved to function scope)
 from config import settings
+from nlp.records import Record
 from utils.logging_config import logger
+from utils.tracing import traced
 
 # Load Canonical Ontology
 DATA_PATH = settings.DATA_DIR / "skill_ontology.json"
@@ -21,6 +23,13 @@ SESSION_CACHE: Dict[str, str] = {}
 
 SCHEMA_PATH = settings.SCHEMA_DIR / "normalization.schema.json"
 
+def get_canonical_skills() -> List[str]:
+    """
+    Canonical skill names (ontology values), sorted and de-duplicated.
+    This is the keyword list semantic extraction matches against.
+    """
+    return sorted(set(ONTOLOGY.values()))
+
 def normalize_skill_hybrid(raw_skill: str) -> str:
     """
     Hybrid normalization: Tier 1 (Lookup), Tier 2 (Cache), Tier 3 (LLM Client)
@@ -57,9 +66,10 @@ def normalize_skill_hybrid(raw_skill: str) -> str:
         # Fallback
         return raw_skill.title()
 
+@traced("normalization")
 def normalize_skills(raw_skills_input: Union[List[str], List[Dict[str, Any]]]) -> List[Any]:
     """
-    Normalizes a list of skills (strings or dicts).
+    Normalizes a list of skills (strings, dicts or nlp.records.Skill records).
     """
     if not raw_skills_input:
         return []
@@ -74,14 +84,14 @@ def normalize_skills(raw_skills_input: Union[List[str], List[Dict[str, Any]]]) -
                 normalized_set.add(norm)
         return list(normalized_set)
         
-    elif isinstance(first_item, dict):
+    elif isinstance(first_item, (dict, Record)):
         normalized_map = {}
         for item in raw_skills_input: # type: ignore
-             if isinstance(item, dict):
+             if isinstance(item, (dict, Record)):
                 raw_name = item.get("skill", item.get("name", ""))
                 norm_name = normalize_skill_hybrid(raw_name)
                 if norm_name not in normalized_map:
-                    new_item = item.copy()
+                    new_item = dict(item)
                     new_item["name"] = norm_name
                     normalized_map[norm_name] = new_item
         return list(normalized_map.values())
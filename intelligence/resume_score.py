@@ -1,22 +1,23 @@
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional
+
+from nlp.sentence_features import FeatureTable
 
 # Minimal heuristic scoring for MVP
 WEIGHT_SKILL = 0.5
 WEIGHT_IMPACT = 0.3
 WEIGHT_CLARITY = 0.2
 
-IMPACT_KEYWORDS = ["improved", "reduced", "increased", "%", "by", "from", "to", "resulted"]
-METRIC_RE = re.compile(r'\b\d+%|\b\d+\s+(?:hours|days|users|clients|transactions)\b', re.I)
-
-def score_resume_text(text: str, detected_skills: List[str], readability_score: float) -> Dict:
+def score_resume_text(text: str, detected_skills: List[str], readability_score: float, features: Optional[FeatureTable] = None) -> Dict:
     """
     Returns score (0-100), breakdown, and suggestions.
+    `features` (nlp.sentence_features) is reused when the caller already has it.
     """
+    features = features if features is not None else FeatureTable.from_text(text)
+
     # 8 skills -> full marks
     skill_score = min(len(set(detected_skills)) / 8.0, 1.0)  
     
-    impact_count = len(METRIC_RE.findall(text)) + sum(1 for k in IMPACT_KEYWORDS if k in text.lower())
+    impact_count = int(features.metrics.sum()) + features.impact_keywords_present()
     impact_score = min(impact_count / 4.0, 1.0)
     
     # Heuristic: lower grade -> simpler/better clarity
@@ -31,17 +32,18 @@ def score_resume_text(text: str, detected_skills: List[str], readability_score:
             "impact_score": round(impact_score * 100, 1),
             "clarity_score": round(clarity_score * 100, 1)
         },
-        "tips": generate_tips(text, detected_skills)
+        "tips": generate_tips(text, detected_skills, features)
     }
 
-def generate_tips(text: str, detected_skills: List[str]):
+def generate_tips(text: str, detected_skills: List[str], features: Optional[FeatureTable] = None):
+    features = features if features is not None else FeatureTable.from_text(text)
     tips = []
     # Tip: add metrics if none
-    if len(METRIC_RE.findall(text)) == 0:
+    if not features.metrics.any():
         tips.append("Add measurable outcomes (numbers, percentages) for your major bullets.")
     
     # Tip: tense and action verbs
-    if "responsible for" in text.lower():
+    if features.responsible_for.any():
         tips.append("Prefer active bullets using strong verbs (e.g., 'Built', 'Improved', 'Reduced').")
     
     # Tip: skill coverage
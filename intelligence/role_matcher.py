@@ -11,6 +11,7 @@ from typing import Dict, List, Any
 from intelligence.sanity import sanity_check_role_baseline
 from config import settings
 from utils.logging_config import logger
+from utils.tracing import traced
 
 # Load local cache
 try:
@@ -79,6 +80,7 @@ def generate_dynamic_baseline(role: str) -> Dict[str, Any]:
         }
 
 
+@traced("role_fit")
 def calculate_role_fit(user_skills: List[str], target_role: str, confidence_score: float) -> Dict[str, Any]:
     """
     Compute role fit with full score decomposition.
@@ -1,47 +1,139 @@
-import re
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
-HEDGING_WORDS = ["maybe","kind of","somewhat","a bit","possibly","helped","assisted","familiar with"]
-PASSIVE_PATTERN = re.compile(r"\b(was|were|is|are|been|being)\b\s+\w+ed\b", re.I)
-NUMERIC_RE = re.compile(r'\b\d+%?|\b\d+\s+(?:hours|days|users|clients|transactions|months|years)\b', re.I)
-STRONG_VERBS = ["built","led","improved","developed","reduced","increased","implemented","designed","deployed","optimized"]
+from nlp.sentence_cache import LRUCache
+from nlp.sentence_features import FeatureTable, keyword_matcher, normalize_keywords
 
-def score_sentence_strength(sent: str, detected_skills: List[str], top_role_skills: List[str]=None) -> Dict:
-    sent_low = sent.lower()
-    score = 1.0
-    reasons = []
-
-    # numeric evidence
-    if not NUMERIC_RE.search(sent):
-        score -= 0.35
-        reasons.append("no measurable result")
-
-    # hedging / weak language
-    if any(w in sent_low for w in HEDGING_WORDS):
-        score -= 0.2
-        reasons.append("hedging / weak phrasing")
-
-    # passive voice
-    if PASSIVE_PATTERN.search(sent):
-        score -= 0.15
-        reasons.append("passive voice")
-
-    # strong verb check
-    if not any(v in sent_low for v in STRONG_VERBS):
-        score -= 0.1
-        reasons.append("no strong action verb")
-
-    # if role skills provided, check if sentence includes any top_role_skills
+# Penalties from a perfect 1.0; the verb, hedging, passive and metric signals come from nlp.sentence_features
+NO_METRIC_PENALTY = 0.35
+HEDGING_PENALTY = 0.2
+PASSIVE_PENALTY = 0.15
+NO_VERB_PENALTY = 0.1
+NO_ROLE_KEYWORD_PENALTY = 0.15
+ROLE_KEYWORD_BONUS, ROLE_KEYWORD_BONUS_CAP = 0.02, 0.08
+
+# Severity (0-100) from which a sentence counts as weak in the report
+WEAK_SEVERITY = 50
+
+REASONS = (
+    ("no_metric", "no measurable result"),
+    ("hedged", "hedging / weak phrasing"),
+    ("passive", "passive voice"),
+    ("no_verb", "no strong action verb"),
+    ("no_role", "missing role-relevant keywords"),
+)
+
+# Role -> normalized keyword tuple, bounded like keyword_matcher's cache of the compiled matchers
+_ROLE_KEYWORDS = LRUCache(256, "role_keywords_lookups_total")
+
+
+def _score_columns(features: FeatureTable, top_role_skills: Optional[List[str]] = None):
+    """Score, severity and one boolean column per weakness reason."""
+    import numpy as np
+
+    flags = {
+        "no_metric": features.numbers == 0,
+        "hedged": features.hedge_count > 0,
+        "passive": features.passive,
+        "no_verb": features.action_verbs == 0,
+        "no_role": np.zeros(len(features), dtype=bool),
+    }
+    score = (1.0 - NO_METRIC_PENALTY * flags["no_metric"] - HEDGING_PENALTY * flags["hedged"]
+             - PASSIVE_PENALTY * flags["passive"] - NO_VERB_PENALTY * flags["no_verb"])
+
+    # if role skills provided, check if sentences include any top_role_skills
     if top_role_skills:
-        overlap = sum(1 for s in top_role_skills if s.lower() in sent_low)
-        if overlap == 0:
-            score -= 0.15
-            reasons.append("missing role-relevant keywords")
-        else:
-            # reward small boost for relevance
-            score += min(0.08, 0.02 * overlap)
+        hits = features.role_hits(top_role_skills)
+        flags["no_role"] = hits == 0
+        # reward small boost for relevance
+        score = score + np.where(flags["no_role"], -NO_ROLE_KEYWORD_PENALTY, np.minimum(ROLE_KEYWORD_BONUS_CAP, ROLE_KEYWORD_BONUS * hits))
 
     # clamp
-    score = max(0.0, min(1.0, score))
-    severity = int((1.0 - score) * 100)  # 0=good, 100=very weak
-    return {"sentence": sent, "score": score, "severity": severity, "reasons": reasons}
+    score = np.clip(score, 0.0, 1.0)
+    severity = ((1.0 - score) * 100).astype(int)  # 0=good, 100=very weak
+    return score, severity, flags
+
+
+def _row(features: FeatureTable, i: int, score, severity, flags) -> Dict:
+    return {
+        "sentence": features.sentences[i],
+        "score": float(score[i]),
+        "severity": int(severity[i]),
+        "reasons": [label for name, label in REASONS if flags[name][i]],
+    }
+
+
+def score_sentences(features: FeatureTable, top_role_skills: Optional[List[str]] = None) -> List[Dict]:
+    """Strength of every sentence in `features`, computed column-wise."""
+    score, severity, flags = _score_columns(features, top_role_skills)
+    return [_row(features, i, score, severity, flags) for i in range(len(features))]
+
+
+def score_sentence_strength(sent: str, detected_skills: List[str], top_role_skills: List[str]=None) -> Dict:
+    return score_sentences(FeatureTable.from_sentences([sent]), top_role_skills)[0]
+
+
+def role_keywords(role: str) -> Tuple[str, ...]:
+    """
+    Skill keywords of a role baseline (core, secondary, optional), normalized
+    for nlp.sentence_features.keyword_matcher. Cached per role, except for the
+    generic fallback baseline so a failed LLM generation is retried next time.
+    """
+    cached = _ROLE_KEYWORDS.get(role)
+    if cached is not None:
+        return cached
+
+    from intelligence.role_matcher import get_role_baseline
+
+    baseline = get_role_baseline(role)
+    skills = [
+        *baseline.get("core_skills", []), *baseline.get("secondary_skills", []),
+        *baseline.get("optional_skills", []), *baseline.get("weights", {}),
+    ]
+    keywords = normalize_keywords(skills)
+    keyword_matcher(keywords)  # compile now, reused by every later report for this role
+    if baseline.get("source") != "fallback":
+        _ROLE_KEYWORDS.put(role, keywords)
+    return keywords
+
+
+def weakness_report(
+    text: str = "",
+    role: Optional[str] = None,
+    top_role_skills: Optional[List[str]] = None,
+    features: Optional[FeatureTable] = None,
+    limit: int = 10,
+) -> Dict:
+    """
+    Scores every sentence of a resume in one pass and ranks the weakest.
+
+    Args:
+        text: Resume text, split into sentence units when `features` is not given
+        role: Target role whose baseline skills are the role keywords
+        top_role_skills: Explicit role keywords (takes precedence over `role`)
+        features: Precomputed FeatureTable (e.g. DocumentAnalysis.feature_table())
+        limit: Number of weakest sentences to return
+
+    Returns:
+        Dict: Sentence count, mean score, weak count, reason totals and the
+        `limit` weakest sentences (severity descending, document order on ties).
+    """
+    import numpy as np
+
+    if features is None:
+        features = FeatureTable.from_text(text)
+    if top_role_skills is None and role:
+        top_role_skills = list(role_keywords(role))
+
+    score, severity, flags = _score_columns(features, top_role_skills)
+    # Stable sort: equally weak sentences keep document order
+    ranked = np.argsort(-severity, kind="stable")[:max(limit, 0)].tolist()
+    weakest = [{"index": i, **_row(features, i, score, severity, flags)} for i in ranked]
+
+    return {
+        "role": role,
+        "sentences": len(features),
+        "mean_score": round(float(score.mean()), 3) if len(features) else None,
+        "weak_sentences": int((severity >= WEAK_SEVERITY).sum()),
+        "reasons": {label: int(flags[name].sum()) for name, label in REASONS if flags[name].any()},
+        "weakest": weakest,
+    }
@@ -1,9 +1,24 @@
 import re
+from typing import Optional
 
-def calculate_ats_score(text: str) -> dict:
+from nlp.pii import PIIScan, scan_pii
+
+SPECIAL_CHAR_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# Above this share of non-alphanumeric characters, extracted text is likely garbled
+MAX_SPECIAL_CHAR_RATIO = 0.15
+
+def special_char_ratio(text: str) -> float:
+    """Share of characters that are neither alphanumeric nor whitespace."""
+    if not text:
+        return 0.0
+    return len(SPECIAL_CHAR_RE.findall(text)) / len(text)
+
+def calculate_ats_score(text: str, pii: Optional[PIIScan] = None) -> dict:
     """
     Analyzes text for ATS (Applicant Tracking System) parsability errors.
     Returns a score (0-100) and a list of issues.
+    Pass `pii` (a scan of `text`) to reuse contact-info spans already found.
     """
     if not text:
         return {"score": 0, "issues": ["No text provided"]}
@@ -16,11 +31,7 @@ def calculate_ats_score(text: str) -> dict:
     # We look for extreme density or lack thereof.
     # Actually, a common issue is too many special characters vs text.
     
-    char_count = len(text)
-    special_chars = len(re.findall(r'[^a-zA-Z0-9\s]', text))
-    special_char_ratio = special_chars / char_count if char_count > 0 else 0
-    
-    if special_char_ratio > 0.15: # Arbitrary threshold for "messy" text
+    if special_char_ratio(text) > MAX_SPECIAL_CHAR_RATIO: # Arbitrary threshold for "messy" text
         score -= 20
         issues.append("High density of special characters (Formatting issues?)")
         
@@ -36,9 +47,10 @@ def calculate_ats_score(text: str) -> dict:
         issues.append("Sentences are too long (Run-on text)")
         
     # 3. Email/Phone presence (Should be there for a resume, usually)
-    # Using simple regex checks
-    has_email = bool(re.search(r'\S+@\S+', text))
-    has_phone = bool(re.search(r'\d[\d -]{8,12}\d', text))
+    # Taken from the shared PII scan
+    pii = pii or scan_pii(text)
+    has_email = pii.has_email
+    has_phone = pii.has_phone
     
     if not has_email and not has_phone:
         # Not strictly a formatting error, but an ATS warning
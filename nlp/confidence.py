@@ -5,120 +5,136 @@ Sentence-level linguistic classification with weighted scoring.
 Outputs per-sentence trace for full explainability.
 """
 
-import spacy
-from typing import List, Dict, Tuple
-import re
+from collections.abc import Sequence
+from typing import List, Dict, Optional
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    import en_core_web_sm
-    nlp = en_core_web_sm.load()
+from nlp.records import TraceRow
+from nlp.sentence_cache import DocumentAnalysis, analyze_sentences
+from nlp.sentence_features import FeatureTable
 
-# Action verbs (assertive language)
-ACTION_VERBS = {
-    "built", "designed", "implemented", "developed", "created", "architected",
-    "deployed", "optimized", "led", "managed", "engineered", "achieved",
-    "reduced", "increased", "improved", "delivered", "launched", "scaled"
-}
+# Action verbs, hedging markers and passive voice live in nlp.sentence_features
 
-# Hedging markers (uncertain language)
-HEDGING_MARKERS = {
-    "maybe", "kind of", "somewhat", "a bit", "possibly", "familiar with",
-    "basic", "learning", "trying to", "hoping to", "interested in",
-    "assisted", "helped", "involved in", "exposed to", "some experience"
-}
+# Sentence classes, in code order: score = CLASS_SCORES[code] - PASSIVE_PENALTY * has_passive
+CLASS_LABELS = ("assertive", "neutral", "hedged")
+CLASS_SCORES = (1.5, 0.5, -1.0)
+PASSIVE_PENALTY = 0.3
 
-# Passive voice patterns
-PASSIVE_PATTERN = re.compile(r'\b(was|were|is|are|been|being)\s+\w+ed\b', re.I)
 
+def classify_sentences(actions, hedges, passive):
+    """
+    Vectorized sentence classification.
+    
+    Args:
+        actions, hedges: int arrays of action-verb / hedge-marker counts
+        passive: bool array
+        
+    Returns:
+        (codes, scores): class codes into CLASS_LABELS and per-sentence scores
+    """
+    import numpy as np
+    
+    codes = np.select(
+        [actions >= 2, (actions == 1) & (hedges == 0), hedges > 0],
+        [0, 1, 2],
+        default=1,
+    )
+    scores = np.asarray(CLASS_SCORES)[codes] - PASSIVE_PENALTY * passive
+    return codes, scores
+
+
+class HedgingTrace(Sequence):
+    """
+    Per-sentence trace rows, materialized on first access.
+    
+    Batch scoring that only needs the score never builds the TraceRow records.
+    """
+    
+    __slots__ = ("_features", "_codes", "_scores", "_rows")
+    
+    def __init__(self, features: FeatureTable, codes, scores):
+        self._features = features
+        self._codes = codes
+        self._scores = scores
+        self._rows: Optional[List[TraceRow]] = None
+    
+    def _materialize(self) -> List[TraceRow]:
+        if self._rows is None:
+            f = self._features
+            self._rows = [
+                TraceRow(
+                    sentence=sent_text[:100] + "..." if len(sent_text) > 100 else sent_text,
+                    classification=CLASS_LABELS[code],
+                    action_verbs=action,
+                    hedge_markers=hedge,
+                    has_passive=passive,
+                    score=round(score, 3),
+                )
+                for sent_text, code, action, hedge, passive, score in zip(
+                    f.sentences, self._codes.tolist(), f.action_verbs.tolist(),
+                    f.hedge_count.tolist(), f.passive.tolist(), self._scores.tolist(),
+                )
+            ]
+        return self._rows
+    
+    def __len__(self) -> int:
+        return len(self._codes)
+    
+    def __getitem__(self, index):
+        return self._materialize()[index]
+    
+    def tolist(self) -> List[Dict]:
+        """Plain list of row dicts (JSON serialization)."""
+        return [row.to_dict() for row in self._materialize()]
 
-def analyze_hedging(text: str) -> Dict:
+
+def analyze_hedging(
+    text: str,
+    analysis: Optional[DocumentAnalysis] = None,
+    features: Optional[FeatureTable] = None,
+) -> Dict:
     """
     Analyze linguistic confidence using sentence-level classification.
     
     Formula: Confidence = (Action_Verbs * 1.5 - Hedge_Words) / Total_Sentences
     Normalized to [0, 1]
     
+    Args:
+        text: Text to analyze
+        analysis: Sentence analysis of `text` already computed by the caller
+        features: Its feature table, when the caller already built one
+    
     Returns:
         {
             "score": float,          # Overall confidence [0-1]
             "markers": List[str],    # Found hedging markers
-            "trace": List[Dict]      # Per-sentence analysis
+            "trace": Sequence[TraceRow]  # Per-sentence analysis (HedgingTrace, built lazily)
         }
     """
     
     if not text:
         return {"score": 0.0, "markers": [], "trace": []}
     
-    doc = nlp(text)
-    sentences = list(doc.sents)
+    # Per-sentence features come from the content-hashed sentence cache
+    if features is None:
+        features = (analysis or analyze_sentences(text)).feature_table()
+    n = len(features)
     
-    if not sentences:
+    if not n:
         return {"score": 0.0, "markers": [], "trace": []}
     
-    trace = []
-    total_action_score = 0
-    total_hedge_penalty = 0
-    found_markers = set()
+    codes, scores = classify_sentences(features.action_verbs, features.hedge_count, features.passive)
     
-    for sent in sentences:
-        sent_text = sent.text.strip()
-        sent_lower = sent_text.lower()
-        
-        # Count action verbs
-        action_count = sum(1 for token in sent if token.lemma_.lower() in ACTION_VERBS)
-        
-        # Count hedging markers
-        hedge_count = sum(1 for marker in HEDGING_MARKERS if marker in sent_lower)
-        
-        # Check for passive voice
-        has_passive = bool(PASSIVE_PATTERN.search(sent_text))
-        
-        # Classify sentence
-        if action_count >= 2:
-            classification = "assertive"
-            sentence_score = 1.5
-        elif action_count == 1 and hedge_count == 0:
-            classification = "neutral"
-            sentence_score = 0.5
-        elif hedge_count > 0:
-            classification = "hedged"
-            sentence_score = -1.0
-            # Track specific markers
-            for marker in HEDGING_MARKERS:
-                if marker in sent_lower:
-                    found_markers.add(marker)
-        else:
-            classification = "neutral"
-            sentence_score = 0.5
-        
-        # Passive voice penalty
-        if has_passive:
-            sentence_score -= 0.3
-        
-        total_action_score += max(0, sentence_score)
-        total_hedge_penalty += max(0, -sentence_score)
-        
-        trace.append({
-            "sentence": sent_text[:100] + "..." if len(sent_text) > 100 else sent_text,
-            "classification": classification,
-            "action_verbs": action_count,
-            "hedge_markers": hedge_count,
-            "has_passive": has_passive,
-            "score": sentence_score
-        })
-    
-    # Compute final confidence score
-    raw_score = (total_action_score - total_hedge_penalty) / len(sentences)
+    # sum(max(0, s)) - sum(max(0, -s)) is just sum(s)
+    raw_score = float(scores.sum()) / n
     
     # Normalize to [0, 1] - assuming typical range is [-1, 1.5]
     normalized_score = max(0.0, min(1.0, (raw_score + 1.0) / 2.5))
     
     return {
         "score": round(normalized_score, 3),
-        "markers": sorted(list(found_markers)),
-        "trace": trace
+        # Markers are reported for hedged sentences only
+        "markers": features.hedging_markers(codes == 2),
+        "trace": HedgingTrace(features, codes, scores),
     }
 
 
@@ -0,0 +1,104 @@
+"""
+Shared Lazy Model Loader
+
+Heavy NLP dependencies (spaCy, sentence-transformers / torch) are imported
+and loaded on first use rather than at module import, and each model is
+loaded exactly once per process no matter how many modules use it.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = "en_core_web_sm"
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_MODELS: Dict[str, Any] = {}
+_LOCK = threading.RLock()
+
+
+def _get_or_load(key: str, loader: Callable[[], Any]) -> Any:
+    """Double-checked load so concurrent callers never load a model twice."""
+    model = _MODELS.get(key)
+    if model is None:
+        with _LOCK:
+            model = _MODELS.get(key)
+            if model is None:
+                model = _MODELS[key] = loader()
+    return model
+
+
+def _load_spacy():
+    import spacy
+    try:
+        return spacy.load(SPACY_MODEL)
+    except OSError:
+        logger.warning(f"Model '{SPACY_MODEL}' not found. Attempting to download or fail gracefully.")
+        try:
+            from spacy.cli import download
+            download(SPACY_MODEL)
+            return spacy.load(SPACY_MODEL)
+        except Exception as e:
+            logger.error(f"Failed to load spaCy model: {e}")
+            raise RuntimeError(f"Core NLP model '{SPACY_MODEL}' is missing. Please install it.") from e
+
+
+def load_embedding_model(backend: str = "torch", source: Optional[str] = None):
+    """
+    Load the sentence-transformer with a given inference backend.
+
+    Backends:
+        torch      - full-precision PyTorch (reference)
+        onnx       - ONNX Runtime on CPU (file from EMBEDDING_ONNX_FILE inside the model dir)
+        quantized  - PyTorch with int8 dynamic quantization of all Linear layers
+
+    `source` is a local model directory or hub id (default: EMBEDDING_MODEL_DIR, else hub id).
+    """
+    from sentence_transformers import SentenceTransformer
+    from config import settings
+
+    if source is None:
+        source = str(settings.EMBEDDING_MODEL_DIR) if settings.EMBEDDING_MODEL_DIR else EMBEDDING_MODEL
+
+    if backend == "torch":
+        return SentenceTransformer(source)
+
+    if backend == "onnx":
+        return SentenceTransformer(
+            source,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": settings.EMBEDDING_ONNX_FILE, "provider": "CPUExecutionProvider"},
+        )
+
+    if backend == "quantized":
+        import torch
+        model = SentenceTransformer(source, device="cpu")
+        torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        return model
+
+    raise ValueError(f"Unknown embedding backend '{backend}' (expected torch, onnx or quantized)")
+
+
+def _load_embedding_model():
+    from config import settings
+    backend = settings.EMBEDDING_BACKEND
+    model = load_embedding_model(backend)
+    logger.info(f"Loaded embedding model with '{backend}' backend.")
+    return model
+
+
+def get_spacy_pipeline():
+    """Shared spaCy pipeline (loaded once, on first use)."""
+    return _get_or_load("spacy", _load_spacy)
+
+
+def get_embedding_model():
+    """Load sentence transformer model (cached)"""
+    return _get_or_load("embedding", _load_embedding_model)
+
+
+def is_loaded(key: str) -> bool:
+    return key in _MODELS
@@ -1,12 +1,21 @@
 from typing import Dict, List, Optional, Any
 import logging
 
-from nlp.preprocess import clean_text, tokenize_sentences
+from nlp.preprocess import clean_text_with_offsets
+from nlp import skill_extractor
+from nlp.sentence_cache import SENTENCE_CACHE, analyze_sentences
 from nlp.skill_extractor import extract_skills_with_evidence
 from nlp.confidence import analyze_hedging
 from nlp.readability import readability_score
 from nlp.ats_check import calculate_ats_score
+from nlp.pii import scan_pii
 from utils.logging_config import logger
+from utils.tracing import span
+
+def clear_analysis_caches() -> None:
+    """Drops the cross-request sentence and phrase-embedding caches, so the next run is cold."""
+    SENTENCE_CACHE.clear()
+    skill_extractor.PHRASE_EMBEDDINGS.clear()
 
 def analyze_text(text: str, skill_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
     """
@@ -34,25 +43,40 @@ def analyze_text(text: str, skill_keywords: Optional[List[str]] = None) -> Dict[
     
     try:
         # 1. Cleaning & Preprocessing
-        cleaned_text = clean_text(text)
-        sentences = tokenize_sentences(text)  # Use spaCy tokenizer for robustness
+        with span("preprocess"):
+            # One PII scan feeds both cleaning and the ATS contact-info check
+            pii = scan_pii(text)
+            cleaned = clean_text_with_offsets(text, pii)
+            cleaned_text = cleaned.text
+        
+        # 2. Sentence Analysis: only sentences not seen before are parsed (content-hashed cache)
+        with span("sentence_analysis"):
+            analysis = analyze_sentences(cleaned_text, line_breaks=cleaned.line_breaks)
+            sentences = analysis.sentence_texts()
         
-        # 2. Skill Extraction
+        # 3. Skill Extraction
         safe_keywords = skill_keywords if skill_keywords else []
-        skills_data = extract_skills_with_evidence(cleaned_text, safe_keywords)
+        with span("skill_extraction"):
+            # Offsets in the results are mapped back onto the raw `text`
+            skills_data = extract_skills_with_evidence(cleaned_text, safe_keywords, source_map=cleaned, analysis=analysis)
         
-        # 3. Confidence Analysis (Hedging)
-        # Note: analyze_hedging likely works on sentences or full text. Passing cleaned_text.
-        hedging_result = analyze_hedging(cleaned_text)
+        # 4. Confidence Analysis (Hedging), from the same per-sentence features
+        with span("hedging"):
+            hedging_result = analyze_hedging(cleaned_text, features=analysis.feature_table())
         
-        # 4. Readability Analysis
-        readability = readability_score(cleaned_text)
+        # 5. Readability Analysis
+        with span("readability"):
+            readability = readability_score(cleaned_text)
         
-        # 5. ATS Compliance Check
+        # 6. ATS Compliance Check
         # IMPORTANT: ATS check requires raw text to detect contact info formatting issues that might be stripped by cleaning.
-        ats_result = calculate_ats_score(text)
+        with span("ats"):
+            ats_result = calculate_ats_score(text, pii)
         
-        logger.info(f"Analysis complete. Found {len(skills_data)} skills.")
+        logger.info(
+            f"Analysis complete. Found {len(skills_data)} skills; "
+            f"{analysis.reused}/{len(analysis.units)} sentences reused from cache."
+        )
         
         return {
             "skills": skills_data,
@@ -62,7 +86,8 @@ def analyze_text(text: str, skill_keywords: Optional[List[str]] = None) -> Dict[
             "confidence_trace": hedging_result.get("trace", []),
             "hedging_markers": hedging_result.get("markers", []),
             "readability": readability,
-            "ats_result": ats_result
+            "ats_result": ats_result,
+            "incremental": {"units": len(analysis.units), "reused": analysis.reused},
         }
 
     except Exception as e:
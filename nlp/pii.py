@@ -0,0 +1,148 @@
+"""
+PII / Contact-Info Scanner
+
+One precompiled alternation (URL | EMAIL | PHONE, built from the patterns in
+config.Settings) finds every span in a single left-to-right pass. Cleaned
+text and the ATS contact flags are derived from that one scan instead of
+re-running a regex per consumer. Redaction errs on the side of masking: it
+uses the wider REDACT_PHONE_PATTERN (international, hyphenated and
+line-wrapped numbers of any length), so it runs its own pass when asked for.
+
+Cleaning also records where every cleaned character came from, so later
+stages can report spans against the original resume by index, and which
+collapsed spaces were line breaks, so the resume's line structure survives.
+"""
+
+import re
+from bisect import bisect_right
+from typing import List, NamedTuple, Sequence, Tuple
+
+from config import settings
+
+# Alternation order matters: a URL containing '@' must be claimed as a URL
+PII_KINDS = ("URL", "EMAIL", "PHONE")
+
+PII_RE = re.compile("|".join([
+    f"(?P<URL>{settings.URL_PATTERN})",
+    f"(?P<EMAIL>{settings.REDACT_PATTERN})",
+    f"(?P<PHONE>{settings.PHONE_PATTERN})",
+]))
+
+# URLs stay in the alternation so digits inside a link are not masked as a phone number
+REDACT_RE = re.compile("|".join([
+    f"(?P<URL>{settings.URL_PATTERN})",
+    f"(?P<EMAIL>{settings.REDACT_PATTERN})",
+    f"(?P<PHONE>{settings.REDACT_PHONE_PATTERN})",
+]))
+
+# Only personal identifiers are masked; URLs are left readable in redacted text
+REDACTION_LABELS = {"EMAIL": "[REDACTED_EMAIL]", "PHONE": "[REDACTED_PHONE]"}
+
+TOKEN_RE = re.compile(r'\S+')
+
+
+class PIISpan(NamedTuple):
+    kind: str
+    start: int
+    end: int
+
+
+class PIIScan(NamedTuple):
+    text: str
+    spans: List[PIISpan]
+
+    @property
+    def has_email(self) -> bool:
+        return any(s.kind == "EMAIL" for s in self.spans)
+
+    @property
+    def has_phone(self) -> bool:
+        return any(s.kind == "PHONE" for s in self.spans)
+
+    @property
+    def redacted(self) -> str:
+        """Text with emails and phone numbers replaced by placeholders (REDACT_RE)."""
+        spans = [PIISpan(m.lastgroup, m.start(), m.end()) for m in REDACT_RE.finditer(self.text)]
+        return _splice(self.text, spans, REDACTION_LABELS)
+
+    @property
+    def cleaned(self) -> str:
+        """Text with all PII/URL spans removed and whitespace collapsed."""
+        return self.clean().text
+
+    def clean(self) -> "CleanedText":
+        """Cleaned text plus its cleaned -> raw offset map, built in one linear pass."""
+        parts: List[str] = []
+        clean_starts: List[int] = []
+        raw_starts: List[int] = []
+        line_breaks: List[int] = []
+        pos = 0
+        prev_end = 0
+        size = 0
+        bounds = [(s.start, s.end) for s in self.spans] + [(len(self.text), len(self.text))]
+        for span_start, span_end in bounds:
+            # Every whitespace-delimited token in the kept region becomes one segment
+            for m in TOKEN_RE.finditer(self.text, pos, span_start):
+                if parts:
+                    if self.text.find("\n", prev_end, m.start()) != -1:
+                        line_breaks.append(size)
+                    parts.append(" ")
+                    size += 1
+                clean_starts.append(size)
+                raw_starts.append(m.start())
+                parts.append(m.group())
+                size += m.end() - m.start()
+                prev_end = m.end()
+            pos = span_end
+        return CleanedText("".join(parts), clean_starts, raw_starts, line_breaks)
+
+
+class CleanedText(NamedTuple):
+    """
+    Cleaned text with a segment map back to the raw text.
+
+    Segment k covers cleaned[clean_starts[k]:] and maps linearly onto
+    raw[raw_starts[k]:] up to the next segment; a collapsed separator space
+    maps to the raw position just after the preceding token. `line_breaks`
+    lists the separator spaces that stand in for a raw line break.
+    """
+    text: str
+    clean_starts: List[int]
+    raw_starts: List[int]
+    line_breaks: Sequence[int] = ()
+
+    def to_raw(self, index: int) -> int:
+        """Raw-text position of cleaned character `index`."""
+        k = bisect_right(self.clean_starts, index) - 1
+        if k < 0:
+            return index
+        return self.raw_starts[k] + (index - self.clean_starts[k])
+
+    def raw_span(self, start: int, end: int) -> Tuple[int, int]:
+        """Maps a cleaned [start, end) span onto the raw text."""
+        if end <= start:
+            raw = self.to_raw(start)
+            return raw, raw
+        return self.to_raw(start), self.to_raw(end - 1) + 1
+
+
+def scan_pii(text: str) -> PIIScan:
+    """Finds every URL, email and phone span in `text` in one pass."""
+    if not text:
+        return PIIScan("", [])
+    spans = [PIISpan(m.lastgroup, m.start(), m.end()) for m in PII_RE.finditer(text)]
+    return PIIScan(text, spans)
+
+
+def _splice(text: str, spans: List[PIISpan], labels: dict) -> str:
+    """Rebuilds `text` with each span replaced by its label; kinds missing from `labels` are kept as-is."""
+    parts = []
+    pos = 0
+    for s in spans:
+        if s.kind not in labels:
+            continue
+        parts.append(text[pos:s.start])
+        parts.append(labels[s.kind])
+        pos = s.end
+    parts.append(text[pos:])
+    return "".join(parts)
@@ -1,31 +1,20 @@
-import re
-import spacy
 import logging
-from typing import List
-from spacy.language import Language
+from typing import List, Optional
+
+from nlp.model_loader import get_spacy_pipeline
+from nlp.pii import CleanedText, PIIScan, scan_pii
+from utils.tracing import span
 
 # Initialize logger (local import to avoid circular dep if any, though likely safe)
 logger = logging.getLogger(__name__)
 
-# Lazy loading or robust loading pattern
-try:
-    nlp: Language = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("Model 'en_core_web_sm' not found. Attempting to download or fail gracefully.")
-    try:
-        from spacy.cli import download
-        download("en_core_web_sm")
-        nlp = spacy.load("en_core_web_sm")
-    except Exception as e:
-        logger.error(f"Failed to load spaCy model: {e}")
-        raise RuntimeError("Core NLP model 'en_core_web_sm' is missing. Please install it.") from e
-
-def clean_text(text: str) -> str:
+def clean_text(text: str, pii: Optional[PIIScan] = None) -> str:
     """
     Removes noise, emails, phone numbers, and URLs from raw text.
     
     Args:
         text (str): The input raw text.
+        pii (PIIScan, optional): An existing scan of `text`, to avoid rescanning.
         
     Returns:
         str: The cleaned, normalized text.
@@ -33,16 +22,21 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove emails
-    text = re.sub(r'\S+@\S+', '', text)
-    # Remove phone numbers (simple pattern)
-    text = re.sub(r'\+?\d[\d -]{8,12}\d', '', text)
-    # Remove URLs
-    text = re.sub(r'http\S+', '', text)
-    # Normalize whitespace
-    text = " ".join(text.split())
+    # Emails, phones and URLs are removed in one pass; whitespace is normalized
+    return (pii or scan_pii(text)).cleaned
+
+def clean_text_with_offsets(text: str, pii: Optional[PIIScan] = None) -> CleanedText:
+    """
+    Same cleaning as `clean_text`, plus a cleaned -> raw offset map.
     
-    return text
+    Args:
+        text (str): The input raw text.
+        pii (PIIScan, optional): An existing scan of `text`, to avoid rescanning.
+        
+    Returns:
+        CleanedText: `.text` is the cleaned text; `.raw_span(start, end)` maps spans back to `text`.
+    """
+    return (pii or scan_pii(text)).clean()
 
 def tokenize_sentences(text: str) -> List[str]:
     """
@@ -57,5 +51,6 @@ def tokenize_sentences(text: str) -> List[str]:
     if not text:
         return []
         
-    doc = nlp(text)
+    with span("spacy_parse", caller="tokenize_sentences"):
+        doc = get_spacy_pipeline()(text)
     return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
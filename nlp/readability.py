@@ -1,6 +1,5 @@
-import textstat
-
 def readability_score(text):
     if not text.strip():
         return 0.0
+    import textstat  # deferred: pulls in pyphen dictionaries
     return round(textstat.flesch_kincaid_grade(text), 2)
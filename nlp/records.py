@@ -0,0 +1,139 @@
+"""
+Result Records
+
+Typed, slotted records for what the pipeline produces per request: skill
+candidates, matched skills and their evidence, and confidence-trace rows.
+They hold character offsets, never spaCy Span objects, so no Doc outlives
+the sentence analysis, and slots keep each record to its fields instead of
+a per-instance dict.
+
+Records still read like the dicts they replaced (`skill["evidence"]`,
+`skill.get("mentions", [])`, `dict(skill)`) and serialize through
+`to_dict()` in that same shape, so the UI, the HTTP service and saved
+output are unchanged.
+"""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Iterator, List, Tuple
+
+Offsets = Tuple[int, int]
+
+
+class Record:
+    """Mapping-style, read-only access to a record's exported `KEYS`."""
+
+    __slots__ = ()
+    KEYS: ClassVar[Tuple[str, ...]] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.KEYS else default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self.KEYS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict in the legacy shape (nested records included)."""
+        return {k: _plain(getattr(self, k)) for k in self.KEYS}
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Candidate(Record):
+    """
+    A skill candidate phrase (layers 1-2 of nlp.skill_extractor).
+
+    Offsets are relative to the parsed unit while cached in nlp.sentence_cache
+    and document-relative once merged; `sentence` is shared by every
+    candidate of the same sentence.
+    """
+    text: str
+    start: int
+    end: int
+    sent_start: int
+    sent_end: int
+    depth: str          # "applied" | "mentioned"
+    sentence: str
+
+    KEYS: ClassVar[Tuple[str, ...]] = ("text", "sentence", "depth", "offsets", "sentence_offsets")
+
+    @property
+    def offsets(self) -> Offsets:
+        return (self.start, self.end)
+
+    @property
+    def sentence_offsets(self) -> Offsets:
+        return (self.sent_start, self.sent_end)
+
+    def shifted(self, delta: int) -> "Candidate":
+        """Same candidate with offsets moved by `delta` (unit -> document)."""
+        return Candidate(self.text, self.start + delta, self.end + delta,
+                         self.sent_start + delta, self.sent_end + delta, self.depth, self.sentence)
+
+
+@dataclass(frozen=True, slots=True)
+class Evidence(Record):
+    """An evidence sentence and its (start, end) offsets."""
+    sentence: str
+    start: int
+    end: int
+
+    KEYS: ClassVar[Tuple[str, ...]] = ("sentence", "start", "end")
+
+
+@dataclass(slots=True)
+class Skill(Record):
+    """
+    A canonical skill matched in the text, with its explainability trail.
+
+    Exported as {skill, confidence, evidence, depth, mentions, evidence_spans}:
+    `evidence` (sentences) and `evidence_spans` (their offsets) are views
+    over `evidence_items`.
+    """
+    skill: str
+    confidence: float
+    depth: str
+    mentions: List[Offsets]
+    evidence_items: List[Evidence]
+
+    KEYS: ClassVar[Tuple[str, ...]] = ("skill", "confidence", "evidence", "depth", "mentions", "evidence_spans")
+
+    @property
+    def evidence(self) -> List[str]:
+        return [e.sentence for e in self.evidence_items]
+
+    @property
+    def evidence_spans(self) -> List[Offsets]:
+        return [(e.start, e.end) for e in self.evidence_items]
+
+
+@dataclass(frozen=True, slots=True)
+class TraceRow(Record):
+    """One sentence of the confidence trace (nlp.confidence)."""
+    sentence: str
+    classification: str
+    action_verbs: int
+    hedge_markers: int
+    has_passive: bool
+    score: float
+
+    KEYS: ClassVar[Tuple[str, ...]] = (
+        "sentence", "classification", "action_verbs", "hedge_markers", "has_passive", "score",
+    )
@@ -0,0 +1,188 @@
+"""
+Sentence-Level Incremental Analysis
+
+Cleaned text is split into sentence units (sentence ends, bullets and the
+raw resume's line breaks) and each unit is analysed on its own: spaCy parse,
+skill candidates, negation verdicts and the sentence features every scorer
+reads (nlp.sentence_features). Results are cached under a hash of the
+unit's content, so re-analysing an edited resume only parses the sentences
+that changed; every other unit is served from the cache and the results are
+merged back with document offsets.
+
+Candidate phrase embeddings are cached separately (nlp.skill_extractor), so
+unchanged phrases are not re-embedded either.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from config import settings
+from nlp.model_loader import get_spacy_pipeline
+from nlp.records import Candidate
+from nlp.sentence_features import FeatureTable, SentenceFeatures, sentence_features
+from utils.tracing import count, span
+
+# Unit boundaries: after sentence-final punctuation, before a bullet glyph or a
+# dash bullet, and at a line break unless the next line continues in lowercase
+UNIT_SPLIT_RE = re.compile(
+    r'(?<=[.!?])\s+(?=\S)'
+    r'|\s+(?=[•▪●◦‣■]\s)'
+    r'|\s+(?=[-–—]\s+[A-Z])'
+    r'|\s*\n\s*(?=[^a-z\s])'
+)
+
+
+class LRUCache:
+    """Thread-safe bounded LRU; lookups are counted as `<metric>{result=hit|miss}`."""
+
+    def __init__(self, max_entries: int, metric: str):
+        self.max_entries = max_entries
+        self.metric = metric
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        count(self.metric, result="hit" if value is not None else "miss")
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SentenceAnalysis(NamedTuple):
+    """Everything derived from one unit's text alone (the cached value)."""
+    sentences: Tuple[Tuple[int, int], ...]          # stripped spaCy sentences in the unit
+    candidates: Tuple[Candidate, ...]              # negation-filtered, unit-relative offsets
+    negated: Tuple[str, ...]                        # candidate phrases rejected as negated
+    features: Tuple[SentenceFeatures, ...]          # one per sentence
+
+
+class DocumentAnalysis(NamedTuple):
+    text: str
+    units: List[Tuple[int, int, SentenceAnalysis]]  # (start, end, analysis) in document order
+    reused: int                                     # units served from the cache
+
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        return [(start + s, start + e) for start, _, a in self.units for s, e in a.sentences]
+
+    def sentence_texts(self) -> List[str]:
+        return [self.text[s:e] for s, e in self.sentence_spans()]
+
+    def candidates(self) -> List[Candidate]:
+        """Candidates for nlp.skill_extractor._semantic_matching, in document offsets."""
+        return [c.shifted(start) for start, _, a in self.units for c in a.candidates]
+
+    def feature_table(self) -> FeatureTable:
+        """Columnar sentence features for the scorers (confidence, weakness, resume score)."""
+        return FeatureTable(self.sentence_texts(), [f for _, _, a in self.units for f in a.features])
+
+
+SENTENCE_CACHE = LRUCache(settings.SENTENCE_CACHE_MAX_ENTRIES, "sentence_cache_lookups_total")
+
+
+def split_units(text: str, line_breaks: Sequence[int] = ()) -> List[Tuple[int, int]]:
+    """
+    (start, end) of each non-empty sentence unit.
+
+    `line_breaks` are separator positions in cleaned text that were line
+    breaks in the raw resume (CleanedText.line_breaks); they split units
+    like a literal newline does.
+    """
+    cuts = [m.span() for m in UNIT_SPLIT_RE.finditer(text)]
+    if line_breaks:
+        cuts = sorted(cuts + [(b, b + 1) for b in line_breaks
+                              if b + 1 < len(text) and not text[b + 1].islower()])
+    units = []
+    pos = 0
+    for start, end in cuts:
+        if start < pos:
+            continue
+        if text[pos:start].strip():
+            units.append((pos, start))
+        pos = end
+    if text[pos:].strip():
+        units.append((pos, len(text)))
+    return units
+
+
+def unit_key(unit_text: str) -> str:
+    return hashlib.blake2b(unit_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _analyze_doc(doc) -> SentenceAnalysis:
+    """Runs every per-sentence stage on one parsed unit."""
+    from nlp.skill_extractor import _extract_candidates, _filter_negations
+
+    sentences, features = [], []
+    for sent in doc.sents:
+        stripped = sent.text.strip()
+        if not stripped:
+            continue
+        start = sent.start_char + (len(sent.text) - len(sent.text.lstrip()))
+        sentences.append((start, start + len(stripped)))
+        features.append(sentence_features(stripped))
+
+    # Candidates hold offsets only: no spaCy Span (and so no Doc) outlives this function
+    raw = _extract_candidates(doc)
+    kept = _filter_negations(raw, doc)
+    kept_ids = {id(c) for c in kept}
+    negated = tuple(c.text for c in raw if id(c) not in kept_ids)
+    return SentenceAnalysis(tuple(sentences), tuple(kept), negated, tuple(features))
+
+
+def analyze_sentences(text: str, cache: Optional[LRUCache] = None,
+                      line_breaks: Sequence[int] = ()) -> DocumentAnalysis:
+    """
+    Sentence-level analysis of `text`, parsing only units not already cached.
+
+    Args:
+        text: Cleaned text (nlp.preprocess)
+        cache: Defaults to the process-wide SENTENCE_CACHE
+        line_breaks: Raw line breaks collapsed by cleaning (CleanedText.line_breaks)
+
+    Returns:
+        DocumentAnalysis with per-unit results merged in document order.
+    """
+    cache = SENTENCE_CACHE if cache is None else cache
+    spans = split_units(text or "", line_breaks)
+    keys = [unit_key(text[s:e]) for s, e in spans]
+
+    results: Dict[str, SentenceAnalysis] = {}
+    missing: Dict[str, str] = {}
+    for key, (s, e) in zip(keys, spans):
+        if key in results or key in missing:
+            continue
+        hit = cache.get(key)
+        if hit is not None:
+            results[key] = hit
+        else:
+            missing[key] = text[s:e]
+
+    if missing:
+        with span("spacy_parse", caller="sentence_cache"):
+            docs = list(get_spacy_pipeline().pipe(missing.values()))
+        for key, doc in zip(missing, docs):
+            results[key] = _analyze_doc(doc)
+            cache.put(key, results[key])
+
+    units = [(s, e, results[key]) for key, (s, e) in zip(keys, spans)]
+    reused = sum(1 for key in keys if key not in missing)
+    return DocumentAnalysis(text or "", units, reused)
@@ -0,0 +1,203 @@
+"""
+Sentence Feature Extraction
+
+One lexical pass per sentence computes every signal the scorers use:
+action verbs, hedging markers, passive voice, numbers / metrics, impact
+keywords. nlp.confidence, intelligence.weakness_detector and
+intelligence.resume_score all read the same FeatureTable (one NumPy column
+per signal) instead of keeping their own word lists and rescanning text.
+
+Features depend on the sentence text only, so nlp.sentence_cache caches them
+per sentence; role-keyword hits are the one role-dependent column and are
+computed per keyword list on demand.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Action verbs (assertive language), matched as whole words
+ACTION_VERBS = frozenset({
+    "built", "designed", "implemented", "developed", "created", "architected",
+    "deployed", "optimized", "led", "managed", "engineered", "achieved",
+    "reduced", "increased", "improved", "delivered", "launched", "scaled",
+})
+
+# Hedging markers (uncertain language), matched as whole words / phrases.
+# "basic" and "learning" only hedge in context: "basic auth" and "machine
+# learning" are skills, not hedges.
+HEDGING_MARKERS = frozenset({
+    "maybe", "kind of", "somewhat", "a bit", "possibly", "familiar with",
+    "basic knowledge", "basic understanding", "basic familiarity", "basic experience",
+    "currently learning", "still learning", "trying to", "hoping to", "interested in",
+    "assisted", "helped", "involved in", "exposed to", "some experience",
+})
+
+# Passive voice patterns
+PASSIVE_PATTERN = re.compile(r'\b(was|were|is|are|been|being)\s+\w+ed\b', re.I)
+
+# Any number (weakness: "no measurable result" when absent)
+NUMBER_RE = re.compile(r'\b\d+%?|\b\d+\s+(?:hours|days|users|clients|transactions|months|years)\b', re.I)
+
+# Outcome metrics: percentages and counted quantities (resume impact score)
+METRIC_RE = re.compile(r'\b\d+%|\b\d+\s+(?:hours|days|users|clients|transactions)\b', re.I)
+
+# Impact vocabulary; presence is tracked per sentence as a bitmask
+IMPACT_KEYWORDS = ("improved", "reduced", "increased", "%", "by", "from", "to", "resulted")
+
+WORD_RE = re.compile(r"[a-z]+")
+HEDGE_RE = re.compile(r"\b(?:" + "|".join(sorted(map(re.escape, HEDGING_MARKERS), key=len, reverse=True)) + r")\b")
+
+
+class SentenceFeatures(NamedTuple):
+    """Every role-independent signal of one sentence."""
+    action_verbs: int
+    hedges: Tuple[str, ...]       # distinct hedging markers, sorted
+    has_passive: bool
+    numbers: int
+    metrics: int
+    impact_mask: int              # bit i set when IMPACT_KEYWORDS[i] occurs
+    responsible_for: bool
+
+
+def sentence_features(sentence: str) -> SentenceFeatures:
+    """Feature extraction for one sentence of text."""
+    lower = sentence.lower()
+    impact_mask = 0
+    for bit, keyword in enumerate(IMPACT_KEYWORDS):
+        if keyword in lower:
+            impact_mask |= 1 << bit
+    return SentenceFeatures(
+        action_verbs=sum(1 for w in WORD_RE.findall(lower) if w in ACTION_VERBS),
+        hedges=tuple(sorted(set(HEDGE_RE.findall(lower)))),
+        has_passive=bool(PASSIVE_PATTERN.search(sentence)),
+        numbers=len(NUMBER_RE.findall(sentence)),
+        metrics=len(METRIC_RE.findall(sentence)),
+        impact_mask=impact_mask,
+        responsible_for="responsible for" in lower,
+    )
+
+
+class KeywordMatcher:
+    """
+    Multi-keyword matcher compiled once into a trie-shaped regex.
+
+    A zero-width lookahead tries the trie at every position of the joined
+    document, so one scan finds the longest keyword starting anywhere; the
+    shorter keywords that are prefixes of it are credited from a precomputed
+    map. The distinct keywords found per sentence are exactly those a
+    per-keyword substring check would find, without the sentences x keywords loop.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(sorted({k.lower() for k in keywords if k}))
+        self._prefixes = {k: tuple(p for p in self.keywords if k.startswith(p)) for k in self.keywords}
+        self._re = re.compile(f"(?=({_trie_pattern(self.keywords)}))") if self.keywords else None
+
+    def matches(self, sentences: Sequence[str]) -> List[set]:
+        """Distinct keywords occurring in each sentence."""
+        found: List[set] = [set() for _ in sentences]
+        if self._re is None or not sentences:
+            return found
+        lowered = [s.lower() for s in sentences]
+        starts, pos = [], 0
+        for s in lowered:
+            starts.append(pos)
+            pos += len(s) + 1
+        for m in self._re.finditer("\n".join(lowered)):
+            found[bisect_right(starts, m.start()) - 1].update(self._prefixes[m.group(1)])
+        return found
+
+    def hits(self, sentences: Sequence[str]):
+        """Per-sentence count of distinct keywords (NumPy int array)."""
+        import numpy as np
+        return np.fromiter((len(s) for s in self.matches(sentences)), dtype=np.int32, count=len(sentences))
+
+
+def _trie_pattern(keywords: Sequence[str]) -> str:
+    """Regex for a keyword trie; optional suffixes are greedy, so the longest keyword wins."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-keyword marker
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+@lru_cache(maxsize=256)
+def keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Compiled matcher per keyword set (callers pass a normalized tuple)."""
+    return KeywordMatcher(keywords)
+
+
+def normalize_keywords(keywords: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Lowercased, de-duplicated, sorted: the cache key for keyword_matcher and role_hits."""
+    return tuple(sorted({k.lower() for k in keywords or () if k}))
+
+
+class FeatureTable:
+    """Columnar view of many sentences' features: one NumPy array per signal."""
+
+    def __init__(self, sentences: Sequence[str], rows: Sequence[SentenceFeatures]):
+        import numpy as np
+
+        n = len(rows)
+        self.sentences = list(sentences)
+        self.rows = list(rows)
+        self.action_verbs = np.fromiter((r.action_verbs for r in rows), dtype=np.int32, count=n)
+        self.hedge_count = np.fromiter((len(r.hedges) for r in rows), dtype=np.int32, count=n)
+        self.passive = np.fromiter((r.has_passive for r in rows), dtype=bool, count=n)
+        self.numbers = np.fromiter((r.numbers for r in rows), dtype=np.int32, count=n)
+        self.metrics = np.fromiter((r.metrics for r in rows), dtype=np.int32, count=n)
+        self.impact_mask = np.fromiter((r.impact_mask for r in rows), dtype=np.int64, count=n)
+        self.responsible_for = np.fromiter((r.responsible_for for r in rows), dtype=bool, count=n)
+        self._role_hits: Dict[Tuple[str, ...], "np.ndarray"] = {}
+
+    @classmethod
+    def from_sentences(cls, sentences: Sequence[str]) -> "FeatureTable":
+        return cls(sentences, [sentence_features(s) for s in sentences])
+
+    @classmethod
+    def from_text(cls, text: str) -> "FeatureTable":
+        """
+        Splits raw text into sentence units (no parse) and extracts features.
+        Line breaks and bullets end a unit too, so an unpunctuated bulleted
+        resume still yields one row per bullet.
+        """
+        from nlp.sentence_cache import split_units
+        return cls.from_sentences([text[s:e] for s, e in split_units(text or "")])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def role_hits(self, keywords: Optional[Iterable[str]]):
+        """Per-sentence count of distinct `keywords` occurring in the sentence (memoized per keyword set)."""
+        key = normalize_keywords(keywords)
+        hits = self._role_hits.get(key)
+        if hits is None:
+            hits = self._role_hits[key] = keyword_matcher(key).hits(self.sentences)
+        return hits
+
+    def impact_keywords_present(self) -> int:
+        """Number of distinct IMPACT_KEYWORDS found anywhere in the document."""
+        combined = 0
+        for mask in self.impact_mask.tolist():
+            combined |= mask
+        return bin(combined).count("1")
+
+    def hedging_markers(self, mask=None) -> List[str]:
+        """Distinct markers over all sentences, or those where `mask` is set."""
+        import numpy as np
+
+        indices = range(len(self.rows)) if mask is None else np.flatnonzero(mask).tolist()
+        return sorted({m for i in indices for m in self.rows[i].hedges})
@@ -6,31 +6,21 @@ Three-layer architecture:
 2. Negation & Context Filtering
 3. Semantic Normalization (Embeddings)
 
-Output: Structured skill objects with full explainability
+Output: Skill records (nlp.records) with full explainability
 """
 
-import spacy
-from typing import List, Dict
+from typing import List, Dict, Optional
 from functools import lru_cache
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
 import logging
 
-logger = logging.getLogger(__name__)
-
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    import en_core_web_sm
-    nlp = en_core_web_sm.load()
+from config import settings
+from nlp.model_loader import get_embedding_model
+from nlp.pii import CleanedText
+from nlp.records import Candidate, Evidence, Skill
+from nlp.sentence_cache import DocumentAnalysis, LRUCache, analyze_sentences
+from utils.tracing import span
 
-# Embedding model (cached)
-@lru_cache(maxsize=1)
-def get_embedding_model():
-    """Load sentence transformer model (cached)"""
-    return SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+logger = logging.getLogger(__name__)
 
 # Action verbs that indicate skill usage
 ACTION_VERBS = {
@@ -49,45 +39,58 @@ STOP_PHRASES = {
 NEGATION_DEPS = {"neg", "not"}
 NEGATION_TOKENS = {"no", "not", "never", "n't", "without", "lack"}
 
-def extract_skills_with_evidence(text: str, ontology_skills: List[str]) -> List[Dict]:
+def extract_skills_with_evidence(
+    text: str,
+    ontology_skills: List[str],
+    source_map: Optional[CleanedText] = None,
+    analysis: Optional[DocumentAnalysis] = None,
+) -> List[Skill]:
     """
     Extract skills using three-layer semantic approach.
     
     Args:
         text: Resume or profile text
         ontology_skills: Canonical skill names from ontology
+        source_map: Offset map when `text` is cleaned text; spans are then
+            reported against the original raw text instead
+        analysis: Sentence analysis of `text` already computed by the caller
         
     Returns:
-        List of skill objects: {skill, confidence, evidence, depth}
+        List of Skill records: {skill, confidence, evidence, depth, mentions, evidence_spans}
+        where mentions / evidence_spans are (start, end) character offsets
     """
     
     if not text or not ontology_skills:
         return []
     
-    doc = nlp(text)
-    
-    # LAYER 1: Linguistic Candidate Extraction
-    candidates = _extract_candidates(doc)
-    
-    # LAYER 2: Negation & Context Filtering
-    candidates = _filter_negations(candidates, doc)
+    # LAYERS 1-2: candidates and negation verdicts, per sentence, from the sentence cache
+    candidates = (analysis or analyze_sentences(text)).candidates()
     
     # LAYER 3: Semantic Normalization
-    skills = _semantic_matching(candidates, ontology_skills)
+    with span("semantic_matching"):
+        skills = _semantic_matching(candidates, ontology_skills)
+    
+    if source_map is not None:
+        for skill in skills:
+            skill.mentions = [source_map.raw_span(s, e) for s, e in skill.mentions]
+            skill.evidence_items = [Evidence(ev.sentence, *source_map.raw_span(ev.start, ev.end)) for ev in skill.evidence_items]
     
     return skills
 
 
-def _extract_candidates(doc) -> List[Dict]:
+def _extract_candidates(doc) -> List[Candidate]:
     """
     Layer 1: Extract skill candidates from text using linguistic patterns.
     
-    Returns list of candidates with evidence sentences.
+    Returns list of candidates with evidence sentences (offsets into `doc`).
     """
     candidates = []
     
     for sent in doc.sents:
         sent_text = sent.text.strip()
+        # Character offsets of the stripped sentence within the parsed text
+        sent_start = sent.start_char + (len(sent.text) - len(sent.text.lstrip()))
+        sent_end = sent_start + len(sent_text)
         
         # Check if sentence has action verbs
         has_action = any(token.lemma_.lower() in ACTION_VERBS for token in sent)
@@ -109,17 +112,14 @@ def _extract_candidates(doc) -> List[Dict]:
             # Determine depth based on context
             depth = "applied" if has_action else "mentioned"
             
-            candidates.append({
-                "text": chunk_text,
-                "sentence": sent_text,
-                "depth": depth,
-                "span": chunk
-            })
+            candidates.append(Candidate(
+                chunk_text, chunk.start_char, chunk.end_char, sent_start, sent_end, depth, sent_text,
+            ))
     
     return candidates
 
 
-def _filter_negations(candidates: List[Dict], doc) -> List[Dict]:
+def _filter_negations(candidates: List[Candidate], doc) -> List[Candidate]:
     """
     Layer 2: Filter out candidates that are negated or in negative context.
     
@@ -131,7 +131,8 @@ def _filter_negations(candidates: List[Dict], doc) -> List[Dict]:
     filtered = []
     
     for cand in candidates:
-        span = cand["span"]
+        # Tokens are recovered from the offsets; noun chunks always align with token boundaries
+        span = doc.char_span(cand.start, cand.end, alignment_mode="expand") or ()
         is_negated = False
         
         # Check for negation dependencies
@@ -147,40 +148,73 @@ def _filter_negations(candidates: List[Dict], doc) -> List[Dict]:
                 break
         
         # Check sentence-level negation phrases
-        sent_lower = cand["sentence"].lower()
+        sent_lower = cand.sentence.lower()
         if any(phrase in sent_lower for phrase in ["no experience", "have not", "never worked", "not familiar"]):
             is_negated = True
         
         if not is_negated:
             filtered.append(cand)
         else:
-            logger.debug(f"Filtered negated candidate: {cand['text']}")
+            logger.debug(f"Filtered negated candidate: {cand.text}")
     
     return filtered
 
 
+# Candidate phrase -> embedding, shared across requests (edited resumes repeat most phrases)
+PHRASE_EMBEDDINGS = LRUCache(settings.PHRASE_EMBEDDING_CACHE_MAX_ENTRIES, "phrase_embedding_lookups_total")
+
+
+def _encode_phrases(model, texts: List[str]):
+    """Embeddings for `texts`, encoding only phrases not already cached."""
+    import numpy as np
+    
+    # Keyed by model identity too, so a swapped model never serves stale vectors
+    model_id = id(model)
+    vectors = [PHRASE_EMBEDDINGS.get((model_id, t)) for t in texts]
+    missing = [t for t, v in zip(texts, vectors) if v is None]
+    if missing:
+        with span("embedding", target="candidate"):
+            encoded = dict(zip(missing, model.encode(missing)))
+        for t, v in encoded.items():
+            PHRASE_EMBEDDINGS.put((model_id, t), v)
+        vectors = [v if v is not None else encoded[t] for t, v in zip(texts, vectors)]
+    return np.vstack(vectors)
+
+
 @lru_cache(maxsize=512)
 def _get_ontology_embeddings(ontology_tuple):
     """Cache embeddings for ontology skills"""
     model = get_embedding_model()
-    return model.encode(list(ontology_tuple))
+    with span("embedding", target="ontology"):
+        return model.encode(list(ontology_tuple))
+
 
+def prime_ontology_embeddings(ontology_skills: List[str]):
+    """Encode and cache ontology embeddings ahead of the first request (warm-up)."""
+    return _get_ontology_embeddings(tuple(sorted(ontology_skills)))
 
-def _semantic_matching(candidates: List[Dict], ontology_skills: List[str], threshold: float = 0.75) -> List[Dict]:
+
+def _semantic_matching(candidates: List[Candidate], ontology_skills: List[str], threshold: Optional[float] = None) -> List[Skill]:
     """
     Layer 3: Match candidates to canonical ontology skills using semantic similarity.
     
     Args:
         candidates: Filtered candidate phrases
         ontology_skills: Canonical skill names
-        threshold: Minimum cosine similarity for match (0.75)
+        threshold: Minimum cosine similarity for match (default settings.SKILL_MATCH_THRESHOLD)
         
     Returns:
-        Structured skill objects with confidence scores
+        Skill records with confidence scores
     """
     
     if not candidates or not ontology_skills:
         return []
+    if threshold is None:
+        threshold = settings.SKILL_MATCH_THRESHOLD
+    
+    # Deferred: sklearn/numpy are only needed once matching actually runs
+    import numpy as np
+    from sklearn.metrics.pairwise import cosine_similarity
     
     model = get_embedding_model()
     
@@ -188,38 +222,41 @@ def _semantic_matching(candidates: List[Dict], ontology_skills: List[str], thres
     ontology_tuple = tuple(sorted(ontology_skills))
     ontology_embeddings = _get_ontology_embeddings(ontology_tuple)
     
+    # Embed each distinct candidate phrase once, in a single batch of cache misses
+    unique_texts = list(dict.fromkeys(cand.text for cand in candidates))
+    cand_embeddings = _encode_phrases(model, unique_texts)
+    
+    # Compute similarities for all candidates at once
+    similarities = cosine_similarity(cand_embeddings, ontology_embeddings)
+    best_idx = np.argmax(similarities, axis=1)
+    best_sim = similarities[np.arange(len(unique_texts)), best_idx]
+    best_by_text = {t: (int(best_idx[i]), float(best_sim[i])) for i, t in enumerate(unique_texts)}
+    
     # Group candidates by text to deduplicate
-    skill_dict = {}
+    skill_dict: Dict[str, Skill] = {}
+    seen_sentences: Dict[str, set] = {}
     
     for cand in candidates:
-        cand_text = cand["text"]
-        
-        # Embed candidate
-        cand_embedding = model.encode([cand_text])
-        
-        # Compute similarities
-        similarities = cosine_similarity(cand_embedding, ontology_embeddings)[0]
-        max_idx = np.argmax(similarities)
-        max_sim = similarities[max_idx]
+        max_idx, max_sim = best_by_text[cand.text]
         
         if max_sim >= threshold:
-            matched_skill = ontology_skills[max_idx]
+            # Index into the sorted tuple the embeddings were built from
+            matched_skill = ontology_tuple[max_idx]
             
             # Aggregate evidence
-            if matched_skill not in skill_dict:
-                skill_dict[matched_skill] = {
-                    "skill": matched_skill,
-                    "confidence": float(max_sim),
-                    "evidence": [],
-                    "depth": cand["depth"]
-                }
+            entry = skill_dict.get(matched_skill)
+            if entry is None:
+                entry = skill_dict[matched_skill] = Skill(matched_skill, float(max_sim), cand.depth, [], [])
+                seen_sentences[matched_skill] = set()
+            entry.mentions.append(cand.offsets)
             
             # Add evidence sentence if not duplicate
-            if cand["sentence"] not in skill_dict[matched_skill]["evidence"]:
-                skill_dict[matched_skill]["evidence"].append(cand["sentence"])
+            if cand.sentence not in seen_sentences[matched_skill]:
+                seen_sentences[matched_skill].add(cand.sentence)
+                entry.evidence_items.append(Evidence(cand.sentence, cand.sent_start, cand.sent_end))
             
             # Update depth if more specific
-            if cand["depth"] == "applied" and skill_dict[matched_skill]["depth"] == "mentioned":
-                skill_dict[matched_skill]["depth"] = "applied"
+            if cand.depth == "applied" and entry.depth == "mentioned":
+                entry.depth = "applied"
     
     return list(skill_dict.values())
@@ -0,0 +1,292 @@
+"""
+Bulk Resume Scoring
+
+Runs extraction -> analysis -> normalization -> role fit over many resumes
+on a process pool, streaming results as they complete.
+
+Input  : a directory of PDF/DOCX/TXT files (recursive), or a JSONL file
+         ("-" for stdin) with one {"id": ..., "text": ...} object per line.
+Output : JSONL (one result per line, flushed as it goes) or Parquet (a
+         directory of part files, one per --part-size results).
+
+The output doubles as the checkpoint: re-running with the same --output
+skips every record ID already written, so an interrupted nightly run resumes
+where it stopped.
+
+Usage:
+    python scripts/bulk_score.py --input resumes/ --output scores.jsonl --role "Data Scientist"
+    python scripts/bulk_score.py --input profiles.jsonl --output scores/ --format parquet --workers 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# Add parent directory to path so imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.logging_config import logger, setup_worker_logging
+
+DOCUMENT_SUFFIXES = {".pdf", ".docx", ".txt"}
+
+# Set once per worker by _init_worker
+_WORKER_KEYWORDS: List[str] = []
+
+
+# --- Input ---
+
+def iter_records(source: str) -> Iterator[Dict[str, Any]]:
+    """Yields {"id", "path"} for document files or {"id", "text"} for JSONL lines, lazily."""
+    if source != "-" and Path(source).is_dir():
+        root = Path(source)
+        for path in sorted(root.rglob("*")):
+            if path.suffix.lower() in DOCUMENT_SUFFIXES and path.is_file():
+                yield {"id": str(path.relative_to(root)), "path": str(path)}
+        return
+
+    stream = sys.stdin if source == "-" else open(source, "r", encoding="utf-8")
+    try:
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed JSONL line {line_no}: {e}")
+                continue
+            yield {"id": str(obj.get("id", f"line-{line_no}")), "text": obj.get("text", "")}
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+# --- Output sinks (each is also its own checkpoint) ---
+
+class JsonlSink:
+    """Appends one JSON line per result, flushed immediately."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+
+    def resume(self) -> Set[str]:
+        """IDs already written; also trims a torn last line so appends stay valid."""
+        done = set()
+        if not self.path.exists():
+            return done
+        valid_bytes = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    done.add(json.loads(line)["id"])
+                except (ValueError, KeyError):
+                    break  # torn final line from an interrupted run
+                valid_bytes += len(line)
+        # Drop anything after the last complete record before appending
+        with open(self.path, "r+b") as f:
+            f.truncate(valid_bytes)
+        return done
+
+    def write(self, result: Dict[str, Any]) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps(result, default=list) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
+
+class ParquetSink:
+    """Writes part-NNNNN.parquet files; nested values are stored as JSON strings."""
+
+    def __init__(self, directory: Path, part_size: int):
+        self.directory = directory
+        self.part_size = part_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._next_part = 0
+
+    def resume(self) -> Set[str]:
+        """IDs in existing part files; new parts are numbered after them."""
+        import pyarrow.parquet as pq
+        done = set()
+        parts = sorted(self.directory.glob("part-*.parquet")) if self.directory.exists() else []
+        for part in parts:
+            done.update(pq.read_table(part, columns=["id"]).column("id").to_pylist())
+        self._next_part = len(parts)
+        return done
+
+    def write(self, result: Dict[str, Any]) -> None:
+        self._buffer.append({
+            k: json.dumps(v, default=list) if isinstance(v, (dict, list)) else v
+            for k, v in result.items()
+        })
+        if len(self._buffer) >= self.part_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.directory.mkdir(parents=True, exist_ok=True)
+        final = self.directory / f"part-{self._next_part:05d}.parquet"
+        tmp = final.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pylist(self._buffer), tmp)
+        tmp.replace(final)  # a part is either complete or absent
+        self._next_part += 1
+        self._buffer = []
+
+    def close(self) -> None:
+        self._flush()
+
+
+# --- Worker ---
+
+def _init_worker() -> None:
+    """Load models once per worker process, before the first record arrives."""
+    global _WORKER_KEYWORDS
+    from intelligence.ontology import get_canonical_skills
+    from nlp.model_loader import get_spacy_pipeline, get_embedding_model
+    from nlp.skill_extractor import prime_ontology_embeddings
+
+    # Forked workers inherit a queue handler whose listener thread stayed in the parent
+    setup_worker_logging()
+    # Workers inherit the parent's logger; keep them quiet unless something fails
+    logging.getLogger("career_nlp").setLevel(logging.WARNING)
+    _WORKER_KEYWORDS = get_canonical_skills()
+    get_spacy_pipeline()
+    get_embedding_model()
+    prime_ontology_embeddings(_WORKER_KEYWORDS)
+
+
+def score_record(record: Dict[str, Any], roles: List[str]) -> Dict[str, Any]:
+    """Full pipeline for one resume. Never raises: failures become an "error" field."""
+    from utils.loaders import extract_file_text
+    from nlp.nlp_engine import analyze_text
+    from intelligence.ontology import get_canonical_skills, normalize_skills
+    from intelligence.role_matcher import calculate_role_fit
+
+    t0 = time.perf_counter()
+    result: Dict[str, Any] = {
+        "id": record["id"], "skills": [], "skills_raw": [], "confidence_score": 0.0,
+        "readability": 0.0, "ats_score": 0, "role_fit": {}, "error": None,
+    }
+    try:
+        text = record["text"] if "text" in record else extract_file_text(Path(record["path"]))
+        if not text:
+            raise ValueError("no extractable text")
+
+        signals = analyze_text(text, _WORKER_KEYWORDS or get_canonical_skills())
+        if signals.get("error"):
+            raise RuntimeError(signals["error"])
+        normalized = normalize_skills(signals["skills_raw"])
+        skills = [s if isinstance(s, str) else s.get("name") for s in normalized]
+
+        result.update(
+            skills=sorted(skills),
+            skills_raw=signals["skills_raw"],
+            confidence_score=signals["confidence_score"],
+            readability=signals["readability"],
+            ats_score=signals["ats_result"].get("score", 0),
+        )
+        for role in roles:
+            fit = calculate_role_fit(skills, role, signals["confidence_score"])
+            result["role_fit"][role] = {k: fit.get(k) for k in ("score", "skill_score", "matched", "missing")}
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return result
+
+
+# --- Driver ---
+
+def run(
+    source: str,
+    sink,
+    roles: List[str],
+    workers: int,
+    executor: str = "process",
+    limit: Optional[int] = None,
+    progress_every: int = 500,
+) -> Dict[str, int]:
+    """Score every record not already in `sink`; returns counters."""
+    done = sink.resume()
+    if done:
+        logger.info(f"Resuming: {len(done)} records already scored")
+
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    # Bounded in-flight window: input is streamed, never fully materialized
+    window = workers * 4
+    stats = {"scored": 0, "failed": 0, "skipped": 0}
+    t0 = time.perf_counter()
+
+    def _drain(futures: Set[Future], block_until: int) -> Set[Future]:
+        while len(futures) > block_until:
+            finished, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                result = fut.result()
+                sink.write(result)
+                stats["failed" if result["error"] else "scored"] += 1
+                total = stats["scored"] + stats["failed"]
+                if total % progress_every == 0:
+                    rate = total / max(1e-9, time.perf_counter() - t0)
+                    logger.info(f"{total} records scored ({rate:.1f}/s, {stats['failed']} failed)")
+        return futures
+
+    with pool_cls(max_workers=workers, initializer=_init_worker) as pool:
+        futures: Set[Future] = set()
+        submitted = 0
+        for record in iter_records(source):
+            if record["id"] in done:
+                stats["skipped"] += 1
+                continue
+            if limit is not None and submitted >= limit:
+                break
+            futures.add(pool.submit(score_record, record, roles))
+            submitted += 1
+            futures = _drain(futures, window)
+        _drain(futures, 0)
+
+    sink.close()
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", required=True, help="Directory of PDF/DOCX/TXT, a .jsonl file, or '-' for stdin")
+    parser.add_argument("--output", required=True, type=Path, help="JSONL file, or directory for --format parquet")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--role", action="append", default=[], help="Target role to fit against (repeatable)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--part-size", type=int, default=10_000, help="Rows per Parquet part file")
+    parser.add_argument("--limit", type=int, help="Score at most this many new records")
+    args = parser.parse_args(argv)
+
+    if args.format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("Parquet output needs pyarrow (pip install pyarrow)")
+            return 1
+        sink = ParquetSink(args.output, args.part_size)
+    else:
+        sink = JsonlSink(args.output)
+
+    stats = run(args.input, sink, args.role, args.workers, args.executor, args.limit)
+    print(json.dumps(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
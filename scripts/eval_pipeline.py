@@ -1,48 +1,277 @@
+"""
+Pipeline Evaluation
+
+Scores the extractor and role matcher against a labelled gold set, in
+parallel, and reports accuracy next to latency so both can be tuned together.
+
+Gold set: a JSON list or JSONL file of
+    {"id", "text", "expected_skills": [...], "expected_role"?: str}
+
+Report (per parameter configuration):
+- skills: micro precision / recall / F1, plus per skill and per expected role
+- roles:  top-1 accuracy and per-role precision / recall / F1, where the
+          predicted role is the best calculate_role_fit score over the catalog
+- latency: end-to-end and per-stage p50 / p95 (request-trace spans)
+
+Every profile runs cold: the sentence and phrase-embedding caches are
+cleared first, so no configuration is timed on results cached by an earlier
+one (--warm-caches keeps them).
+
+Sweeps override settings per run, e.g. the semantic-matching threshold:
+    python scripts/eval_pipeline.py --sweep SKILL_MATCH_THRESHOLD=0.6,0.7,0.75,0.8
+
+Usage:
+    python scripts/eval_pipeline.py
+    python scripts/eval_pipeline.py --gold gold.jsonl --workers 8 --output eval_report.json
+"""
+
+import argparse
+import itertools
 import json
-import sys
+import logging
 import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Add parent directory to path so imports work
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from nlp.nlp_engine import analyze_text
-# We need keywords to force extraction since our extractor depends on them?
-# extract_skills_with_evidence requires keywords.
-# In app.py we load them from ontology. We must do same here.
-from intelligence.ontology import normalize_skills, DATA_PATH as ONTOLOGY_PATH
-
-def run_eval():
-    # Load canned profiles
-    with open("data/demo_profiles.json", "r") as f:
-        profiles = json.load(f)
-        
-    with open(ONTOLOGY_PATH, "r") as f:
-        ontology = json.load(f)
-    keywords = list(ontology.keys())
-    
-    total_profiles = len(profiles)
-    passed_profiles = 0
-    
-    print(f"📉 Starting Evaluation on {total_profiles} profiles...\n")
-    
-    for p in profiles:
-        print(f"Analyzing profile: {p['id']}...")
-        result = analyze_text(p['text'], keywords)
-        
-        # result['skills'] is List[Dict] e.g. [{'name': 'python', 'evidence': ...}]
-        extracted = set([s['name'].lower() for s in result['skills']])
-        expected = set([s.lower() for s in p['expected_skills']])
-        
-        # Calculate Recall (How many expected skills did we find?)
-        intersection = extracted.intersection(expected)
-        recall = len(intersection) / len(expected) if len(expected) > 0 else 0
-        
-        print(f"  - Recall: {recall:.2f}")
-        
-        if recall >= 0.5:
-            passed_profiles += 1
-            
-    print(f"\n✅ Evaluation Complete. Pass Rate: {passed_profiles}/{total_profiles}")
+from benchmarks.harness import latency_stats
+from config import settings
+from utils.logging_config import logger, setup_worker_logging
+
+DEFAULT_GOLD = settings.DATA_DIR / "demo_profiles.json"
+
+# Set once per worker by _init_worker
+_WORKER_KEYWORDS: List[str] = []
+
+
+# --- Input ---
+
+def load_gold(path: Path) -> List[Dict[str, Any]]:
+    """Gold profiles from a JSON list or a JSONL file."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def parse_sweep(specs: Iterable[str]) -> List[Dict[str, Any]]:
+    """["A=1,2", "B=x"] -> [{"A": 1, "B": "x"}, {"A": 2, "B": "x"}]; [{}] when empty."""
+    axes = []
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if not values:
+            raise ValueError(f"Sweep must look like NAME=v1,v2: {spec!r}")
+        axes.append([(name.strip(), _coerce(v.strip())) for v in values.split(",")])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+
+def _coerce(value: str) -> Any:
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+# --- Metrics ---
+
+def prf(tp: int, fp: int, fn: int) -> Dict[str, float]:
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": round(precision, 4), "recall": round(recall, 4), "f1": round(f1, 4),
+        "tp": tp, "fp": fp, "fn": fn,
+    }
+
+
+def _counts(pairs: Iterable[Tuple[set, set]]) -> Tuple[int, int, int]:
+    tp = fp = fn = 0
+    for predicted, expected in pairs:
+        tp += len(predicted & expected)
+        fp += len(predicted - expected)
+        fn += len(expected - predicted)
+    return tp, fp, fn
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate per-profile results into skill, role and latency metrics."""
+    ok = [r for r in results if not r["error"]]
+    pairs = [(set(r["predicted_skills"]), set(r["expected_skills"])) for r in ok]
+
+    # Per skill: one-vs-rest counts over every profile
+    per_skill = {}
+    for skill in sorted(set().union(*(p | e for p, e in pairs)) if pairs else ()):
+        per_skill[skill] = prf(*_counts(({skill} & p, {skill} & e) for p, e in pairs))
+
+    # Skill extraction quality grouped by the profile's expected role
+    by_role = defaultdict(list)
+    for r, pair in zip(ok, pairs):
+        by_role[r.get("expected_role") or "(unlabelled)"].append(pair)
+    skills_by_role = {role: prf(*_counts(p)) for role, p in sorted(by_role.items())}
+
+    # Role prediction as single-label classification
+    labelled = [r for r in ok if r.get("expected_role")]
+    role_names = sorted({r["expected_role"] for r in labelled} | {r["predicted_role"] for r in labelled if r["predicted_role"]})
+    per_role = {
+        role: prf(
+            sum(1 for r in labelled if r["predicted_role"] == role and r["expected_role"] == role),
+            sum(1 for r in labelled if r["predicted_role"] == role and r["expected_role"] != role),
+            sum(1 for r in labelled if r["predicted_role"] != role and r["expected_role"] == role),
+        )
+        for role in role_names
+    }
+    correct = sum(1 for r in labelled if r["predicted_role"] == r["expected_role"])
+
+    stages = defaultdict(list)
+    for r in ok:
+        for stage, ms in r["stage_ms"].items():
+            stages[stage].append(ms / 1000)
+
+    return {
+        "profiles": len(results),
+        "errors": len(results) - len(ok),
+        "skills": {"micro": prf(*_counts(pairs)), "per_skill": per_skill, "per_role": skills_by_role},
+        "roles": {
+            "accuracy": round(correct / len(labelled), 4) if labelled else None,
+            "per_role": per_role,
+        },
+        "latency": {
+            "total": latency_stats([r["total_ms"] / 1000 for r in ok]),
+            "stages": {stage: latency_stats(samples) for stage, samples in sorted(stages.items())},
+        },
+    }
+
+
+# --- Worker ---
+
+def _init_worker() -> None:
+    """Load models once per worker process, before the first profile arrives."""
+    global _WORKER_KEYWORDS
+    from intelligence.ontology import get_canonical_skills
+    from nlp.model_loader import get_spacy_pipeline, get_embedding_model
+    from nlp.skill_extractor import prime_ontology_embeddings
+
+    # Forked workers inherit a queue handler whose listener thread stayed in the parent
+    setup_worker_logging()
+    # Per-request trace logs would drown the report
+    logging.getLogger("career_nlp").setLevel(logging.WARNING)
+    _WORKER_KEYWORDS = get_canonical_skills()
+    get_spacy_pipeline()
+    get_embedding_model()
+    prime_ontology_embeddings(_WORKER_KEYWORDS)
+
+
+def evaluate_profile(profile: Dict[str, Any], params: Dict[str, Any], warm_caches: bool = False) -> Dict[str, Any]:
+    """Run one gold profile under `params` (settings overrides). Never raises."""
+    from nlp.nlp_engine import analyze_text, clear_analysis_caches
+    from intelligence.ontology import get_canonical_skills
+    from intelligence.role_matcher import LOCAL_ROLES, calculate_role_fit
+    from utils.tracing import request_trace
+
+    # Configurations run one at a time, so every in-flight profile shares these values
+    for name, value in params.items():
+        setattr(settings, name, value)
+
+    result: Dict[str, Any] = {
+        "id": profile.get("id"),
+        "expected_skills": sorted({s.lower() for s in profile.get("expected_skills", [])}),
+        "expected_role": profile.get("expected_role"),
+        "predicted_skills": [], "predicted_role": None, "stage_ms": {}, "total_ms": 0.0, "error": None,
+    }
+    try:
+        if not warm_caches:
+            clear_analysis_caches()
+        with request_trace("eval") as trace:
+            signals = analyze_text(profile["text"], _WORKER_KEYWORDS or get_canonical_skills())
+        if signals.get("error"):
+            raise RuntimeError(signals["error"])
+        result["total_ms"] = trace.summary()["duration_ms"]
+        result["stage_ms"] = {s["stage"]: s["duration_ms"] for s in trace.spans if s["depth"] == 1}
+        skills = signals["skills_raw"]
+        result["predicted_skills"] = sorted({s.lower() for s in skills})
+
+        # Catalog roles only: an unknown role would trigger an LLM baseline call
+        fits = {role: calculate_role_fit(skills, role, signals["confidence_score"]).get("score", 0.0) for role in LOCAL_ROLES}
+        if fits:
+            result["predicted_role"] = max(fits, key=fits.get)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+# --- Driver ---
+
+def evaluate(
+    profiles: List[Dict[str, Any]],
+    sweep: Optional[List[Dict[str, Any]]] = None,
+    workers: int = 1,
+    executor: str = "process",
+    warm_caches: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    One report per parameter configuration, all on a single worker pool.
+
+    Models stay loaded across configurations; the analysis caches are cleared
+    before each profile unless `warm_caches`. With the thread executor the
+    caches are shared, so a clear can also hit another in-flight profile.
+    """
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    reports = []
+    with pool_cls(max_workers=workers, initializer=_init_worker) as pool:
+        for params in sweep or [{}]:
+            t0 = time.perf_counter()
+            results = list(pool.map(evaluate_profile, profiles, itertools.repeat(params),
+                                    itertools.repeat(warm_caches)))
+            report = {"params": params, **summarize(results), "wall_s": round(time.perf_counter() - t0, 3)}
+            report["failures"] = [
+                {"id": r["id"], "error": r["error"]} if r["error"] else
+                {"id": r["id"], "missed": sorted(set(r["expected_skills"]) - set(r["predicted_skills"])),
+                 "spurious": sorted(set(r["predicted_skills"]) - set(r["expected_skills"]))}
+                for r in results
+                if r["error"] or set(r["predicted_skills"]) != set(r["expected_skills"])
+            ]
+            reports.append(report)
+            logger.info(f"Evaluated {len(profiles)} profiles with {params or 'defaults'} in {report['wall_s']}s")
+    return reports
+
+
+def print_reports(reports: List[Dict[str, Any]]) -> None:
+    print(f"{'params':40s} {'P':>6s} {'R':>6s} {'F1':>6s} {'role acc':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'errors':>7s}")
+    for rep in reports:
+        micro, total = rep["skills"]["micro"], rep["latency"]["total"]
+        acc = rep["roles"]["accuracy"]
+        print(f"{json.dumps(rep['params']) if rep['params'] else 'defaults':40s} "
+              f"{micro['precision']:6.3f} {micro['recall']:6.3f} {micro['f1']:6.3f} "
+              f"{'-' if acc is None else f'{acc:.3f}':>9s} {total['p50_ms']:9.1f} {total['p95_ms']:9.1f} {rep['errors']:7d}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gold", type=Path, default=DEFAULT_GOLD, help="Gold set (.json list or .jsonl)")
+    parser.add_argument("--sweep", action="append", default=[], help="NAME=v1,v2,... settings override grid (repeatable)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--warm-caches", action="store_true",
+                        help="Keep sentence/embedding caches between profiles and configurations")
+    parser.add_argument("--output", type=Path, help="Write the full JSON report here")
+    args = parser.parse_args(argv)
+
+    profiles = load_gold(args.gold)
+    print(f"📉 Evaluating {len(profiles)} profiles from {args.gold}...\n")
+    reports = evaluate(profiles, parse_sweep(args.sweep), args.workers, args.executor, args.warm_caches)
+    print_reports(reports)
+
+    if args.output:
+        args.output.write_text(json.dumps(reports, indent=2))
+        print(f"\nFull report written to {args.output}")
+    return 0
+
 
 if __name__ == "__main__":
-    run_eval()
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Streamlit Launcher
+
+`streamlit run app.py` only executes app.py when a browser opens a session,
+so a worker started that way stays cold (and never writes its ready file)
+until its first user, who then waits on model loading. This launcher starts
+warm-up (utils.warmup) as soon as the server process starts and then hands
+over to Streamlit in the same process, so the models it loads are the ones
+the app uses.
+
+Usage:
+    python scripts/serve_app.py
+    python scripts/serve_app.py --server.port 8502
+"""
+
+import os
+import sys
+
+# Add parent directory to path so imports work
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+from utils.warmup import start_background_warmup
+
+
+def main(argv=None) -> int:
+    from streamlit.web import cli as stcli
+
+    start_background_warmup()
+    args = sys.argv[1:] if argv is None else list(argv)
+    sys.argv = ["streamlit", "run", os.path.join(ROOT, "app.py"), *args]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Service Package
+# Headless HTTP (ASGI) access to the analysis pipeline (run as `python -m service.api`).
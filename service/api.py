@@ -0,0 +1,287 @@
+"""
+Headless Analysis Service
+
+A dependency-free ASGI app exposing the deterministic pipeline to machine
+clients (e.g. the ATS integration) without Streamlit's rerun model:
+
+    POST /v1/analyze          {"text", "skill_keywords"?}
+    POST /v1/normalize        {"skills": [...]}
+    POST /v1/role-fit         {"skills": [...], "role", "confidence_score"?}
+    POST /v1/gap              {"skills": [...], "requirements": [...] | {...}}
+    POST /v1/<op>/batch       {"items": [<request>, ...]}  -> {"results": [...]}
+    GET  /health              readiness (503 until models are warm)
+    GET  /metrics             Prometheus text (utils.tracing)
+
+Models load once at startup (utils.warmup). Pipeline calls run on a bounded
+thread pool (SERVICE_WORKERS); beyond SERVICE_MAX_PENDING in-flight requests
+the service answers 503 instead of queueing without limit.
+
+Run with any ASGI server, or:
+    python -m service.api                 # uvicorn on SERVICE_HOST:SERVICE_PORT
+    LLM_STUB=true python -m service.api   # local Gemini stub, no network
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+from config import settings
+from nlp.records import Record
+from utils.logging_config import logger
+from utils.tracing import count, export_metrics, request_trace
+
+
+# --- Request models ---
+
+class AnalyzeRequest(BaseModel):
+    text: str
+    skill_keywords: Optional[List[str]] = None  # default: the ontology's canonical skills
+
+
+class NormalizeRequest(BaseModel):
+    skills: List[str]
+
+
+class RoleFitRequest(BaseModel):
+    skills: List[str]
+    role: str
+    confidence_score: float = 0.0
+
+
+class GapRequest(BaseModel):
+    skills: List[str]
+    requirements: Union[List[str], Dict[str, int]]
+
+
+class BatchRequest(BaseModel):
+    items: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+# --- Handlers (run on the worker pool; imports deferred until models are needed) ---
+
+def _analyze(req: AnalyzeRequest) -> Dict[str, Any]:
+    from nlp.nlp_engine import analyze_text
+    from intelligence.ontology import get_canonical_skills
+    keywords = req.skill_keywords if req.skill_keywords is not None else get_canonical_skills()
+    return analyze_text(req.text[:settings.EXTRACT_MAX_CHARS], keywords)
+
+
+def _normalize(req: NormalizeRequest) -> Dict[str, Any]:
+    from intelligence.ontology import normalize_skills
+    return {"skills": normalize_skills(req.skills)}
+
+
+def _role_fit(req: RoleFitRequest) -> Dict[str, Any]:
+    from intelligence.role_matcher import calculate_role_fit
+    return calculate_role_fit(req.skills, req.role, req.confidence_score)
+
+
+def _gap(req: GapRequest) -> Dict[str, Any]:
+    from intelligence.gap_analysis import gap_analysis
+    return {"missing": gap_analysis(req.skills, req.requirements)}
+
+
+OPERATIONS: Dict[str, Tuple[Type[BaseModel], Callable[[Any], Dict[str, Any]]]] = {
+    "analyze": (AnalyzeRequest, _analyze),
+    "normalize": (NormalizeRequest, _normalize),
+    "role-fit": (RoleFitRequest, _role_fit),
+    "gap": (GapRequest, _gap),
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, detail: Any):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class AnalysisService:
+    """The ASGI application. One instance per process; holds the worker pool."""
+
+    def __init__(self, workers: int = None, max_pending: int = None, warm: bool = True):
+        self.workers = workers or settings.SERVICE_WORKERS
+        self.max_pending = max_pending or settings.SERVICE_MAX_PENDING
+        self.warm = warm
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="service")
+        return self._pool
+
+    # --- ASGI entry point ---
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self.warm:
+                    # Load models once, off the event loop; /health reports when done
+                    from utils.warmup import start_background_warmup
+                    start_background_warmup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        method, path = scope["method"], scope["path"].rstrip("/")
+        try:
+            if method == "GET" and path == "/health":
+                status, body = self._health()
+            elif method == "GET" and path == "/metrics":
+                await _send(send, 200, export_metrics("prometheus").encode(), b"text/plain; version=0.0.4")
+                return
+            elif method == "POST" and path.startswith("/v1/"):
+                status, body = 200, await self._dispatch(path[len("/v1/"):], await _read_body(receive))
+            else:
+                raise HTTPError(404, f"No route for {method} {path}")
+        except HTTPError as e:
+            status, body = e.status, {"error": e.detail}
+        except Exception as e:
+            logger.exception(f"Unhandled error serving {method} {path}")
+            status, body = 500, {"error": str(e)}
+        count("service_requests_total", path=path, status=str(status))
+        await _send(send, status, json.dumps(body, default=_json_default).encode())
+
+    def _health(self) -> Tuple[int, Dict[str, Any]]:
+        from utils.warmup import is_ready, warmup_status
+        if not self.warm:
+            return 200, {"status": "ok", "ready": True}
+        ready = is_ready()
+        return (200 if ready else 503), {"status": "ok" if ready else "warming", "ready": ready, "warmup": warmup_status()}
+
+    async def _dispatch(self, route: str, payload: Any) -> Dict[str, Any]:
+        op, _, suffix = route.partition("/")
+        if op not in OPERATIONS or suffix not in ("", "batch"):
+            raise HTTPError(404, f"Unknown operation: {route}")
+        model, handler = OPERATIONS[op]
+
+        if suffix == "batch":
+            batch = _validate(BatchRequest, payload)
+            max_batch = min(settings.SERVICE_MAX_BATCH, self.max_pending)
+            if len(batch.items) > max_batch:
+                raise HTTPError(413, f"Batch exceeds {max_batch} items")
+            requests = [_validate(model, item) for item in batch.items]
+            # Every item takes an admission slot, so batching can't bypass load shedding
+            with self._admit(op, len(requests)):
+                loop = asyncio.get_running_loop()
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(self.pool, _traced_call, op, handler, r) for r in requests),
+                    return_exceptions=True,
+                )
+            return {"results": [_batch_result(r) for r in results]}
+
+        with self._admit(op):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.pool, _traced_call, op, handler, _validate(model, payload))
+
+    @contextmanager
+    def _admit(self, op: str, items: int = 1):
+        """Count `items` in-flight requests, shedding load past max_pending."""
+        with self._pending_lock:
+            if self._pending + items > self.max_pending:
+                count("service_rejected_total", op=op)
+                raise HTTPError(503, "Service busy, retry later")
+            self._pending += items
+        try:
+            yield
+        finally:
+            with self._pending_lock:
+                self._pending -= items
+
+
+def _traced_call(op: str, handler: Callable, request: BaseModel) -> Dict[str, Any]:
+    with request_trace(f"service_{op}"):
+        return handler(request)
+
+
+def _validate(model: Type[BaseModel], payload: Any) -> BaseModel:
+    try:
+        return model.model_validate(payload)
+    except ValidationError as e:
+        raise HTTPError(422, json.loads(e.json()))
+
+
+def _batch_result(result: Any) -> Dict[str, Any]:
+    if isinstance(result, Exception):
+        return {"error": str(result), "status": 500}
+    return result
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, "tolist"):  # numpy scalars / arrays
+        return obj.tolist()
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    return str(obj)
+
+
+async def _read_body(receive) -> Any:
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > settings.SERVICE_MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            break
+    try:
+        return json.loads(b"".join(chunks) or b"{}")
+    except json.JSONDecodeError as e:
+        raise HTTPError(400, f"Invalid JSON: {e}")
+
+
+async def _send(send, status: int, body: bytes, content_type: bytes = b"application/json"):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+app = AnalysisService()
+
+
+def main(argv=None) -> int:
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve the analysis pipeline over HTTP.")
+    parser.add_argument("--host", default=settings.SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVICE_PORT)
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        logger.error("uvicorn is not installed (pip install uvicorn); or point any ASGI server at service.api:app")
+        return 1
+    # One process: models load once and the worker pool bounds concurrency
+    uvicorn.run(app, host=args.host, port=args.port, workers=1, log_config=None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+from benchmarks.harness import compare, latency_stats, measure, percentile, synthetic_resume, WORDS_PER_PAGE
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_latency_stats_units_and_throughput():
+    stats = latency_stats([0.01, 0.02, 0.03], items_per_call=10)
+    assert stats["n"] == 3
+    assert stats["p50_ms"] == 20.0
+    assert stats["mean_ms"] == 20.0
+    assert stats["throughput_per_s"] == 500.0
+
+
+def test_measure_runs_setup_before_each_timed_call():
+    calls = []
+    stats = measure(lambda: calls.append("fn"), repeats=2, warmup=1, setup=lambda: calls.append("setup"))
+    assert calls == ["fn", "setup", "fn", "setup", "fn"]
+    assert stats["n"] == 2
+
+
+def test_synthetic_resume_is_deterministic_and_sized():
+    skills = ["Python", "Docker", "SQL"]
+    a = synthetic_resume(2, skills, seed=7)
+    assert a == synthetic_resume(2, skills, seed=7)
+    assert len(a.split()) >= 2 * WORDS_PER_PAGE
+    assert "Python" in a and "@" in a
+
+
+def test_compare_flags_only_regressions():
+    baseline = {"_meta": {"python": "3.11"}, "case": {"p50_ms": 10.0, "p95_ms": 20.0, "peak_rss_mb": 100.0}}
+    ok = {"case": {"p50_ms": 11.0, "p95_ms": 22.0, "peak_rss_mb": 105.0}, "new_case": {"p50_ms": 1.0}}
+    assert compare(ok, baseline, tolerance=0.25, rss_tolerance=0.1) == []
+
+    slow = {"case": {"p50_ms": 14.0, "p95_ms": 20.0, "peak_rss_mb": 120.0}}
+    problems = compare(slow, baseline, tolerance=0.25, rss_tolerance=0.1)
+    assert len(problems) == 2
+    assert any("p50_ms" in p for p in problems) and any("peak_rss_mb" in p for p in problems)
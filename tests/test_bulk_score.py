@@ -0,0 +1,30 @@
+import json
+from scripts import bulk_score
+from scripts.bulk_score import JsonlSink, iter_records, run
+
+def _fake_score(record, roles):
+    return {"id": record["id"], "skills": [record["text"].title()], "error": None}
+
+def test_jsonl_run_is_resumable(tmp_path, monkeypatch):
+    monkeypatch.setattr(bulk_score, "_init_worker", lambda: None)
+    monkeypatch.setattr(bulk_score, "score_record", _fake_score)
+    src = tmp_path / "in.jsonl"
+    src.write_text("\n".join(json.dumps({"id": str(i), "text": "python"}) for i in range(5)))
+    out = tmp_path / "out.jsonl"
+
+    stats = run(str(src), JsonlSink(out), [], workers=2, executor="thread", limit=3)
+    assert stats["scored"] == 3
+    # Simulate a crash mid-write, then resume
+    with open(out, "a") as f:
+        f.write('{"id": "3", "ski')
+    stats = run(str(src), JsonlSink(out), [], workers=2, executor="thread")
+    assert stats == {"scored": 2, "failed": 0, "skipped": 3}
+    ids = [json.loads(line)["id"] for line in out.read_text().splitlines()]
+    assert sorted(ids) == ["0", "1", "2", "3", "4"]
+
+def test_directory_input(tmp_path):
+    (tmp_path / "a.txt").write_text("x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.pdf").write_bytes(b"%PDF")
+    (tmp_path / "notes.md").write_text("ignored")
+    assert [r["id"] for r in iter_records(str(tmp_path))] == ["a.txt", "sub/b.pdf"]
@@ -0,0 +1,52 @@
+import itertools
+
+import numpy as np
+
+from nlp.confidence import CLASS_LABELS, HedgingTrace, analyze_hedging, classify_sentences
+from nlp.sentence_features import FeatureTable
+
+
+def _scalar_rule(actions, hedges, passive):
+    # The original per-sentence if/elif chain
+    if actions >= 2:
+        label, score = "assertive", 1.5
+    elif actions == 1 and hedges == 0:
+        label, score = "neutral", 0.5
+    elif hedges > 0:
+        label, score = "hedged", -1.0
+    else:
+        label, score = "neutral", 0.5
+    return label, score - (0.3 if passive else 0.0)
+
+
+def test_vectorized_classification_matches_scalar_rules():
+    grid = list(itertools.product(range(4), range(3), (False, True)))
+    actions, hedges, passive = (np.array(col) for col in zip(*grid))
+    codes, scores = classify_sentences(actions, hedges, passive)
+    for (a, h, p), code, score in zip(grid, codes, scores):
+        label, expected = _scalar_rule(a, h, p)
+        assert CLASS_LABELS[code] == label
+        assert abs(score - expected) < 1e-9
+
+
+def test_score_markers_and_lazy_trace():
+    sentences = ["Built and deployed APIs.", "Familiar with basic SQL.", "Tests were automated."]
+    features = FeatureTable.from_sentences(sentences)
+    result = analyze_hedging(" ".join(sentences), features=features)
+    # (1.5 - 1.0 + 0.2) / 3 -> normalized (raw + 1) / 2.5
+    assert result["score"] == round(((1.5 - 1.0 + 0.2) / 3 + 1.0) / 2.5, 3)
+    assert result["markers"] == ["familiar with"]
+
+    trace = result["trace"]
+    assert isinstance(trace, HedgingTrace) and trace._rows is None
+    assert len(trace) == 3 and trace._rows is None  # length needs no rows
+    assert [row["classification"] for row in trace] == ["assertive", "hedged", "neutral"]
+    assert trace[2].to_dict() == {
+        "sentence": "Tests were automated.", "classification": "neutral",
+        "action_verbs": 0, "hedge_markers": 0, "has_passive": True, "score": 0.2,
+    }
+    assert trace.tolist() == [row.to_dict() for row in trace]
+
+
+def test_empty_text():
+    assert analyze_hedging("") == {"score": 0.0, "markers": [], "trace": []}
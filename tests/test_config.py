@@ -1,5 +1,4 @@
 import os
-import pytest
 from pathlib import Path
 from config import Settings
 
@@ -15,10 +14,11 @@ def test_settings_defaults():
     assert isinstance(settings.BASE_DIR, Path)
     assert isinstance(settings.LOG_DIR, Path)
 
-def test_missing_api_key():
-    # Unset critical key and verify error
+def test_missing_api_key_is_allowed():
+    # Offline backends (stub / replay) run without a key; only live calls need one
     if "GEMINI_API_KEY" in os.environ:
         del os.environ["GEMINI_API_KEY"]
-        
-    with pytest.raises(Exception): # Pydantic validation error or similar
-        Settings()
+
+    settings = Settings(_env_file=None)
+    assert settings.GEMINI_API_KEY is None
+    assert settings.LLM_BACKEND == "gemini"
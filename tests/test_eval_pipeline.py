@@ -0,0 +1,62 @@
+from scripts import eval_pipeline
+from scripts.eval_pipeline import evaluate, parse_sweep, prf, summarize
+
+
+def _result(pid, predicted, expected, role=None, predicted_role=None):
+    return {
+        "id": pid, "predicted_skills": predicted, "expected_skills": expected,
+        "expected_role": role, "predicted_role": predicted_role,
+        "stage_ms": {"preprocess": 1.0, "skill_extraction": 4.0}, "total_ms": 6.0, "error": None,
+    }
+
+
+def test_prf_handles_empty_counts():
+    assert prf(0, 0, 0)["f1"] == 0.0
+    m = prf(tp=3, fp=1, fn=2)
+    assert (m["precision"], m["recall"], m["f1"]) == (0.75, 0.6, 0.6667)
+
+
+def test_parse_sweep_builds_grid():
+    assert parse_sweep([]) == [{}]
+    grid = parse_sweep(["SKILL_MATCH_THRESHOLD=0.7,0.8", "DEBUG=true"])
+    assert grid == [
+        {"SKILL_MATCH_THRESHOLD": 0.7, "DEBUG": True},
+        {"SKILL_MATCH_THRESHOLD": 0.8, "DEBUG": True},
+    ]
+
+
+def test_summarize_per_skill_and_per_role():
+    results = [
+        _result("a", ["python", "sql"], ["python", "docker"], "Backend Engineer", "Backend Engineer"),
+        _result("b", ["react"], ["react", "css"], "Frontend Engineer", "Backend Engineer"),
+    ]
+    rep = summarize(results)
+    assert rep["skills"]["micro"]["tp"] == 2 and rep["skills"]["micro"]["fp"] == 1 and rep["skills"]["micro"]["fn"] == 2
+    assert rep["skills"]["per_skill"]["python"]["f1"] == 1.0
+    assert rep["skills"]["per_skill"]["sql"]["precision"] == 0.0
+    assert rep["skills"]["per_role"]["Frontend Engineer"]["recall"] == 0.5
+    assert rep["roles"]["accuracy"] == 0.5
+    assert rep["roles"]["per_role"]["Backend Engineer"]["precision"] == 0.5
+    assert rep["roles"]["per_role"]["Frontend Engineer"]["recall"] == 0.0
+    assert rep["latency"]["stages"]["skill_extraction"]["p50_ms"] == 4.0
+
+
+def test_evaluate_runs_each_sweep_configuration(monkeypatch):
+    seen = []
+
+    def fake_profile(profile, params, warm_caches):
+        assert warm_caches is False
+        seen.append(params["SKILL_MATCH_THRESHOLD"])
+        predicted = ["python"] if params["SKILL_MATCH_THRESHOLD"] > 0.7 else ["python", "sql"]
+        return _result(profile["id"], predicted, ["python"])
+
+    monkeypatch.setattr(eval_pipeline, "_init_worker", lambda: None)
+    monkeypatch.setattr(eval_pipeline, "evaluate_profile", fake_profile)
+    profiles = [{"id": str(i), "text": "x"} for i in range(4)]
+
+    reports = evaluate(profiles, parse_sweep(["SKILL_MATCH_THRESHOLD=0.6,0.8"]), workers=2, executor="thread")
+    assert [r["params"]["SKILL_MATCH_THRESHOLD"] for r in reports] == [0.6, 0.8]
+    assert reports[0]["skills"]["micro"]["precision"] == 0.5
+    assert reports[1]["skills"]["micro"]["f1"] == 1.0 and reports[1]["failures"] == []
+    assert len(reports[0]["failures"]) == 4
+    assert sorted(seen) == [0.6] * 4 + [0.8] * 4
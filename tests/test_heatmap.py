@@ -0,0 +1,20 @@
+from visualization.heatmap import find_annotations, render_resume_heatmap
+
+def test_single_scan_annotations():
+    text = "Led a team. Deployed Python and C++ services; familiar with Go."
+    spans = [(text[s:e], kind) for s, e, kind in find_annotations(text, ["Python", "C++", "Go"])]
+    assert spans == [
+        ("Led", "power"), ("Deployed", "power"), ("Python", "skill"),
+        ("C++", "skill"), ("familiar with", "fluff"), ("Go", "skill"),
+    ]
+
+def test_overlaps_and_precomputed_spans():
+    text = "Built Python services"
+    # Precomputed NLP span covers "Python services"; the scanned "Python" overlaps it
+    anns = find_annotations(text, ["Python"], skill_spans=[(6, 21)])
+    assert anns == [(6, 21, "skill")]
+
+def test_markup_is_escaped_and_not_rematched():
+    html = render_resume_heatmap("<b>Python</b> & span", ["Python", "span"])
+    assert "&lt;b&gt;" in html and "&amp;" in html
+    assert html.count("<span ") == 2
@@ -0,0 +1,81 @@
+import os
+import threading
+import pytest
+from utils import jobs
+from utils.jobs import JobQueue, DONE, FAILED, CANCELLED
+
+RELEASE = threading.Event()
+
+def echo(value):
+    return {"value": value}
+
+def blocked(value):
+    RELEASE.wait(5)
+    return {"value": value}
+
+def boom():
+    raise RuntimeError("quota exceeded")
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setitem(jobs.JOB_TYPES, "echo", "tests.test_jobs:echo")
+    monkeypatch.setitem(jobs.JOB_TYPES, "blocked", "tests.test_jobs:blocked")
+    monkeypatch.setitem(jobs.JOB_TYPES, "boom", "tests.test_jobs:boom")
+    RELEASE.clear()
+    return JobQueue(tmp_path / "jobs.sqlite3", workers=1)
+
+def test_job_result_is_persisted(queue, tmp_path):
+    job_id = queue.submit("echo", value=42)
+    assert queue.wait(job_id, timeout=5)["result"] == {"value": 42}
+    # A fresh queue on the same store (e.g. after a restart) still sees it
+    assert JobQueue(tmp_path / "jobs.sqlite3", workers=1).get(job_id)["status"] == DONE
+
+def test_failed_job_records_error(queue):
+    job = queue.wait(queue.submit("boom"), timeout=5)
+    assert job["status"] == FAILED and "quota" in job["error"]
+
+def test_cancel_queued_and_running(queue):
+    running = queue.submit("blocked", value=1)
+    queued = queue.submit("echo", value=2)
+    assert queue.cancel(queued)
+    assert queue.cancel(running)
+    RELEASE.set()
+    assert queue.wait(running, timeout=5)["status"] == CANCELLED
+    assert queue.get(running)["result"] is None
+    assert queue.get(queued)["status"] == CANCELLED
+    assert not queue.cancel(running)
+
+def test_restart_only_reaps_jobs_of_dead_processes(queue, tmp_path):
+    live = queue.submit("blocked", value=1)
+    with queue._connect() as conn:
+        conn.execute("INSERT INTO jobs (id, kind, status, params, created_at, updated_at, owner) "
+                     "VALUES ('dead', 'echo', 'running', '{}', 0, 0, ?)", (f"{jobs.socket.gethostname()}:{2**22 + 1}:x",))
+        conn.execute("INSERT INTO jobs (id, kind, status, params, created_at, updated_at) "
+                     "VALUES ('legacy', 'echo', 'queued', '{}', 0, 0)")
+    # A second process / session opening the same store
+    other = JobQueue(tmp_path / "jobs.sqlite3", workers=1)
+    assert other.get("dead")["status"] == FAILED
+    assert other.get("legacy")["status"] == FAILED
+    assert other.get(live)["status"] in ("queued", "running")
+    RELEASE.set()
+    assert queue.wait(live, timeout=5)["status"] == DONE
+
+def test_owner_liveness():
+    assert jobs.owner_alive(jobs.process_owner())
+    assert not jobs.owner_alive(None)
+    pid_reused = f"{jobs.socket.gethostname()}:{jobs.os.getpid()}:stale"
+    assert not jobs.owner_alive(pid_reused)
+    assert jobs.owner_alive("other-host:1:x")
+
+
+@pytest.mark.skipif(jobs.process_start_time(os.getppid()) is None, reason="needs /proc")
+def test_reused_pid_of_another_process_is_dead():
+    host, parent = jobs.socket.gethostname(), os.getppid()
+    started = jobs.process_start_time(parent)
+    assert jobs.owner_alive(f"{host}:{parent}:{started}")
+    # Same live PID, different start time: an earlier process that used this PID
+    assert not jobs.owner_alive(f"{host}:{parent}:{started - 1}")
+
+def test_unknown_kind_rejected(queue):
+    with pytest.raises(ValueError):
+        queue.submit("nope")
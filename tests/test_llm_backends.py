@@ -0,0 +1,83 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from config import settings
+from utils import llm_backends
+from utils.llm_backends import FaultInjector, LLMBackend, ReplayBackend, ReplayMiss, get_llm_backend
+
+
+class _Live:
+    model_name = "live"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(text=f'{{"echo": "{prompt}"}}')
+
+
+def test_record_then_replay(tmp_path):
+    live = _Live()
+    recorder = ReplayBackend(tmp_path, "gemini-test", inner=live)
+    assert recorder.generate_content("python?").text == '{"echo": "python?"}'
+    assert live.calls == 1
+
+    replay = ReplayBackend(tmp_path, "gemini-test")
+    assert replay.generate_content("python?").text == '{"echo": "python?"}'
+    with pytest.raises(ReplayMiss):
+        replay.generate_content("never recorded")
+    # Recordings are keyed by model too
+    with pytest.raises(ReplayMiss):
+        ReplayBackend(tmp_path, "other-model").generate_content("python?")
+
+
+def test_replay_miss_can_fall_back_to_stub(tmp_path):
+    replay = ReplayBackend(tmp_path, "m", on_miss="stub")
+    assert replay.generate_content('Return JSON like {"skill": "Python"}').text == '{"skill": "Python"}'
+
+
+def test_fault_injection_is_seeded_and_shaped_like_real_errors():
+    def outcomes(seed):
+        inj = FaultInjector(_Live(), failure_rate=0.2, quota_rate=0.1, rng=random.Random(seed))
+        seen = []
+        for _ in range(200):
+            try:
+                inj.generate_content("x")
+                seen.append("ok")
+            except RuntimeError as e:
+                seen.append("quota" if "429" in str(e) else "error")
+        return seen
+
+    first = outcomes(3)
+    assert first == outcomes(3)
+    assert 5 < first.count("quota") < 40 and 15 < first.count("error") < 70
+
+
+def test_factory_selects_backend(tmp_path, monkeypatch):
+    live = _Live()
+    for name, value in {
+        "LLM_STUB": False, "LLM_BACKEND": "replay", "LLM_MODEL": "m", "LLM_REPLAY_DIR": tmp_path,
+        "LLM_REPLAY_ON_MISS": "error", "LLM_INJECT_LATENCY_S": 0.0, "LLM_INJECT_JITTER_S": 0.0,
+        "LLM_INJECT_FAILURE_RATE": 0.0, "LLM_INJECT_QUOTA_RATE": 0.0,
+    }.items():
+        monkeypatch.setattr(settings, name, value, raising=False)
+
+    assert isinstance(get_llm_backend(lambda: live), ReplayBackend)
+    assert live.calls == 0 and not llm_backends.needs_api_key()
+
+    monkeypatch.setattr(settings, "LLM_BACKEND", "gemini")
+    assert get_llm_backend(lambda: live) is live and llm_backends.needs_api_key()
+
+    monkeypatch.setattr(settings, "LLM_INJECT_LATENCY_S", 0.001)
+    wrapped = get_llm_backend(lambda: live)
+    assert isinstance(wrapped, FaultInjector) and wrapped.inner is live
+    # Structural: the live model (or any object with the surface) needs no base class
+    assert isinstance(live, LLMBackend) and isinstance(wrapped, LLMBackend)
+    assert not isinstance(object(), LLMBackend)
+
+    monkeypatch.setattr(settings, "LLM_BACKEND", "bogus")
+    with pytest.raises(ValueError):
+        get_llm_backend(lambda: live)
@@ -0,0 +1,166 @@
+import io
+import zipfile
+import pytest
+from utils import loaders
+from utils.loaders import (
+    iter_pdf_pages, needs_layout_extraction, spooled_upload, check_docx_archive, UploadRejected,
+    extract_resume_document, parse_pdf_with_offsets,
+)
+from utils.text_cache import ExtractedText, ExtractionCache
+
+GOOD_PAGE = "Built REST APIs using Python and deployed them on AWS with Docker. " * 8
+
+def _fake_extractor(monkeypatch, text_layer, layout):
+    """Patch page access so tests don't need real PDFs."""
+    def pypdf_page(self, i):
+        value = text_layer[i]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def pdfplumber_page(self, i):
+        value = layout[i]
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    monkeypatch.setattr(loaders._PageExtractor, "pypdf_page", pypdf_page)
+    monkeypatch.setattr(loaders._PageExtractor, "pdfplumber_page", pdfplumber_page)
+    monkeypatch.setattr(loaders._PageExtractor, "page_count", lambda self: len(text_layer))
+
+def test_quality_gate():
+    assert not needs_layout_extraction(GOOD_PAGE)
+    assert needs_layout_extraction("Too short")
+    assert needs_layout_extraction("BuiltRESTAPIsusingPythonanddeployedthem " * 40)
+    assert needs_layout_extraction("#$%&*@!^ " * 100)
+
+def test_fast_path_and_escalation(monkeypatch):
+    _fake_extractor(
+        monkeypatch,
+        text_layer=[GOOD_PAGE, "garbled", ValueError("no text layer")],
+        layout=["unused", "layout page 2", "layout page 3"],
+    )
+    pages = list(iter_pdf_pages(b"%PDF", max_pages=10, page_timeout=5))
+    assert pages == [GOOD_PAGE, "layout page 2", "layout page 3"]
+
+def test_failing_page_keeps_text_layer(monkeypatch):
+    _fake_extractor(monkeypatch, text_layer=["garbled"], layout=[RuntimeError("layout failed")])
+    assert list(iter_pdf_pages(b"%PDF", max_pages=10, page_timeout=5)) == ["garbled"]
+
+def test_page_limit(monkeypatch):
+    _fake_extractor(monkeypatch, text_layer=[GOOD_PAGE] * 5, layout=[""] * 5)
+    assert len(list(iter_pdf_pages(b"%PDF", max_pages=2, page_timeout=5))) == 2
+
+def test_timed_out_page_falls_back_inline_while_pool_is_busy(monkeypatch):
+    import threading
+    release = threading.Event()
+    events = []
+    monkeypatch.setattr(loaders.settings, "PDF_WORKERS", 1)
+    monkeypatch.setattr(loaders, "_PDF_POOL", None)
+
+    def stuck_layout(self, i):
+        release.wait(5)
+        events.append("layout done")
+        return "layout"
+
+    _fake_extractor(monkeypatch, text_layer=["garbled"] * 4, layout=[None] * 4)
+    monkeypatch.setattr(loaders._PageExtractor, "pdfplumber_page", stuck_layout)
+    monkeypatch.setattr(loaders._PageExtractor, "_close_handles", lambda self: events.append("closed"))
+    try:
+        pages = iter_pdf_pages(b"%PDF", max_pages=10, page_timeout=0.2)
+        assert next(pages) == "garbled"  # every worker is stuck in layout analysis
+        pages.close()
+        # The stuck page still reads the document: its handles stay open until it returns
+        assert events == []
+    finally:
+        release.set()
+        pages.close()
+        loaders._PDF_POOL.shutdown(wait=True)
+    assert events == ["layout done", "closed"]
+
+
+def test_time_queued_on_the_pool_does_not_count_against_a_page(monkeypatch):
+    import threading
+    monkeypatch.setattr(loaders.settings, "PDF_WORKERS", 1)
+    monkeypatch.setattr(loaders, "_PDF_POOL", None)
+    _fake_extractor(monkeypatch, text_layer=["garbled"], layout=["layout page"])
+
+    # Another upload holds the only worker for longer than the page timeout
+    busy = threading.Event()
+    loaders._get_pdf_pool().submit(busy.wait, 0.5)
+    try:
+        assert list(iter_pdf_pages(b"%PDF", max_pages=10, page_timeout=0.2)) == ["layout page"]
+    finally:
+        busy.set()
+        loaders._PDF_POOL.shutdown(wait=True)
+
+
+class FakeUpload(io.BytesIO):
+    """Mimics Streamlit's UploadedFile (a BytesIO with name/type/size)."""
+    def __init__(self, data, name="resume.txt", type="text/plain"):
+        super().__init__(data)
+        self.name, self.type, self.size = name, type, len(data)
+
+def test_small_upload_stays_in_memory(monkeypatch):
+    monkeypatch.setattr(loaders.settings, "UPLOAD_SPOOL_THRESHOLD", 1024)
+    with spooled_upload(FakeUpload(b"x" * 100)) as source:
+        assert source == b"x" * 100
+
+def test_large_upload_spools_to_temp_file(monkeypatch):
+    monkeypatch.setattr(loaders.settings, "UPLOAD_SPOOL_THRESHOLD", 1024)
+    with spooled_upload(FakeUpload(b"x" * 5000)) as source:
+        path = source
+        assert path.stat().st_size == 5000
+    assert not path.exists()
+
+def test_oversized_upload_rejected(monkeypatch):
+    monkeypatch.setattr(loaders.settings, "UPLOAD_MAX_BYTES", 10)
+    with pytest.raises(UploadRejected):
+        with spooled_upload(FakeUpload(b"x" * 11)):
+            pass
+
+def test_docx_decompression_bomb_rejected():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("word/document.xml", b"0" * 5_000_000)
+    with pytest.raises(UploadRejected):
+        check_docx_archive(io.BytesIO(buf.getvalue()))
+
+def test_pdf_page_offsets(monkeypatch):
+    _fake_extractor(monkeypatch, text_layer=[GOOD_PAGE, "", GOOD_PAGE], layout=["", "", ""])
+    text, offsets = parse_pdf_with_offsets(b"%PDF", max_chars=10_000)
+    assert offsets == [(1, 0), (3, len(GOOD_PAGE) + 1)]
+    assert text[offsets[1][1]:] == GOOD_PAGE
+
+def test_repeat_upload_skips_parsing(monkeypatch):
+    monkeypatch.setattr(loaders, "EXTRACTION_CACHE", ExtractionCache(8, 10_000))
+    monkeypatch.setattr(loaders.settings, "EXTRACT_MAX_CHARS", 1000)
+    first = extract_resume_document(FakeUpload(b"Python dev, mail me at a@b.com"))
+    assert first.redacted == "Python dev, mail me at [REDACTED_EMAIL]"
+
+    def boom(*args, **kwargs):
+        raise AssertionError("should not parse on a cache hit")
+    monkeypatch.setattr(loaders, "spooled_upload", boom)
+    assert extract_resume_document(FakeUpload(b"Python dev, mail me at a@b.com")) is first
+
+def test_oversized_upload_is_not_hashed(monkeypatch):
+    monkeypatch.setattr(loaders.settings, "UPLOAD_MAX_BYTES", 10)
+    upload = FakeUpload(b"x" * 100)
+    upload.read = lambda *a: pytest.fail("oversized upload was read")
+    assert extract_resume_document(upload) is None
+
+    undeclared = FakeUpload(b"x" * (2 * loaders._COPY_CHUNK))
+    del undeclared.size
+    with pytest.raises(UploadRejected):
+        loaders.file_digest(undeclared, max_bytes=10)
+    assert undeclared.tell() == loaders._COPY_CHUNK  # stopped after the first chunk
+
+def test_cache_eviction_limits():
+    cache = ExtractionCache(max_entries=2, max_chars=100)
+    for digest in "abc":
+        cache.put(ExtractedText(digest, "x" * 10, "x" * 10, ((1, 0),)))
+    assert len(cache) == 2 and cache.get("a") is None
+    cache.put(ExtractedText("big", "x" * 45, "x" * 45, ((1, 0),)))
+    assert cache.total_chars <= 100 and cache.get("big") is not None
+    cache.put(ExtractedText("huge", "x" * 200, "", ((1, 0),)))
+    assert cache.get("huge") is None
@@ -0,0 +1,41 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from utils import logging_config
+from utils.logging_config import setup_logging, setup_worker_logging
+
+NAME = "career_nlp_worker_test"
+
+
+def _init():
+    setup_worker_logging(NAME)
+
+
+def _log(message):
+    logging.getLogger(NAME).error(message)
+    return True
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_forked_worker_records_reach_the_log_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging_config.settings, "LOG_DIR", tmp_path)
+    monkeypatch.setattr(logging_config.settings, "LOG_ASYNC", True)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])  # pytest's capture handlers would short-circuit setup
+    setup_logging(NAME)
+    try:
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx, initializer=_init) as pool:
+            assert pool.submit(_log, "worker failure 42").result(timeout=30)
+        assert "worker failure 42" in (tmp_path / "app.log").read_text()
+    finally:
+        for handler in list(logging.getLogger(NAME).handlers):
+            logging.getLogger(NAME).removeHandler(handler)
+
+
+def test_worker_setup_is_a_no_op_in_the_main_process():
+    logger = logging.getLogger("career_nlp")
+    handlers = list(logger.handlers)
+    assert setup_worker_logging() is logger and logger.handlers == handlers
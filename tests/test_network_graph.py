@@ -0,0 +1,39 @@
+import math
+from visualization import network_graph
+from visualization.network_graph import layout_angles, radial_layout
+
+def _radius(p):
+    return math.hypot(*p)
+
+def test_radial_rings():
+    pos = radial_layout(["Python", "SQL", "Docker"], ["Kubernetes"])
+    assert pos["YOU"] == (0.0, 0.0)
+    assert all(math.isclose(_radius(pos[s]), network_graph.OWNED_RADIUS) for s in ["Python", "SQL", "Docker"])
+    assert math.isclose(_radius(pos["Kubernetes"]), network_graph.MISSING_RADIUS)
+
+def test_layout_is_incremental_from_the_previous_angles():
+    owned = ["Python", "SQL", "Docker", "AWS"]
+    previous = layout_angles(owned, ["Go"])
+    before = radial_layout(owned, ["Go"])
+    assert radial_layout(owned, ["Go"], previous) == before
+    after = radial_layout(owned + ["Git"], ["Go"], previous)
+    # Existing nodes keep their positions when a skill is added
+    for node in ["Python", "SQL", "Docker", "AWS", "Go"]:
+        assert after[node] == before[node]
+    assert all(math.dist(after["Git"], after[n]) > 0.5 for n in ["Python", "SQL", "Docker", "AWS"])
+
+def test_layout_does_not_depend_on_other_sessions():
+    # Another user's graph, laid out just before, must not leak into this one
+    radial_layout(["Go", "Rust", "Git", "Python"], ["Kafka"])
+    first = radial_layout(["Python", "Git"], ["Go"])
+    network_graph._LAYOUT_CACHE.clear()
+    radial_layout(["SQL"], ["Python"])
+    assert radial_layout(["Python", "Git"], ["Go"]) == first
+
+def test_crowded_ring_is_respaced():
+    owned = [f"skill{i}" for i in range(2)]
+    previous = layout_angles(owned, [])
+    pos = radial_layout(owned + [f"skill{i}" for i in range(2, 12)], [], previous)
+    angles = sorted(math.atan2(y, x) % (2 * math.pi) for n, (x, y) in pos.items() if n != "YOU")
+    gaps = [(b - a) for a, b in zip(angles, angles[1:])]
+    assert min(gaps) > 0.35 * 2 * math.pi / 12
@@ -21,8 +21,8 @@ def test_analyze_text_basic():
     assert isinstance(result["skills"], list)
 
 def test_analyze_text_error_handling(mocker):
-    # Mock clean_text to raise exception to test pipeline resilience
-    mocker.patch("nlp.nlp_engine.clean_text", side_effect=Exception("Boom"))
+    # Mock the cleaning stage to raise exception to test pipeline resilience
+    mocker.patch("nlp.nlp_engine.clean_text_with_offsets", side_effect=Exception("Boom"))
     
     result = analyze_text("Some text")
     
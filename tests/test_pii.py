@@ -0,0 +1,43 @@
+from nlp.pii import scan_pii
+from nlp.preprocess import clean_text
+from nlp.ats_check import calculate_ats_score
+
+TEXT = "Jane Doe jane.doe@mail.com +1 555 123 4567 https://github.com/jane Python developer"
+
+def test_single_scan_spans():
+    pii = scan_pii(TEXT)
+    assert [s.kind for s in pii.spans] == ["EMAIL", "PHONE", "URL"]
+    assert TEXT[pii.spans[0].start:pii.spans[0].end] == "jane.doe@mail.com"
+
+def test_derived_views():
+    pii = scan_pii(TEXT)
+    assert pii.redacted == "Jane Doe [REDACTED_EMAIL] [REDACTED_PHONE] https://github.com/jane Python developer"
+    assert pii.cleaned == "Jane Doe Python developer"
+    assert clean_text(TEXT) == pii.cleaned
+    assert pii.has_email and pii.has_phone
+
+def test_redaction_masks_whole_phone_numbers():
+    for number in ("+49 151 1234 5678", "0049-151-1234-5678", "+1 555\n123 4567", "030-1234-5678-90"):
+        assert scan_pii(f"Call {number} today").redacted == "Call [REDACTED_PHONE] today"
+    assert scan_pii("see https://x.io/u/123456789012").redacted == "see https://x.io/u/123456789012"
+
+def test_url_with_at_sign_is_not_an_email():
+    pii = scan_pii("see https://medium.com/@jane/post")
+    assert [s.kind for s in pii.spans] == ["URL"]
+    assert not pii.has_email
+
+def test_ats_uses_contact_flags():
+    issues = calculate_ats_score("Python developer. " * 20)["issues"]
+    assert "Contact info might be missing or unparsable" in issues
+    issues = calculate_ats_score(TEXT + ". " + "Python developer. " * 20)["issues"]
+    assert "Contact info might be missing or unparsable" not in issues
+
+def test_cleaned_offsets_map_back_to_raw():
+    raw = "Contact:  jane@mail.com\n\n  Built   REST APIs with   Python."
+    cleaned = scan_pii(raw).clean()
+    assert cleaned.text == "Contact: Built REST APIs with Python."
+    start = cleaned.text.index("REST APIs")
+    a, b = cleaned.raw_span(start, start + len("REST APIs"))
+    assert raw[a:b] == "REST APIs"
+    a, b = cleaned.raw_span(cleaned.text.index("Python"), len(cleaned.text))
+    assert raw[a:b] == "Python."
@@ -0,0 +1,44 @@
+import json
+import pickle
+
+import pytest
+
+from intelligence.ontology import normalize_skills
+from nlp.records import Candidate, Evidence, Skill, TraceRow
+
+
+def _skill():
+    return Skill("Python", 0.91, "applied", [(6, 12)], [Evidence("Built Python APIs.", 0, 18)])
+
+
+def test_records_are_slotted():
+    for record in (_skill(), Evidence("s", 0, 1), TraceRow("s", "neutral", 0, 0, False, 0.5),
+                   Candidate("Python", 6, 12, 0, 18, "applied", "Built Python APIs.")):
+        assert not hasattr(record, "__dict__")
+
+
+def test_skill_reads_and_serializes_like_the_old_dict():
+    skill = _skill()
+    assert skill["skill"] == skill.get("skill") == "Python"
+    assert skill["evidence"] == ["Built Python APIs."] and skill["evidence_spans"] == [(0, 18)]
+    assert "mentions" in skill and "evidence_items" not in skill
+    assert skill.get("name", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        skill["name"]
+    assert json.loads(json.dumps(skill.to_dict())) == {
+        "skill": "Python", "confidence": 0.91, "evidence": ["Built Python APIs."], "depth": "applied",
+        "mentions": [[6, 12]], "evidence_spans": [[0, 18]],
+    }
+    assert pickle.loads(pickle.dumps(skill)) == skill
+
+
+def test_candidate_shift_keeps_the_shared_sentence():
+    cand = Candidate("Python", 6, 12, 0, 18, "applied", "Built Python APIs.")
+    moved = cand.shifted(100)
+    assert moved["offsets"] == (106, 112) and moved.sentence_offsets == (100, 118)
+    assert moved.sentence is cand.sentence
+
+
+def test_normalize_skills_accepts_records():
+    normalized = normalize_skills([_skill()])
+    assert normalized[0]["name"] and normalized[0]["evidence"] == ["Built Python APIs."]
@@ -0,0 +1,46 @@
+from visualization.render_cache import RenderCache, input_hash, memoize_render
+from visualization import render_cache
+
+def test_memoized_render_runs_once(monkeypatch):
+    monkeypatch.setattr(render_cache, "RENDER_CACHE", RenderCache(1024))
+    calls = []
+
+    @memoize_render
+    def render(text, skills):
+        calls.append(text)
+        return f"<div>{text}:{','.join(skills)}</div>"
+
+    assert render("cv", ["Python"]) == render("cv", ["Python"]) == "<div>cv:Python</div>"
+    render("cv", ["Go"])
+    assert calls == ["cv", "cv"]
+
+def test_figures_are_cached_as_dicts(monkeypatch):
+    monkeypatch.setattr(render_cache, "RENDER_CACHE", RenderCache(1024))
+
+    class Figure:
+        built = 0
+        def __init__(self):
+            Figure.built += 1
+        def to_dict(self):
+            return {"data": [{"type": "bar", "y": [1, 2]}], "layout": {}}
+        def to_json(self):
+            return '{"data": [{"type": "bar", "y": [1, 2]}], "layout": {}}'
+
+    render = memoize_render(lambda skills: Figure())
+    first, second = render(["Python"]), render(["Python"])
+    assert Figure.built == 1
+    assert first is second and first["data"][0]["y"] == [1, 2]
+    assert render_cache.RENDER_CACHE.total_bytes == len(Figure().to_json())
+
+def test_input_order_matters_for_dicts():
+    a = input_hash("radar", ({"Data": 1, "Technical": 2},), {})
+    b = input_hash("radar", ({"Technical": 2, "Data": 1},), {})
+    assert a != b
+
+def test_size_bound_evicts_oldest():
+    cache = RenderCache(max_bytes=10)
+    cache.put("a", ("html", "x" * 6))
+    cache.put("b", ("html", "y" * 6))
+    assert cache.get("a") is None and cache.get("b") is not None
+    cache.put("c", ("html", "z" * 11))
+    assert cache.get("c") is None and cache.total_bytes == 6
@@ -1,4 +1,5 @@
 import unittest
+from nlp.records import Skill
 from nlp.skill_extractor import extract_skills_with_evidence
 
 class TestSemanticSkillExtraction(unittest.TestCase):
@@ -39,12 +40,13 @@ class TestSemanticSkillExtraction(unittest.TestCase):
         skills = extract_skills_with_evidence(text, ontology)
         
         for skill in skills:
-            self.assertIsInstance(skill, dict)
+            self.assertIsInstance(skill, Skill)
             self.assertIn("skill", skill)
             self.assertIn("confidence", skill)
             self.assertIn("evidence", skill)
             self.assertIn("depth", skill)
             self.assertIsInstance(skill["evidence"], list)
+            self.assertEqual(set(skill.to_dict()), {"skill", "confidence", "evidence", "depth", "mentions", "evidence_spans"})
 
 if __name__ == '__main__':
     unittest.main()
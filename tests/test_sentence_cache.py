@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+from nlp import sentence_cache
+from nlp.records import Candidate
+from nlp.sentence_cache import LRUCache, SentenceAnalysis, analyze_sentences, split_units
+from nlp.preprocess import clean_text_with_offsets
+from nlp.sentence_features import sentence_features
+
+
+class _FakePipeline:
+    def __init__(self):
+        self.parsed = []
+
+    def pipe(self, texts):
+        for t in texts:
+            self.parsed.append(t)
+            yield SimpleNamespace(text=t)
+
+
+def _fake_analyze(doc):
+    # One sentence per unit; the first word is a candidate
+    word = doc.text.split()[0]
+    return SentenceAnalysis(
+        sentences=((0, len(doc.text)),),
+        candidates=(Candidate(word, 0, len(word), 0, len(doc.text), "applied", doc.text),),
+        negated=(), features=(sentence_features(doc.text),),
+    )
+
+
+def _setup(monkeypatch):
+    pipeline = _FakePipeline()
+    monkeypatch.setattr(sentence_cache, "get_spacy_pipeline", lambda: pipeline)
+    monkeypatch.setattr(sentence_cache, "_analyze_doc", _fake_analyze)
+    return pipeline
+
+
+def test_split_units_on_sentence_ends_and_bullets():
+    text = "Built APIs. Led a team! • Python, SQL • Docker"
+    assert [text[s:e] for s, e in split_units(text)] == ["Built APIs.", "Led a team!", "• Python, SQL", "• Docker"]
+    assert split_units("   ") == []
+
+
+def test_split_units_on_raw_lines_and_dash_bullets():
+    raw = "Experience\n- Built REST APIs with Flask\n- Deployed Docker containers\n  on AWS\nPython, SQL"
+    cleaned = clean_text_with_offsets(raw)
+    units = [cleaned.text[s:e] for s, e in split_units(cleaned.text, cleaned.line_breaks)]
+    # A wrapped line continuing in lowercase stays in its unit
+    assert units == ["Experience", "- Built REST APIs with Flask",
+                     "- Deployed Docker containers on AWS", "Python, SQL"]
+    assert [raw[s:e] for s, e in split_units(raw)][:2] == ["Experience", "- Built REST APIs with Flask"]
+
+    inline = "Experience - Built REST APIs with Flask - Deployed Docker containers"
+    assert len(split_units(inline)) == 3
+    assert len(split_units("Python 2019 - 2021 and front - end work")) == 1
+
+
+def test_only_changed_sentences_are_parsed(monkeypatch):
+    pipeline = _setup(monkeypatch)
+    cache = LRUCache(100, "test_lookups_total")
+    first = analyze_sentences("Python services. Docker images. Kafka streams.", cache)
+    assert first.reused == 0 and len(pipeline.parsed) == 3
+
+    edited = analyze_sentences("Python services. Terraform modules. Kafka streams.", cache)
+    assert pipeline.parsed[3:] == ["Terraform modules."]
+    assert edited.reused == 2
+    assert [c["text"] for c in edited.candidates()] == ["Python", "Terraform", "Kafka"]
+
+
+def test_merged_offsets_are_document_relative(monkeypatch):
+    _setup(monkeypatch)
+    text = "Python services. Kafka streams."
+    analysis = analyze_sentences(text, LRUCache(100, "test_lookups_total"))
+    kafka = analysis.candidates()[1]
+    s, e = kafka["offsets"]
+    assert text[s:e] == "Kafka"
+    assert kafka["sentence"] == "Kafka streams." == text[slice(*kafka["sentence_offsets"])]
+    assert analysis.sentence_texts() == ["Python services.", "Kafka streams."]
+
+
+def test_feature_table_follows_sentence_order(monkeypatch):
+    _setup(monkeypatch)
+    analysis = analyze_sentences("Improved uptime by 20%. Helped with Kafka.", LRUCache(100, "test_lookups_total"))
+    table = analysis.feature_table()
+    assert table.sentences == ["Improved uptime by 20%.", "Helped with Kafka."]
+    assert table.action_verbs.tolist() == [1, 0]
+    assert table.hedge_count.tolist() == [0, 1]
+    assert table.metrics.tolist() == [1, 0]
+
+
+def test_lru_evicts_oldest():
+    cache = LRUCache(2, "test_lookups_total")
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None and cache.get("a") == 1 and len(cache) == 2
@@ -0,0 +1,63 @@
+from intelligence.resume_score import score_resume_text
+from intelligence.weakness_detector import score_sentences
+from nlp.sentence_features import IMPACT_KEYWORDS, FeatureTable, KeywordMatcher, keyword_matcher, sentence_features
+
+
+def test_one_pass_extracts_every_signal():
+    f = sentence_features("Led the team that improved latency by 40% for 300 users; tests were automated.")
+    assert f.action_verbs == 2  # led, improved
+    assert f.hedges == ()
+    assert f.has_passive
+    assert f.numbers >= 2 and f.metrics == 2
+    assert f.impact_mask & (1 << IMPACT_KEYWORDS.index("improved"))
+
+
+def test_hedges_match_whole_words_only():
+    assert sentence_features("Somewhat familiar with Docker.").hedges == ("familiar with", "somewhat")
+    assert sentence_features("Enabled basically everything.").hedges == ()
+    # "enabled" must not count as the verb "led"
+    assert sentence_features("Enabled basically everything.").action_verbs == 0
+
+
+def test_skill_names_are_not_hedges():
+    assert sentence_features("Built machine learning pipelines serving 300 users.").hedges == ()
+    assert sentence_features("Designed basic auth for the admin API.").hedges == ()
+    assert sentence_features("Basic knowledge of Rust, currently learning Go.").hedges == (
+        "basic knowledge", "currently learning")
+
+
+def test_role_hits_are_memoized_per_keyword_list():
+    table = FeatureTable.from_sentences(["Built Kafka pipelines.", "Wrote docs."])
+    hits = table.role_hits(["Kafka", "Spark"])
+    assert hits.tolist() == [1, 0]
+    assert table.role_hits(["kafka", "spark"]) is hits
+
+
+def test_keyword_matcher_agrees_with_substring_checks():
+    keywords = ["Java", "JavaScript", "Script", "C", "C++", "SQL", "NoSQL", "machine learning"]
+    sentences = [
+        "Wrote JavaScript and C++ services.",
+        "Moved data from SQL to NoSQL stores.",
+        "Applied Machine Learning in Java.",
+        "",
+        "Nothing relevant here.",
+    ]
+    found = KeywordMatcher(keywords).matches(sentences)
+    assert found == [{k.lower() for k in keywords if k.lower() in s.lower()} for s in sentences]
+    assert KeywordMatcher(keywords).hits(sentences).tolist() == [len(f) for f in found]
+
+
+def test_keyword_matcher_is_compiled_once_per_keyword_set():
+    table = FeatureTable.from_sentences(["Built Kafka pipelines."])
+    table.role_hits(["Spark", "Kafka"])
+    assert keyword_matcher(("kafka", "spark")) is keyword_matcher(("kafka", "spark"))
+    assert KeywordMatcher([]).hits(["anything"]).tolist() == [0]
+
+
+def test_scorers_share_one_table():
+    text = "Responsible for reports. Reduced costs by 30%."
+    table = FeatureTable.from_text(text)
+    weak = score_sentences(table, ["reports"])
+    assert "no measurable result" in weak[0]["reasons"] and "missing role-relevant keywords" in weak[1]["reasons"]
+    assert score_resume_text(text, ["SQL"], 8.0, features=table) == score_resume_text(text, ["SQL"], 8.0)
+    assert any("strong verbs" in tip for tip in score_resume_text(text, [], 8.0, features=table)["tips"])
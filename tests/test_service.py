@@ -0,0 +1,50 @@
+import asyncio
+import json
+import pytest
+from service import api
+from service.api import AnalysisService, NormalizeRequest
+
+def _call(app, method, path, body=None):
+    """Drive the ASGI app directly: returns (status, decoded JSON body)."""
+    sent = []
+    payload = json.dumps(body).encode() if body is not None else b""
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path}
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setitem(api.OPERATIONS, "normalize", (NormalizeRequest, lambda r: {"skills": [s.title() for s in r.skills]}))
+    return AnalysisService(workers=2, warm=False)
+
+def test_single_and_batch(app):
+    assert _call(app, "POST", "/v1/normalize", {"skills": ["python"]}) == (200, {"skills": ["Python"]})
+    status, body = _call(app, "POST", "/v1/normalize/batch", {"items": [{"skills": ["go"]}, {"skills": ["sql"]}]})
+    assert status == 200
+    assert body["results"] == [{"skills": ["Go"]}, {"skills": ["Sql"]}]
+
+def test_validation_and_routing_errors(app):
+    assert _call(app, "POST", "/v1/normalize", {"skills": "python"})[0] == 422
+    assert _call(app, "POST", "/v1/unknown", {})[0] == 404
+    assert _call(app, "GET", "/health")[0] == 200
+
+def test_load_shedding(app):
+    app.max_pending = 0
+    status, body = _call(app, "POST", "/v1/normalize", {"skills": ["python"]})
+    assert status == 503
+
+def test_batch_items_each_take_a_slot(app):
+    app.max_pending = 3
+    app._pending = 1
+    items = {"items": [{"skills": ["go"]}] * 3}
+    assert _call(app, "POST", "/v1/normalize/batch", items)[0] == 503
+    app._pending = 0
+    assert _call(app, "POST", "/v1/normalize/batch", items)[0] == 200
+    assert _call(app, "POST", "/v1/normalize/batch", {"items": [{"skills": ["go"]}] * 4})[0] == 413
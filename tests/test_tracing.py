@@ -0,0 +1,47 @@
+import json
+import pytest
+from utils.tracing import MetricsRegistry, Histogram, span, request_trace
+
+def test_histogram_buckets_and_quantiles():
+    h = Histogram(buckets=(0.1, 1.0))
+    for v in (0.05, 0.05, 0.5, 5.0):
+        h.observe(v)
+    snap = h.snapshot()
+    assert snap["count"] == 4
+    assert snap["buckets"] == [[0.1, 2], [1.0, 3]]
+    assert h.quantile(0.5) == 0.1
+    assert h.quantile(1.0) == float("inf")
+
+def test_span_records_latency_and_status():
+    reg = MetricsRegistry()
+    with span("ats", registry=reg):
+        pass
+    with pytest.raises(ValueError):
+        with span("ats", registry=reg):
+            raise ValueError("boom")
+
+    data = reg.to_dict()
+    assert data["histograms"]["stage_latency_seconds"][0]["count"] == 2
+    statuses = {c["labels"]["status"]: c["value"] for c in data["counters"]["stage_calls_total"]}
+    assert statuses == {"ok": 1, "error": 1}
+    json.loads(reg.to_json())
+
+def test_request_trace_collects_nested_spans():
+    reg = MetricsRegistry()
+    with request_trace("analysis", trace_id="abc") as trace:
+        with span("spacy_parse", registry=reg):
+            with span("embedding", registry=reg):
+                pass
+    stages = {s["stage"]: s["depth"] for s in trace.spans}
+    assert trace.trace_id == "abc"
+    assert stages == {"embedding": 2, "spacy_parse": 1, "analysis": 0}
+
+def test_prometheus_export_format():
+    reg = MetricsRegistry()
+    reg.observe("stage_latency_seconds", 0.02, stage="role_fit")
+    reg.inc("llm_attempts_total", outcome="ok")
+    text = reg.to_prometheus()
+    assert "# TYPE career_nlp_stage_latency_seconds histogram" in text
+    assert 'career_nlp_stage_latency_seconds_bucket{stage="role_fit",le="+Inf"} 1' in text
+    assert 'career_nlp_stage_latency_seconds_count{stage="role_fit"} 1' in text
+    assert 'career_nlp_llm_attempts_total{outcome="ok"} 1' in text
@@ -0,0 +1,35 @@
+import json
+import os
+
+from utils import warmup
+from utils.warmup import ready_file_is_current, wait_for_ready_file, worker_ready_file, write_ready_file
+
+
+def test_each_worker_writes_its_own_ready_file(tmp_path):
+    base = tmp_path / "career_nlp.ready"
+    path = write_ready_file(base, {"spacy": 1.0})
+    assert path == worker_ready_file(base) == tmp_path / f"career_nlp.ready.{os.getpid()}"
+    assert json.loads(path.read_text())["timings_ms"] == {"spacy": 1.0}
+    assert not list(tmp_path.glob("*.tmp"))
+
+    assert wait_for_ready_file(base, timeout=0, pid=os.getpid())
+    assert wait_for_ready_file(base, timeout=0)
+
+
+def test_stale_ready_files_do_not_count(tmp_path, monkeypatch):
+    base = tmp_path / "career_nlp.ready"
+    path = write_ready_file(base)
+    record = json.loads(path.read_text())
+
+    # Left by an earlier process that had this PID (e.g. the previous deploy)
+    monkeypatch.setattr(warmup, "process_start_time", lambda pid: record["started"] + 1)
+    assert not ready_file_is_current(path)
+    assert not wait_for_ready_file(base, timeout=0)
+
+    # Written under another worker's name
+    monkeypatch.undo()
+    other = worker_ready_file(base, os.getpid() + 1)
+    other.write_text(path.read_text())
+    path.unlink()
+    assert not ready_file_is_current(other)
+    assert not wait_for_ready_file(base, timeout=0)
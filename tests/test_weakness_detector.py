@@ -1,5 +1,9 @@
 import unittest
-from intelligence.weakness_detector import score_sentence_strength
+from unittest import mock
+
+from intelligence import weakness_detector
+from intelligence.weakness_detector import score_sentence_strength, weakness_report
+from nlp.sentence_cache import LRUCache
 
 class TestWeakness(unittest.TestCase):
     def test_detect_no_metrics(self):
@@ -20,5 +24,49 @@ class TestWeakness(unittest.TestCase):
         r = score_sentence_strength(sent, [], [])
         self.assertIn("hedging / weak phrasing", r["reasons"])
 
+    def test_report_ranks_weakest_sentences(self):
+        text = ("Built a Java service used by 300 users. "
+                "I somewhat helped with JavaScript. "
+                "Was responsible for deployments.")
+        report = weakness_report(text, top_role_skills=["Java", "JavaScript"], limit=2)
+        self.assertEqual(report["sentences"], 3)
+        self.assertEqual([r["index"] for r in report["weakest"]], [1, 2])
+        self.assertEqual(report["weak_sentences"], 2)
+        self.assertEqual(report["reasons"]["missing role-relevant keywords"], 1)
+        # Report rows match the per-sentence scorer
+        single = score_sentence_strength("I somewhat helped with JavaScript.", [], ["Java", "JavaScript"])
+        self.assertEqual(report["weakest"][0]["severity"], single["severity"])
+
+    def test_report_splits_unpunctuated_bullets(self):
+        text = ("Experience\n"
+                "- Built REST APIs with Flask serving 300 users\n"
+                "- Helped with Docker deployments\n"
+                "Projects\n"
+                "Designed a Kafka pipeline\n"
+                "  that reduced latency by 40%")
+        report = weakness_report(text, limit=10)
+        self.assertEqual(report["sentences"], 5)
+        sentences = [r["sentence"] for r in report["weakest"]]
+        self.assertIn("- Helped with Docker deployments", sentences)
+        self.assertIn("Designed a Kafka pipeline\n  that reduced latency by 40%", sentences)
+
+    def test_role_keywords_are_built_once_per_role(self):
+        baseline = {"core_skills": ["Python"], "secondary_skills": ["SQL"], "optional_skills": [],
+                    "weights": {"Python": 5, "SQL": 3}, "source": "local"}
+        with mock.patch.object(weakness_detector, "_ROLE_KEYWORDS", LRUCache(8, "test_lookups_total")), \
+                mock.patch("intelligence.role_matcher.get_role_baseline", return_value=baseline) as get:
+            first = weakness_report("Wrote Python jobs.", role="Data Engineer")
+            weakness_report("Tuned SQL queries.", role="Data Engineer")
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(first["weakest"][0]["reasons"].count("missing role-relevant keywords"), 0)
+
+    def test_fallback_baseline_is_not_cached(self):
+        baseline = {"core_skills": ["Communication"], "source": "fallback"}
+        with mock.patch.object(weakness_detector, "_ROLE_KEYWORDS", LRUCache(8, "test_lookups_total")), \
+                mock.patch("intelligence.role_matcher.get_role_baseline", return_value=baseline) as get:
+            weakness_report("Led meetings.", role="Astronaut")
+            weakness_report("Led meetings.", role="Astronaut")
+        self.assertEqual(get.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,7 @@ from config import settings
 from utils.json_utils import safe_load_json_from_text
 from utils.validator import validate_json
 from utils.logging_config import logger
+from utils.tracing import span, count
 from dotenv import load_dotenv
 
 # Load all env vars so os.getenv finds the backup keys
@@ -56,7 +57,12 @@ def rotate_key():
     return True
 
 def get_genai_model():
-    """Lazy load GenAI."""
+    """The configured LLM backend (utils.llm_backends); live Gemini by default."""
+    from utils.llm_backends import get_llm_backend
+    return get_llm_backend(live_factory=_live_gemini_model)
+
+def _live_gemini_model():
+    """Lazy load GenAI, configured with the current rotation key."""
     _init_keys()
     import google.generativeai as genai
     
@@ -76,9 +82,10 @@ def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Di
     """
     Call LLM with automatic key rotation on 429 errors.
     """
-    if not settings.GEMINI_API_KEY and not os.getenv("GEMINI_API_KEY"):
-         # Check if we have backups at least
-         pass 
+    from utils.llm_backends import ReplayMiss, needs_api_key
+    _init_keys()
+    if needs_api_key() and not _KEYS and not os.getenv("GEMINI_API_KEY"):
+        raise ValueError("GEMINI_API_KEY not configured (or set LLM_BACKEND=stub / replay to run offline).")
 
     last_err = None
     
@@ -91,8 +98,9 @@ def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Di
             model = get_genai_model()
             logger.debug(f"LLM Call Attempt {attempt+1}/{total_attempts}")
             
-            resp = model.generate_content(prompt)
-            raw = resp.text
+            with span("llm_attempt", model=settings.LLM_MODEL):
+                resp = model.generate_content(prompt)
+                raw = resp.text
             
             # Parse
             try:
@@ -103,6 +111,7 @@ def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Di
                 # Parse error isn't a quota error, so simplified retry logic
                 last_err = f"JSON parse error: {e}"
                 logger.warning(f"Parse Fail: {e}")
+                count("llm_attempts_total", outcome="parse_error")
                 time.sleep(1)
                 continue
             
@@ -115,18 +124,26 @@ def call_llm_with_schema(prompt: str, schema_path: str, timeout: int = 15) -> Di
 
             ok, err = validate_json(obj, schema)
             if ok:
+                count("llm_attempts_total", outcome="ok")
                 return obj
                 
             last_err = f"Validation error: {err}"
             logger.warning(f"Schema Val Fail: {err}")
+            count("llm_attempts_total", outcome="validation_error")
             
+        except ReplayMiss:
+            # A recording won't appear by retrying
+            count("llm_attempts_total", outcome="replay_miss")
+            raise
         except Exception as e:
             err_str = str(e)
             last_err = f"LLM error: {err_str}"
             logger.error(f"LLM error: {e}")
+            is_quota = "429" in err_str or "quota" in err_str.lower()
+            count("llm_attempts_total", outcome="quota" if is_quota else "error")
             
             # Key Rotation Trigger
-            if "429" in err_str or "quota" in err_str.lower():
+            if is_quota:
                 logger.warning("Quota hit! Attempting key rotation...")
                 if rotate_key():
                     time.sleep(1) # Brief pause after switch
@@ -0,0 +1,263 @@
+"""
+Background Job Queue
+
+Runs slow generative work (exploration, projects, roadmap) on a local thread
+pool so Streamlit button handlers return immediately and a rerun never
+throws work away. Every job has an ID and a row in a SQLite table
+(settings.JOBS_DB_PATH) holding its status, parameters and JSON result, so
+results survive reruns and process restarts. Each row records the process
+that owns it; pending jobs are only marked failed once that process is gone,
+so several Streamlit processes can share one database.
+
+    jobs = get_job_queue()
+    job_id = jobs.submit("projects", skills=["Python"], ambition="Become a CTO")
+    jobs.get(job_id)   # {"id", "kind", "status", "result", "error", ...}
+    jobs.cancel(job_id)
+
+Status flow: queued -> running -> done | failed, or -> cancelled.
+"""
+
+import importlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from config import settings
+from utils.logging_config import logger
+from utils.procinfo import process_start_time
+from utils.tracing import count, span
+
+# Job kind -> "module:function". Resolved lazily: ai_core pulls in the LLM client.
+JOB_TYPES = {
+    "exploration": "ai_core.explorer:suggest_exploration",
+    "projects": "ai_core.explorer:generate_projects",
+    "roadmap": "ai_core.synthesis:generate_roadmap",
+}
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+PENDING = (QUEUED, RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT
+)
+"""
+
+_OWNER: Optional[Tuple[int, str]] = None
+
+
+def process_owner() -> str:
+    """
+    "host:pid:start" of this process, where `start` is its start time: a PID
+    reused by a later process then no longer matches. Without /proc a random
+    token stands in, which only tells this process apart from earlier ones.
+    """
+    global _OWNER
+    pid = os.getpid()
+    if _OWNER is None or _OWNER[0] != pid:  # recomputed in a forked child
+        start = process_start_time(pid)
+        token = str(start) if start is not None else f"u{uuid.uuid4().hex[:8]}"
+        _OWNER = (pid, f"{socket.gethostname()}:{pid}:{token}")
+    return _OWNER[1]
+
+
+def owner_alive(owner: Optional[str]) -> bool:
+    """
+    Whether the process that owns a job may still be running: same PID and
+    same start time. Rows from before owners were recorded count as dead;
+    owners on another host, or on platforms where liveness can't be probed
+    safely, count as alive. Without a start time to compare, a live process
+    with the same PID counts as the owner.
+    """
+    if not owner:
+        return False
+    host, pid, token = owner.rsplit(":", 2)
+    pid = int(pid)
+    if host != socket.gethostname() or os.name == "nt":  # os.kill(pid, 0) terminates on Windows
+        return True
+    if pid == os.getpid():
+        return owner == process_owner()
+    start = process_start_time(pid)
+    if start is not None and token.isdigit():
+        return int(token) == start
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _resolve(kind: str) -> Callable[..., Any]:
+    module_name, func_name = JOB_TYPES[kind].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+class JobQueue:
+    """Thread-pool job runner with SQLite-backed status and results."""
+
+    def __init__(self, db_path: Path, workers: int):
+        self.db_path = Path(db_path)
+        self.workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._init_db()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call: safe across Streamlit and worker threads
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:  # commit / rollback
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            if "owner" not in {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            # Pending jobs whose process has exited will never finish; other processes' live jobs are left alone
+            pending = conn.execute("SELECT id, owner FROM jobs WHERE status IN (?, ?)", PENDING).fetchall()
+            orphaned = [(row["id"],) for row in pending if not owner_alive(row["owner"])]
+            now = time.time()
+            conn.executemany(
+                "UPDATE jobs SET status=?, error=?, updated_at=? WHERE id=? AND status IN (?, ?)",
+                [(FAILED, "Interrupted by restart", now, job_id, *PENDING) for (job_id,) in orphaned],
+            )
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            return self._pool
+
+    def _update(self, job_id: str, only_if: tuple = (), **fields) -> bool:
+        """Update a job row; with `only_if`, only when its current status is one of those."""
+        fields["updated_at"] = time.time()
+        sql = "UPDATE jobs SET " + ", ".join(f"{k}=?" for k in fields) + " WHERE id=?"
+        args = [*fields.values(), job_id]
+        if only_if:
+            sql += " AND status IN (" + ",".join("?" * len(only_if)) + ")"
+            args.extend(only_if)
+        with self._connect() as conn:
+            return conn.execute(sql, args).rowcount > 0
+
+    def submit(self, kind: str, **params) -> str:
+        """Queue a job of `kind` with keyword `params`; returns its ID immediately."""
+        if kind not in JOB_TYPES:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, created_at, updated_at, owner) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, QUEUED, json.dumps(params), now, now, process_owner()),
+            )
+        future = self._get_pool().submit(self._run, job_id, kind, params)
+        with self._lock:
+            self._futures[job_id] = future
+        future.add_done_callback(lambda _: self._forget(job_id))
+        count("jobs_total", kind=kind, event="submitted")
+        return job_id
+
+    def _forget(self, job_id: str) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+
+    def _run(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        if not self._update(job_id, only_if=(QUEUED,), status=RUNNING):
+            return  # cancelled while queued
+        try:
+            with span("job", kind=kind):
+                result = _resolve(kind)(**params)
+        except Exception as e:
+            logger.exception(f"Job {job_id} ({kind}) failed")
+            self._update(job_id, only_if=(RUNNING,), status=FAILED, error=str(e))
+            count("jobs_total", kind=kind, event="failed")
+            return
+        # A job cancelled mid-run keeps its cancelled status; the result is dropped
+        if self._update(job_id, only_if=(RUNNING,), status=DONE, result=json.dumps(result)):
+            count("jobs_total", kind=kind, event="done")
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current job record, with `params` / `result` decoded; None if unknown."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+    def status(self, job_id: str) -> Optional[str]:
+        job = self.get(job_id)
+        return job["status"] if job else None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job. A running LLM call can't be interrupted,
+        but its result is discarded. Returns False if the job already finished.
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()  # only succeeds while still queued in the pool
+        cancelled = self._update(job_id, only_if=PENDING, status=CANCELLED)
+        if cancelled:
+            count("jobs_total", kind="any", event="cancelled")
+        return cancelled
+
+    def wait(self, job_id: str, timeout: float = 60.0, poll: float = 0.2) -> Optional[Dict[str, Any]]:
+        """Block until the job leaves the pending states or `timeout` elapses (CLI/tests)."""
+        deadline = time.monotonic() + timeout
+        job = self.get(job_id)
+        while job and job["status"] in PENDING and time.monotonic() < deadline:
+            time.sleep(poll)
+            job = self.get(job_id)
+        return job
+
+    def purge(self, older_than_s: float) -> int:
+        """Delete finished jobs older than `older_than_s` seconds."""
+        cutoff = time.time() - older_than_s
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM jobs WHERE status NOT IN (?, ?) AND updated_at < ?", (*PENDING, cutoff)
+            ).rowcount
+
+
+_JOBS: Optional[JobQueue] = None
+_JOBS_LOCK = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Process-wide queue, created on first use."""
+    global _JOBS
+    with _JOBS_LOCK:
+        if _JOBS is None:
+            _JOBS = JobQueue(settings.JOBS_DB_PATH, settings.JOB_WORKERS)
+            _JOBS.purge(settings.JOB_RETENTION_S)
+        return _JOBS
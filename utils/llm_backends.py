@@ -0,0 +1,195 @@
+"""
+Pluggable LLM Backends
+
+Every LLM call in the app goes through `utils.ai_bridge.get_genai_model()`,
+which returns an object with the google.generativeai surface:
+`generate_content(prompt).text`. settings.LLM_BACKEND picks what that is:
+
+    gemini  live Gemini (needs GEMINI_API_KEY) - the default
+    stub    utils.llm_stub: echoes the JSON example in the prompt, no network
+    record  live Gemini, and every response is written to LLM_REPLAY_DIR
+    replay  serves responses recorded earlier from LLM_REPLAY_DIR, no network
+
+Any backend can be wrapped with injected latency and failures
+(LLM_INJECT_LATENCY_S / _JITTER_S, LLM_INJECT_FAILURE_RATE / _QUOTA_RATE) so
+load tests see realistic response times and exercise retry / key rotation.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Optional, Protocol, runtime_checkable
+
+from config import settings
+from utils.logging_config import logger
+from utils.tracing import count
+
+BACKENDS = ("gemini", "stub", "record", "replay")
+
+
+@runtime_checkable
+class LLMBackend(Protocol):
+    """The `generate_content(prompt).text` surface the app relies on; live Gemini models match it as-is."""
+
+    model_name: str
+
+    def generate_content(self, prompt: str) -> Any:
+        ...
+
+
+class ReplayMiss(LookupError):
+    """No recorded response for a prompt (replay mode). Not worth retrying."""
+
+
+def prompt_key(model_name: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class ReplayBackend(LLMBackend):
+    """
+    Record/replay store: one JSON file per (model, prompt) under `directory`.
+
+    With `inner` set (record mode) misses are answered live and written;
+    without it (replay mode) a miss falls back to `on_miss` ("stub") or
+    raises ReplayMiss ("error").
+    """
+
+    def __init__(self, directory: Path, model_name: str, inner: Optional[Any] = None, on_miss: str = "error"):
+        self.directory = Path(directory)
+        self.model_name = model_name
+        self.inner = inner
+        self.on_miss = on_miss
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def generate_content(self, prompt: str) -> SimpleNamespace:
+        key = prompt_key(self.model_name, prompt)
+        path = self._path(key)
+        if self.inner is None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = json.load(f)["text"]
+                count("llm_replay_total", outcome="hit")
+                return SimpleNamespace(text=text)
+            except FileNotFoundError:
+                count("llm_replay_total", outcome="miss")
+                if self.on_miss == "stub":
+                    from utils.llm_stub import StubGenerativeModel
+                    return StubGenerativeModel(self.model_name).generate_content(prompt)
+                raise ReplayMiss(f"No recorded response for prompt {key[:12]} (model {self.model_name})")
+
+        text = self.inner.generate_content(prompt).text
+        self._write(path, {"model": self.model_name, "prompt_preview": prompt[:200], "text": text})
+        count("llm_replay_total", outcome="recorded")
+        return SimpleNamespace(text=text)
+
+    @staticmethod
+    def _write(path: Path, record: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=1)
+        tmp.replace(path)  # concurrent recorders never leave a torn file
+
+
+class FaultInjector(LLMBackend):
+    """Adds latency and random failures in front of another backend."""
+
+    def __init__(
+        self,
+        inner: Any,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        failure_rate: float = 0.0,
+        quota_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.inner = inner
+        self.model_name = getattr(inner, "model_name", "")
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.failure_rate = failure_rate
+        self.quota_rate = quota_rate
+        self.rng = rng or random.Random()
+
+    def generate_content(self, prompt: str) -> Any:
+        with _RNG_LOCK:
+            delay = self.latency_s + (self.rng.uniform(0, self.jitter_s) if self.jitter_s else 0.0)
+            roll = self.rng.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.quota_rate:
+            count("llm_injected_failures_total", kind="quota")
+            # Same shape as the real quota error, so key rotation kicks in
+            raise RuntimeError("429 Resource has been exhausted (e.g. check quota). [injected]")
+        if roll < self.quota_rate + self.failure_rate:
+            count("llm_injected_failures_total", kind="error")
+            raise RuntimeError("503 The model is overloaded. Please try again later. [injected]")
+        return self.inner.generate_content(prompt)
+
+
+# One RNG per process so injected faults follow LLM_INJECT_SEED across calls
+_RNG: Optional[random.Random] = None
+_RNG_LOCK = threading.Lock()
+
+
+def _fault_rng() -> random.Random:
+    global _RNG
+    with _RNG_LOCK:
+        if _RNG is None:
+            _RNG = random.Random(settings.LLM_INJECT_SEED)
+        return _RNG
+
+
+def reset_fault_injection(seed: Optional[int] = None) -> None:
+    """Restart the injected-fault sequence (benchmarks / tests)."""
+    global _RNG
+    with _RNG_LOCK:
+        _RNG = random.Random(settings.LLM_INJECT_SEED if seed is None else seed)
+
+
+def backend_name() -> str:
+    """Active backend; the older LLM_STUB flag still forces the stub."""
+    name = "stub" if settings.LLM_STUB else settings.LLM_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM_BACKEND {name!r}; expected one of {', '.join(BACKENDS)}")
+    return name
+
+
+def needs_api_key() -> bool:
+    return backend_name() in ("gemini", "record")
+
+
+def get_llm_backend(live_factory: Callable[[], LLMBackend]) -> LLMBackend:
+    """
+    Build the configured backend. `live_factory` returns a live Gemini model
+    (utils.ai_bridge supplies one with key rotation); only gemini / record call it.
+    """
+    name = backend_name()
+    if name == "stub":
+        from utils.llm_stub import get_stub_model
+        backend = get_stub_model()
+    elif name == "replay":
+        backend = ReplayBackend(settings.LLM_REPLAY_DIR, settings.LLM_MODEL, on_miss=settings.LLM_REPLAY_ON_MISS)
+    elif name == "record":
+        backend = ReplayBackend(settings.LLM_REPLAY_DIR, settings.LLM_MODEL, inner=live_factory())
+    else:
+        backend = live_factory()
+
+    if (settings.LLM_INJECT_LATENCY_S or settings.LLM_INJECT_JITTER_S
+            or settings.LLM_INJECT_FAILURE_RATE or settings.LLM_INJECT_QUOTA_RATE):
+        backend = FaultInjector(
+            backend,
+            latency_s=settings.LLM_INJECT_LATENCY_S,
+            jitter_s=settings.LLM_INJECT_JITTER_S,
+            failure_rate=settings.LLM_INJECT_FAILURE_RATE,
+            quota_rate=settings.LLM_INJECT_QUOTA_RATE,
+            rng=_fault_rng(),
+        )
+    logger.debug(f"LLM backend: {name}")
+    return backend
@@ -0,0 +1,37 @@
+"""
+Local Gemini Stub
+
+Drop-in stand-in for `genai.GenerativeModel`: the "stub" backend of
+utils.llm_backends (tests, load tests, the headless service in CI). No network, no API key
+spend. Every prompt in this repo embeds an example of the JSON it expects,
+so the stub answers with that example: the response is schema-shaped and
+deterministic, and parsing / validation still run for real.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+from config import settings
+from utils.json_utils import find_balanced_json
+
+
+class StubGenerativeModel:
+    """Mimics the `generate_content(prompt).text` surface of google.generativeai."""
+
+    def __init__(self, model_name: str = "stub", latency_s: float = 0.0):
+        self.model_name = model_name
+        self.latency_s = latency_s
+
+    def generate_content(self, prompt: str) -> SimpleNamespace:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        try:
+            text = find_balanced_json(prompt)
+        except ValueError:
+            text = json.dumps({})
+        return SimpleNamespace(text=text)
+
+
+def get_stub_model() -> StubGenerativeModel:
+    return StubGenerativeModel(settings.LLM_MODEL, settings.LLM_STUB_LATENCY_S)
@@ -1,89 +1,537 @@
-import re
+import mmap
+import hashlib
 import logging
-from typing import Tuple, Optional, Any
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Tuple, Optional, Any, Dict, Iterator, List, Union
 from io import BytesIO
-import docx
-import PyPDF2
-import pdfplumber
 
+from config import settings
 from utils.logging_config import logger
-
-PII_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
-PII_PHONE_RE = re.compile(r'(\+?\d[\d\-\s]{7,}\d)')
+from utils.tracing import count
+from utils.text_cache import ExtractedText, ExtractionCache
+from nlp.ats_check import special_char_ratio, MAX_SPECIAL_CHAR_RATIO
+from nlp.pii import scan_pii
 
 def redact_pii(text: str) -> str:
     """Redacts email and phone numbers from the text."""
-    if not text:
-        return ""
-    text = PII_EMAIL_RE.sub('[REDACTED_EMAIL]', text)
-    text = PII_PHONE_RE.sub('[REDACTED_PHONE]', text)
-    return text
+    return scan_pii(text).redacted
 
-def parse_docx_bytes(file_bytes: bytes) -> str:
-    """Parses DOCX file content from bytes."""
+# Process-wide cache of extracted text, keyed by SHA-256 of the upload
+EXTRACTION_CACHE = ExtractionCache(settings.TEXT_CACHE_MAX_ENTRIES, settings.TEXT_CACHE_MAX_CHARS)
+
+# In-memory bytes for small uploads, a temp-file path for spooled large ones
+DocumentSource = Union[bytes, Path]
+
+_COPY_CHUNK = 1024 * 1024
+
+
+class UploadRejected(ValueError):
+    """Upload violates a size or structure limit and must not be parsed."""
+
+
+@contextmanager
+def spooled_upload(stream: Any, suffix: str = "") -> Iterator[DocumentSource]:
+    """
+    Copies an upload stream in fixed-size chunks, enforcing UPLOAD_MAX_BYTES.
+
+    Uploads up to UPLOAD_SPOOL_THRESHOLD stay in memory (yields bytes); larger
+    ones are spooled to a temp file (yields its Path), which parsers then
+    memory-map instead of holding another full copy on the heap. The temp
+    file is removed on exit.
+    """
+    limit = settings.UPLOAD_MAX_BYTES
+    _check_declared_size(stream, limit)
+
+    if hasattr(stream, "seek"):
+        stream.seek(0)
+
+    buffer = bytearray()
+    spool = None
+    total = 0
     try:
-        doc = docx.Document(BytesIO(file_bytes))
+        while True:
+            chunk = stream.read(_COPY_CHUNK)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > limit:
+                raise UploadRejected(f"upload exceeds {limit} bytes")
+            if spool is None and total <= settings.UPLOAD_SPOOL_THRESHOLD:
+                buffer += chunk
+                continue
+            if spool is None:
+                spool = tempfile.NamedTemporaryFile(prefix="upload_", suffix=suffix, delete=False)
+                spool.write(buffer)
+                buffer = bytearray()
+            spool.write(chunk)
+
+        if total == 0:
+            raise UploadRejected("upload is empty")
+
+        if spool is None:
+            yield bytes(buffer)
+        else:
+            spool.close()
+            yield Path(spool.name)
+    finally:
+        if spool is not None:
+            spool.close()
+            Path(spool.name).unlink(missing_ok=True)
+
+
+def _open_stream(source: DocumentSource):
+    """Independent read-only stream over a source (BytesIO, or an mmap of the spool file)."""
+    if isinstance(source, (bytes, bytearray)):
+        return BytesIO(source)
+    with open(source, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def check_docx_archive(stream: Any) -> None:
+    """
+    Rejects decompression-bomb DOCX files before python-docx inflates them,
+    using the sizes declared in the zip central directory.
+    """
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            entries = archive.infolist()
+    except zipfile.BadZipFile as e:
+        raise UploadRejected(f"not a valid DOCX archive: {e}")
+
+    if len(entries) > settings.DOCX_MAX_ENTRIES:
+        raise UploadRejected(f"DOCX has {len(entries)} archive entries")
+
+    total = 0
+    for entry in entries:
+        total += entry.file_size
+        ratio = entry.file_size / max(1, entry.compress_size)
+        if ratio > settings.DOCX_MAX_COMPRESSION_RATIO:
+            raise UploadRejected(f"DOCX entry '{entry.filename}' compression ratio {ratio:.0f}:1")
+    if total > settings.DOCX_MAX_UNCOMPRESSED_BYTES:
+        raise UploadRejected(f"DOCX expands to {total} bytes")
+
+
+def parse_docx(source: DocumentSource) -> str:
+    """Parses DOCX content from bytes or a spooled file (archive-checked first)."""
+    stream = _open_stream(source)
+    try:
+        check_docx_archive(stream)
+        stream.seek(0)
+        import docx
+        doc = docx.Document(stream)
         paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
         return "\n".join(paragraphs)
+    except UploadRejected:
+        raise
     except Exception as e:
         logger.error(f"Error parsing DOCX: {e}")
         return ""
+    finally:
+        stream.close()
 
-def parse_pdf_bytes(file_bytes: bytes) -> str:
-    """Parses PDF file content using pdfplumber with PyPDF2 fallback."""
-    text = []
-    # pdfplumber tends to be more accurate
+def parse_docx_bytes(file_bytes: bytes) -> str:
+    """Parses DOCX file content from bytes."""
+    return parse_docx(file_bytes)
+
+class _PageExtractor:
+    """
+    Per-document page extraction shared by the worker pool.
+
+    Each worker thread lazily opens its own pdfplumber / PyPDF2 handle on its
+    own stream over the source (neither library is safe to share across
+    threads), so pages are extracted independently and a failing page falls
+    back on its own. Spooled sources are memory-mapped, not copied.
+
+    A page that timed out keeps running on its worker (threads cannot be
+    stopped), so `close()` only marks the extractor closed; the handles are
+    released by whichever of the reader or the last running page finishes last.
+    """
+
+    def __init__(self, source: DocumentSource):
+        self._source = source
+        self._local = threading.local()
+        self._handles: List[Any] = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self._closing = False
+
+    def _open(self, attr: str, opener):
+        handle = getattr(self._local, attr, None)
+        if handle is None:
+            stream = _open_stream(self._source)
+            handle = opener(stream)
+            setattr(self._local, attr, handle)
+            with self._lock:
+                self._handles.extend([handle, stream])
+        return handle
+
+    def pdfplumber_page(self, index: int) -> str:
+        import pdfplumber
+        pdf = self._open("plumber", pdfplumber.open)
+        page = pdf.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            page.close()  # drop cached layout objects for this page
+
+    def pypdf_page(self, index: int) -> str:
+        import PyPDF2
+        reader = self._open("pypdf", PyPDF2.PdfReader)
+        return reader.pages[index].extract_text() or ""
+
+    def page_count(self) -> int:
+        try:
+            import PyPDF2
+            return len(self._open("pypdf", PyPDF2.PdfReader).pages)
+        except Exception:
+            import pdfplumber
+            return len(self._open("plumber", pdfplumber.open).pages)
+
+    def run_page(self, index: int) -> str:
+        """`_extract_page` on a pool worker; pages picked up after `close()` are skipped."""
+        with self._lock:
+            if self._closing:
+                return ""
+            self._running += 1
+        try:
+            return _extract_page(self, index)
+        finally:
+            with self._lock:
+                self._running -= 1
+                last = self._closing and self._running == 0
+            if last:
+                self._close_handles()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closing = True
+            idle = self._running == 0
+        if idle:
+            self._close_handles()
+
+    def _close_handles(self) -> None:
+        with self._lock:
+            for handle in self._handles:
+                try:
+                    handle.close()  # pdfplumber.PDF / stream; PyPDF2 readers have no close()
+                except Exception:
+                    pass
+            self._handles.clear()
+
+
+class _PageRun:
+    """One page submitted to the pool; its timeout runs from when a worker picks it up."""
+
+    def __init__(self, extractor: _PageExtractor, index: int):
+        self.extractor = extractor
+        self.index = index
+        self.started = threading.Event()
+        self.started_at = 0.0
+
+    def __call__(self) -> str:
+        self.started_at = time.monotonic()
+        self.started.set()
+        return self.extractor.run_page(self.index)
+
+    def result(self, future: Future, timeout: float) -> str:
+        """The page text, waiting at most `timeout` seconds of the page's own run time."""
+        # Time spent queued behind other uploads on the shared pool does not count
+        while not self.started.wait(0.05):
+            if future.done():
+                break
+        remaining = timeout - (time.monotonic() - self.started_at) if self.started.is_set() else timeout
+        return future.result(timeout=max(0.0, remaining))
+
+
+# Shared pool: concurrent uploads share a bounded number of extraction threads
+_PDF_POOL: Optional[ThreadPoolExecutor] = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _get_pdf_pool() -> ThreadPoolExecutor:
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            _PDF_POOL = ThreadPoolExecutor(max_workers=settings.PDF_WORKERS, thread_name_prefix="pdf-page")
+        return _PDF_POOL
+
+
+def score_page_quality(text: str) -> Dict[str, float]:
+    """
+    Cheap quality signals for one page of extracted text.
+
+    - chars: non-whitespace character density of the page
+    - words: words on the page
+    - special_char_ratio: same measure the ATS check uses for garbled text
+    - mean_word_len: high values mean words ran together (missing spaces)
+    """
+    words = text.split()
+    chars = sum(len(w) for w in words)
+    return {
+        "chars": chars,
+        "words": len(words),
+        "special_char_ratio": special_char_ratio(text),
+        "mean_word_len": chars / len(words) if words else 0.0,
+    }
+
+
+def needs_layout_extraction(text: str) -> bool:
+    """True when a text-layer extraction looks too poor to trust."""
+    q = score_page_quality(text)
+    return (
+        q["chars"] < settings.PDF_FAST_MIN_CHARS
+        or q["words"] < settings.PDF_FAST_MIN_WORDS
+        or q["special_char_ratio"] > MAX_SPECIAL_CHAR_RATIO
+        or q["mean_word_len"] > settings.PDF_FAST_MAX_MEAN_WORD_LEN
+    )
+
+
+def _extract_page(extractor: _PageExtractor, index: int) -> str:
+    """
+    Tiered page extraction.
+
+    Tier 1: PyPDF2 text layer (fast). Kept when its quality score is acceptable.
+    Tier 2: pdfplumber layout analysis (slow). Only for low-quality or failed pages;
+            the tier-1 text is kept if pdfplumber fails or returns nothing.
+    """
+    fast = ""
+    try:
+        fast = extractor.pypdf_page(index)
+    except Exception as e:
+        logger.debug(f"PyPDF2 failed on page {index + 1}: {e}")
+
+    if fast and not needs_layout_extraction(fast):
+        count("pdf_pages_total", tier="text_layer")
+        return fast
+
+    count("pdf_pages_total", tier="layout")
     try:
-        with pdfplumber.open(BytesIO(file_bytes)) as pdf:
-            for page in pdf.pages:
-                ptext = page.extract_text()
-                if ptext:
-                    text.append(ptext)
-        return "\n".join(text)
+        return extractor.pdfplumber_page(index) or fast
     except Exception as e:
-        logger.warning(f"pdfplumber failed: {e}. Falling back to PyPDF2.")
+        logger.warning(f"pdfplumber failed on page {index + 1}: {e}. Keeping text-layer output.")
+        return fast
+
+
+def iter_pdf_pages(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    page_timeout: Optional[float] = None,
+) -> Iterator[str]:
+    """Yields the text of each non-empty page, in order, as it becomes available."""
+    for _, text in iter_numbered_pdf_pages(source, max_pages, page_timeout):
+        yield text
+
+
+def iter_numbered_pdf_pages(
+    source: DocumentSource,
+    max_pages: Optional[int] = None,
+    page_timeout: Optional[float] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (page_number, text) for non-empty pages in order as they become available.
+
+    Pages are extracted on a shared worker pool with a bounded look-ahead
+    window, each through the tiered `_extract_page`. A page that runs longer
+    than `page_timeout` seconds (usually stuck in layout analysis; time queued
+    behind other uploads is not counted) is retried once with the text layer
+    only, inline on the reading thread so the retry never queues behind the
+    look-ahead window, and otherwise skipped; one bad page never fails the
+    document. At most `max_pages` pages are read.
+    """
+    max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+    page_timeout = settings.PDF_PAGE_TIMEOUT if page_timeout is None else page_timeout
+
+    extractor = _PageExtractor(source)
+    pending: Dict[int, Tuple[_PageRun, Future]] = {}
+    try:
         try:
-            reader = PyPDF2.PdfReader(BytesIO(file_bytes))
-            text = [] # Reset
-            for page in reader.pages:
-                ptext = page.extract_text()
-                if ptext:
-                    text.append(ptext)
-            return "\n".join(text)
-        except Exception as py_err:
-            logger.error(f"PyPDF2 also failed: {py_err}")
-            return ""
+            total = extractor.page_count()
+        except Exception as e:
+            logger.error(f"Unable to open PDF: {e}")
+            return
 
-def extract_resume_text(uploaded_file: Any) -> Tuple[str, str]:
+        if total > max_pages:
+            logger.warning(f"PDF has {total} pages; extracting the first {max_pages} only.")
+            total = max_pages
+
+        pool = _get_pdf_pool()
+        window = max(1, settings.PDF_WORKERS * 2)
+        next_submit = 0
+
+        for index in range(total):
+            # Keep a bounded number of pages in flight ahead of the reader
+            while next_submit < min(total, index + window):
+                run = _PageRun(extractor, next_submit)
+                pending[next_submit] = (run, pool.submit(run))
+                next_submit += 1
+
+            run, future = pending.pop(index)
+            try:
+                text = run.result(future, page_timeout)
+            except FutureTimeout:
+                # The page keeps its worker until it returns; the extractor stays open for it
+                logger.warning(f"PDF page {index + 1} exceeded {page_timeout}s; retrying text layer only.")
+                try:
+                    # Inline: the pool is saturated by the window, a submitted retry would wait behind it
+                    text = extractor.pypdf_page(index)
+                except Exception as e:
+                    logger.error(f"PDF page {index + 1} skipped: {e}")
+                    continue
+            except Exception as e:
+                logger.error(f"PDF page {index + 1} could not be extracted: {e}")
+                continue
+
+            if text:
+                yield index + 1, text
+    finally:
+        for _, future in pending.values():
+            future.cancel()
+        extractor.close()
+
+def parse_pdf_with_offsets(source: DocumentSource, max_chars: Optional[int] = None) -> Tuple[str, List[Tuple[int, int]]]:
     """
-    Extracts text from a Streamlit UploadedFile object.
-    
-    Args:
-        uploaded_file: Streamlit UploadedFile object.
-        
+    Parses PDF content page-by-page (PyPDF2 text layer, pdfplumber for low-quality pages).
+    Stops reading pages once `max_chars` (default EXTRACT_MAX_CHARS) is reached.
+
     Returns:
-        Tuple[str, str]: (raw_text, redacted_text)
+        (text, [(page_number, start offset in text), ...])
     """
-    raw = ""
+    max_chars = settings.EXTRACT_MAX_CHARS if max_chars is None else max_chars
+    pages: List[str] = []
+    offsets: List[Tuple[int, int]] = []
+    size = 0
+    pages_iter = iter_numbered_pdf_pages(source)
     try:
-        # Ensure we don't drain the buffer if accessed multiple times
-        content = uploaded_file.getvalue()
-        
+        for page_number, text in pages_iter:
+            offsets.append((page_number, size))
+            pages.append(text)
+            size += len(text) + 1
+            if size >= max_chars:
+                logger.warning(f"PDF text reached {max_chars} characters; remaining pages ignored.")
+                break
+    finally:
+        pages_iter.close()  # cancels look-ahead pages
+    return "\n".join(pages)[:max_chars], offsets
+
+def parse_pdf(source: DocumentSource, max_chars: Optional[int] = None) -> str:
+    """Parses PDF content page-by-page, up to `max_chars` characters."""
+    return parse_pdf_with_offsets(source, max_chars)[0]
+
+def parse_pdf_bytes(file_bytes: bytes) -> str:
+    """Parses PDF file content page-by-page (PyPDF2 text layer, pdfplumber for low-quality pages)."""
+    return parse_pdf(file_bytes)
+
+def _read_plain_text(source: DocumentSource, max_chars: int) -> str:
+    # utf-8 is at most 4 bytes per character: never read more than the limit needs
+    if isinstance(source, (bytes, bytearray)):
+        data = bytes(source[: max_chars * 4])
+    else:
+        with open(source, "rb") as f:
+            data = f.read(max_chars * 4)
+    return data.decode('utf-8', errors='ignore')[:max_chars]
+
+def _check_declared_size(stream: Any, limit: int) -> None:
+    """Rejects an upload whose declared size is over `limit` before any byte is read."""
+    declared = getattr(stream, "size", None)
+    if declared is not None and declared > limit:
+        raise UploadRejected(f"upload is {declared} bytes (limit {limit})")
+
+def file_digest(stream: Any, max_bytes: Optional[int] = None) -> str:
+    """
+    SHA-256 of an upload stream, read in chunks (no full copy); rewinds the stream.
+    With `max_bytes`, oversized streams raise UploadRejected instead of being read in full.
+    """
+    if max_bytes is not None:
+        _check_declared_size(stream, max_bytes)
+    digest = hashlib.sha256()
+    total = 0
+    if hasattr(stream, "seek"):
+        stream.seek(0)
+    for chunk in iter(lambda: stream.read(_COPY_CHUNK), b""):
+        total += len(chunk)
+        if max_bytes is not None and total > max_bytes:
+            raise UploadRejected(f"upload exceeds {max_bytes} bytes")
+        digest.update(chunk)
+    if hasattr(stream, "seek"):
+        stream.seek(0)
+    return digest.hexdigest()
+
+def _parse_source(source: DocumentSource, name: str, mime: str, max_chars: int) -> Tuple[str, List[Tuple[int, int]]]:
+    """Dispatches on file type; returns (raw text, page offsets)."""
+    if 'pdf' in mime or name.endswith('.pdf'):
+        return parse_pdf_with_offsets(source, max_chars)
+    if 'word' in mime or name.endswith('.docx'):
+        return parse_docx(source)[:max_chars], [(1, 0)]
+    # Fall back to reading as text
+    return _read_plain_text(source, max_chars), [(1, 0)]
+
+def extract_file_text(path: Path) -> str:
+    """
+    Extracts raw text from a PDF / DOCX / TXT file on disk (batch jobs).
+    Raises UploadRejected for oversized or malformed files.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    if size > settings.UPLOAD_MAX_BYTES:
+        raise UploadRejected(f"file is {size} bytes (limit {settings.UPLOAD_MAX_BYTES})")
+    return _parse_source(path, path.name.lower(), "", settings.EXTRACT_MAX_CHARS)[0]
+
+def extract_resume_document(uploaded_file: Any) -> Optional[ExtractedText]:
+    """
+    Extracts raw text, redacted text and page offsets from an uploaded file.
+
+    Results are cached by file digest, so a repeat upload of the same bytes
+    skips spooling and parsing entirely. Returns None if nothing could be read.
+    """
+    max_chars = settings.EXTRACT_MAX_CHARS
+    try:
+        # Size limit first: an oversized upload is never read in full, not even to hash it
+        digest = file_digest(uploaded_file, settings.UPLOAD_MAX_BYTES)
+        cached = EXTRACTION_CACHE.get(digest)
+        if cached is not None:
+            logger.info(f"Extraction cache hit for {uploaded_file.name} ({digest[:12]})")
+            return cached
+
         # Determine file type
         name = uploaded_file.name.lower()
-        mime = uploaded_file.type
+        mime = uploaded_file.type or ""
         
-        if 'pdf' in mime or name.endswith('.pdf'):
-            raw = parse_pdf_bytes(content)
-        elif 'word' in mime or name.endswith('.docx'):
-            raw = parse_docx_bytes(content)
-        else:
-            # Fall back to reading as text
-            raw = content.decode('utf-8', errors='ignore')
+        # Stream the upload in chunks instead of getvalue() + BytesIO copies
+        with spooled_upload(uploaded_file, suffix=Path(name).suffix) as source:
+            raw, page_offsets = _parse_source(source, name, mime, max_chars)
             
+    except UploadRejected as e:
+        logger.warning(f"Rejected upload {uploaded_file.name}: {e}")
+        return None
     except Exception as e:
         logger.error(f"Failed to extract text from file {uploaded_file.name}: {e}")
-        return "", ""
+        return None
+    
+    raw = raw[:max_chars]
+    if not raw:
+        return None
+
+    document = ExtractedText(digest, raw, redact_pii(raw), tuple(page_offsets))
+    EXTRACTION_CACHE.put(document)
+    return document
+
+def extract_resume_text(uploaded_file: Any) -> Tuple[str, str]:
+    """
+    Extracts text from a Streamlit UploadedFile object.
     
-    redacted = redact_pii(raw)
-    return raw, redacted
+    Args:
+        uploaded_file: Streamlit UploadedFile object.
+        
+    Returns:
+        Tuple[str, str]: (raw_text, redacted_text)
+    """
+    document = extract_resume_document(uploaded_file)
+    if document is None:
+        return "", ""
+    return document.raw, document.redacted
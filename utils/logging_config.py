@@ -1,41 +1,137 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import queue
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional
 from config import settings
 
-def setup_logging(name: str = "career_nlp") -> logging.Logger:
+# Background writer threads, one per configured logger
+_listeners: List[logging.handlers.QueueListener] = []
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line (for log shippers)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == "json":
+        return JsonLineFormatter()
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s'
+    )
+
+
+def _build_file_handler(log_file: Path) -> logging.Handler:
+    """Rotating file handler so logs/app.log stays bounded on disk."""
+    if settings.LOG_ROTATION == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            log_file,
+            when=settings.LOG_ROTATE_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding='utf-8',
+        )
+    return logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+        encoding='utf-8',
+    )
+
+
+def _stop_listeners() -> None:
+    """Flush pending records on interpreter shutdown."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def setup_logging(name: str = "career_nlp", asynchronous: Optional[bool] = None) -> logging.Logger:
     """
     Configures and returns a logger with the specified name.
-    Ensures logs are written to both stdout and a file.
+    Ensures logs are written to both stdout and a rotating file.
+
+    The logger itself only enqueues records (QueueHandler); a background
+    QueueListener thread does the formatting and I/O, so log calls never
+    block the request thread on disk or terminal writes. `asynchronous`
+    overrides settings.LOG_ASYNC.
     """
     logger = logging.getLogger(name)
-    
+
     # Avoid adding handlers multiple times
     if logger.hasHandlers():
         return logger
-        
+
     logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
 
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s'
-    )
+    formatter = _build_formatter()
+    handlers: List[logging.Handler] = []
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File Handler
     try:
         log_file = settings.LOG_DIR / "app.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = _build_file_handler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         # Fallback if file logging fails (e.g. permission issues)
         sys.stderr.write(f"Failed to setup file logging: {e}\n")
 
+    if not (settings.LOG_ASYNC if asynchronous is None else asynchronous):
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    if not _listeners:
+        atexit.register(_stop_listeners)
+    _listeners.append(listener)
+
     return logger
 
+def setup_worker_logging(name: str = "career_nlp") -> logging.Logger:
+    """
+    Rebuilds logging inside a pool worker process (call from the initializer).
+
+    A forked worker inherits the parent's QueueHandler but not its listener
+    thread, so every record would be queued and never written. Workers get
+    plain synchronous handlers instead: pool processes exit without running
+    atexit hooks, so a worker-side queue could still lose its tail. No-op in
+    the main process (thread pools share its handlers).
+    """
+    logger = logging.getLogger(name)
+    if multiprocessing.parent_process() is None:
+        return logger
+    _stop_listeners()  # spawned: flush our own listener; forked: the thread never existed here
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    return setup_logging(name, asynchronous=False)
+
 # Create a default logger instance
 logger = setup_logging()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 class UserProfile(BaseModel):
     """
@@ -11,6 +11,7 @@ class UserProfile(BaseModel):
     # Core Data
     raw_text: str = "" # Resume text or concatenated manual input
     skills: List[str] = Field(default_factory=list)
+    skill_spans: List[Tuple[int, int]] = Field(default_factory=list) # (start, end) of skill mentions in raw_text
     
     # Strategic Data (Manual)
     interests: List[str] = Field(default_factory=list)
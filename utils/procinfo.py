@@ -0,0 +1,29 @@
+"""
+Process Identity
+
+A PID alone does not identify a process: PIDs are reused, and a container's
+worker is PID 1 on every deploy. Pairing the PID with the process start time
+does, so records written by an earlier process (job owners, warm-up ready
+files) are never mistaken for a live one.
+"""
+
+from typing import Optional
+
+
+def process_start_time(pid: int) -> Optional[int]:
+    """
+    Start time of `pid` in clock ticks since boot (/proc/<pid>/stat field 22),
+    or None when the process is gone or /proc is unavailable (macOS, Windows).
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode("ascii", "replace")
+    except OSError:
+        return None
+    # Field 2 (comm) may contain spaces and parentheses; fields after it are plain
+    fields = stat[stat.rfind(")") + 2:].split()
+    try:
+        return int(fields[19])  # field 22, counted from field 3
+    except (IndexError, ValueError):
+        return None
+
@@ -0,0 +1,71 @@
+"""
+Extracted-Text Cache
+
+Maps a file digest (SHA-256 of the uploaded bytes) to its extracted raw
+text, redacted text and per-page offsets, so re-uploading the same resume
+skips parsing entirely. Bounded LRU: evicts least-recently-used entries
+past a maximum entry count or total cached characters.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from utils.tracing import count
+
+
+class ExtractedText(NamedTuple):
+    digest: str
+    raw: str
+    redacted: str
+    # (page_number, start offset in `raw`) for every page that produced text
+    page_offsets: Tuple[Tuple[int, int], ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.raw) + len(self.redacted)
+
+
+class ExtractionCache:
+    """Thread-safe LRU of ExtractedText keyed by digest."""
+
+    def __init__(self, max_entries: int, max_chars: int):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: "OrderedDict[str, ExtractedText]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[ExtractedText]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+        count("text_cache_lookups_total", result="hit" if entry is not None else "miss")
+        return entry
+
+    def put(self, entry: ExtractedText) -> None:
+        if entry.size > self.max_chars:
+            return  # would evict everything else; not worth caching
+        with self._lock:
+            old = self._entries.pop(entry.digest, None)
+            if old is not None:
+                self._chars -= old.size
+            self._entries[entry.digest] = entry
+            self._chars += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._chars > self.max_chars):
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= evicted.size
+                count("text_cache_evictions_total")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_chars(self) -> int:
+        return self._chars
@@ -0,0 +1,270 @@
+"""
+Request-Scoped Tracing & Stage Metrics
+
+Lightweight in-process instrumentation for the analysis pipeline:
+- `span(stage)` times a block and records it into a latency histogram
+- `request_trace()` groups every span of one request under a trace id
+- Counters for outcomes (e.g. LLM attempt results)
+
+Metrics export as JSON or Prometheus text exposition format.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("career_nlp.tracing")
+
+METRIC_PREFIX = "career_nlp"
+
+# Latency buckets (seconds): spaCy parses sit in the ms range, LLM calls in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (non-cumulative counts internally)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        idx = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                idx = i
+                break
+        self.counts[idx] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound containing the q-th observation (bucket resolution)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for i, c in enumerate(self.counts):
+            running += c
+            if running >= rank:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = []
+        running = 0
+        for bound, c in zip(self.buckets, self.counts):
+            running += c
+            cumulative.append([bound, running])
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": cumulative,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms and counters keyed by (name, labels)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = Histogram(self._buckets)
+            hist.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [{"labels": dict(k), **h.snapshot()} for k, h in series.items()]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [{"labels": dict(k), "value": v} for k, v in series.items()]
+                    for name, series in self._counters.items()
+                },
+            }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in Prometheus text exposition format (v0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, hist in series.items():
+                    running = 0
+                    for bound, c in zip(hist.buckets, hist.counts):
+                        running += c
+                        lines.append(f"{metric}_bucket{_fmt_labels(key, le=repr(bound))} {running}")
+                    lines.append(f"{metric}_bucket{_fmt_labels(key, le='+Inf')} {hist.count}")
+                    lines.append(f"{metric}_sum{_fmt_labels(key)} {hist.total:.6f}")
+                    lines.append(f"{metric}_count{_fmt_labels(key)} {hist.count}")
+            for name, series in sorted(self._counters.items()):
+                metric = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for key, value in series.items():
+                    lines.append(f"{metric}{_fmt_labels(key)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _fmt_labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+# Global registry (one per process)
+REGISTRY = MetricsRegistry()
+
+
+class Trace:
+    """All spans recorded for one request."""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None):
+        self.name = name
+        self.trace_id = trace_id or uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self._depth = 0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "duration_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "spans": self.spans,
+        }
+
+
+_CURRENT_TRACE: ContextVar[Optional[Trace]] = ContextVar("career_nlp_trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _CURRENT_TRACE.get()
+
+
+@contextmanager
+def request_trace(name: str = "request", trace_id: Optional[str] = None) -> Iterator[Trace]:
+    """
+    Open a request-scoped trace. Spans opened inside (same thread/task) attach to it.
+    On exit the per-stage breakdown is logged so slow requests can be diagnosed.
+    """
+    trace = Trace(name, trace_id)
+    token = _CURRENT_TRACE.set(trace)
+    try:
+        with span(name):
+            yield trace
+    finally:
+        _CURRENT_TRACE.reset(token)
+        summary = trace.summary()
+        breakdown = ", ".join(f"{s['stage']}={s['duration_ms']}ms" for s in trace.spans if s["depth"] == 1)
+        logger.info(f"trace={trace.trace_id} {name} took {summary['duration_ms']}ms [{breakdown}]")
+
+
+@contextmanager
+def span(stage: str, registry: Optional[MetricsRegistry] = None, **labels: Any) -> Iterator[None]:
+    """
+    Time a pipeline stage.
+
+    Records `stage_latency_seconds{stage=...}` and `stage_calls_total{stage=..., status=ok|error}`.
+    """
+    reg = registry or REGISTRY
+    trace = _CURRENT_TRACE.get()
+    depth = 0
+    if trace is not None:
+        depth = trace._depth
+        trace._depth += 1
+    status = "ok"
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        reg.observe("stage_latency_seconds", elapsed, stage=stage, **labels)
+        reg.inc("stage_calls_total", stage=stage, status=status, **labels)
+        if trace is not None:
+            trace._depth -= 1
+            trace.spans.append({
+                "stage": stage,
+                "depth": depth,
+                "offset_ms": round((start - trace.started) * 1000, 2),
+                "duration_ms": round(elapsed * 1000, 2),
+                "status": status,
+                **labels,
+            })
+
+
+def traced(stage: str):
+    """Decorator form of `span`."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, amount: float = 1, **labels: Any) -> None:
+    """Increment a counter in the global registry."""
+    REGISTRY.inc(name, amount, **labels)
+
+
+def export_metrics(fmt: str = "json") -> str:
+    """Export global metrics as 'json' or 'prometheus' text."""
+    if fmt == "prometheus":
+        return REGISTRY.to_prometheus()
+    if fmt == "json":
+        return REGISTRY.to_json(indent=2)
+    raise ValueError(f"Unknown metrics format: {fmt}")
@@ -0,0 +1,216 @@
+"""
+Worker Warm-Up & Readiness
+
+Loads every model a request needs (spaCy, the sentence-transformer, the
+ontology embeddings) and pushes one dummy profile through the pipeline, so
+the first live request never lands on a cold worker.
+
+Readiness is signalled in-process (`READY` event / `is_ready()`) and, for
+process managers, by a per-worker ready file `<ready_file>.<pid>` written
+atomically only after warm-up succeeds. It records the worker's start time,
+so a file left by an earlier process with the same PID (or a previous
+deploy) never counts:
+
+    # inside the worker (scripts/serve_app.py / service startup)
+    warm_up(ready_file=Path("/tmp/career_nlp.ready"))
+
+    # from a process manager / readiness probe: one worker, or any live one
+    python -m utils.warmup --wait /tmp/career_nlp.ready --pid 4242 --timeout 180
+    python -m utils.warmup --wait /tmp/career_nlp.ready --timeout 180
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config import settings
+from utils.logging_config import logger
+from utils.procinfo import process_start_time
+from utils.tracing import request_trace, span
+
+# Short text that exercises every stage (action verbs, hedging, known skills)
+WARMUP_TEXT = (
+    "Built REST APIs using Python and deployed services with Docker on AWS. "
+    "Designed PostgreSQL schemas and reduced query latency by 40%. "
+    "Familiar with Kubernetes."
+)
+
+READY = threading.Event()
+_STATUS: Dict[str, Any] = {"state": "cold", "timings_ms": {}, "error": None}
+_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+
+
+def is_ready() -> bool:
+    return READY.is_set()
+
+
+def warmup_status() -> Dict[str, Any]:
+    return dict(_STATUS)
+
+
+def warm_up(ready_file: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Load models, encode the ontology and run one dummy analysis.
+
+    Writes this worker's ready file for `ready_file` (default:
+    settings.WARMUP_READY_FILE) on success. Raises on failure so callers /
+    process managers see a hard error.
+    """
+    # Imported here: these are exactly the heavy modules being warmed
+    from nlp.model_loader import get_spacy_pipeline, get_embedding_model
+    from nlp.skill_extractor import prime_ontology_embeddings
+    from nlp.nlp_engine import analyze_text
+    from intelligence.ontology import ONTOLOGY, get_canonical_skills, normalize_skills
+    from intelligence.role_matcher import LOCAL_ROLES, calculate_role_fit
+
+    ready_file = ready_file or settings.WARMUP_READY_FILE
+    if ready_file:
+        # Only this worker's own file: other workers' signals stay in place
+        worker_ready_file(ready_file).unlink(missing_ok=True)
+
+    timings: Dict[str, float] = {}
+    _STATUS.update(state="warming", timings_ms=timings, error=None)
+
+    def _step(name, fn):
+        t0 = time.perf_counter()
+        with span("warmup", step=name):
+            result = fn()
+        timings[name] = round((time.perf_counter() - t0) * 1000, 1)
+        return result
+
+    try:
+        with request_trace("warmup"):
+            _step("spacy", get_spacy_pipeline)
+            _step("embedding_model", get_embedding_model)
+
+            skills = get_canonical_skills()
+            _step("ontology_embeddings", lambda: prime_ontology_embeddings(skills))
+
+            signals = _step("analysis", lambda: analyze_text(WARMUP_TEXT, skills))
+            if signals.get("error"):
+                raise RuntimeError(f"Dummy analysis failed: {signals['error']}")
+
+            # Only ontology hits: warm-up must never spend an LLM call
+            names = [s.get("skill", s.get("name")) for s in signals["skills"]]
+            known = [n for n in names if n and n.lower() in ONTOLOGY]
+            normalized = _step("normalization", lambda: normalize_skills(known))
+
+            if LOCAL_ROLES:
+                role = next(iter(LOCAL_ROLES))
+                _step("role_fit", lambda: calculate_role_fit(normalized, role, signals["confidence_score"]))
+    except Exception as e:
+        _STATUS.update(state="failed", error=str(e))
+        logger.exception("Worker warm-up failed")
+        raise
+
+    _STATUS.update(state="ready")
+    READY.set()
+    if ready_file:
+        write_ready_file(ready_file, timings)
+    logger.info(f"Worker warm-up complete: {timings}")
+    return warmup_status()
+
+
+def start_background_warmup(ready_file: Optional[Path] = None) -> threading.Thread:
+    """Run `warm_up` on a daemon thread (idempotent). Failures are logged, not raised."""
+    global _THREAD
+    with _LOCK:
+        if _THREAD is None:
+            def _run():
+                try:
+                    warm_up(ready_file)
+                except Exception:
+                    pass  # already logged; READY stays unset
+            _THREAD = threading.Thread(target=_run, name="model-warmup", daemon=True)
+            _THREAD.start()
+        return _THREAD
+
+
+def worker_ready_file(ready_file: Path, pid: Optional[int] = None) -> Path:
+    """`<ready_file>.<pid>`: each worker signals on its own file."""
+    ready_file = Path(ready_file)
+    return ready_file.with_name(f"{ready_file.name}.{os.getpid() if pid is None else pid}")
+
+
+def write_ready_file(ready_file: Path, timings: Optional[Dict[str, float]] = None) -> Path:
+    """Atomically writes this worker's ready file (temp file + replace, so readers never see half a file)."""
+    path = worker_ready_file(ready_file)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps({
+        "pid": os.getpid(), "started": process_start_time(os.getpid()), "timings_ms": timings or {},
+    }))
+    tmp.replace(path)
+    return path
+
+
+def ready_file_is_current(path: Path) -> bool:
+    """True when `path` was written by a worker that is still the process running under its PID."""
+    try:
+        record = json.loads(Path(path).read_text())
+        pid = int(record["pid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    if not path.name.endswith(f".{pid}"):
+        return False
+    started = process_start_time(pid)
+    if started is not None or record.get("started") is not None:
+        return started == record.get("started")
+    # No start times (no /proc): a live process with the PID is the best we can check
+    if os.name == "nt":  # os.kill(pid, 0) terminates on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def wait_for_ready_file(path: Path, timeout: float = 120.0, poll: float = 0.5, pid: Optional[int] = None) -> bool:
+    """
+    Block until worker `pid` (default: any worker) has a current ready file
+    for `path`, or `timeout` elapses.
+    """
+    path = Path(path)
+
+    def _ready() -> bool:
+        if pid is not None:
+            return ready_file_is_current(worker_ready_file(path, pid))
+        return any(ready_file_is_current(p) for p in path.parent.glob(f"{path.name}.*")
+                   if p.suffix[1:].isdigit())
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _ready():
+            return True
+        time.sleep(poll)
+    return _ready()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Warm up models or wait for a warm worker.")
+    parser.add_argument("--ready-file", type=Path, help="Write this file once warm (warm-up mode)")
+    parser.add_argument("--wait", type=Path, metavar="READY_FILE", help="Wait for a worker's ready file instead")
+    parser.add_argument("--pid", type=int, help="With --wait: the worker to wait for (default: any live worker)")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args(argv)
+
+    if args.wait:
+        ok = wait_for_ready_file(args.wait, args.timeout, pid=args.pid)
+        print("ready" if ok else f"not ready after {args.timeout}s")
+        return 0 if ok else 1
+
+    status = warm_up(args.ready_file)
+    print(json.dumps(status, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
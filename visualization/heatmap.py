@@ -1,51 +1,112 @@
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
-def render_resume_heatmap(text: str, detected_skills: List[str]):
+from visualization.render_cache import memoize_render
+
+# Simple list for MVP V2
+POWER_WORDS = [
+    "architected", "deployed", "optimized", "scaled", "led", "engineered",
+    "implemented", "developed", "created", "managed", "orchestrated", "refactored"
+]
+
+FLUFF_WORDS = [
+    "motivated", "team player", "hard worker", "passionate", "various",
+    "responsible for", "helped", "assisted", "familiar with"
+]
+
+STYLES = {
+    "skill": "background-color: rgba(0, 114, 255, 0.2); border-bottom: 2px solid #0072FF; padding: 0 4px; border-radius: 4px;",
+    "power": "background-color: rgba(0, 255, 136, 0.2); color: #00FF88; font-weight: bold;",
+    "fluff": "background-color: rgba(255, 50, 50, 0.2); color: #FF3232; text-decoration: line-through;",
+}
+
+# Lower number wins when two matches overlap
+PRIORITY = {"skill": 0, "power": 1, "fluff": 2}
+
+Annotation = Tuple[int, int, str]  # (start, end, kind) in raw text
+
+
+def _alternation(words: Sequence[str]) -> str:
+    # Longest first so "team player" beats a shorter prefix at the same position
+    return "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+
+
+@lru_cache(maxsize=64)
+def _compile_annotator(skills: Tuple[str, ...]) -> "re.Pattern":
+    """One combined pattern for skills, power words and fluff (cached per skill set)."""
+    groups = []
+    if skills:
+        # Lookarounds instead of \b so skills like "C++" or ".NET" still match
+        groups.append(rf"(?P<skill>(?<!\w)(?:{_alternation(skills)})(?!\w))")
+    groups.append(rf"(?P<power>\b(?:{_alternation(POWER_WORDS)})\b)")
+    groups.append(rf"(?P<fluff>\b(?:{_alternation(FLUFF_WORDS)})\b)")
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+def find_annotations(
+    text: str,
+    detected_skills: List[str],
+    skill_spans: Optional[Sequence[Tuple[int, int]]] = None,
+) -> List[Annotation]:
+    """
+    Finds every highlight in one scan and resolves overlaps.
+
+    `skill_spans` are precomputed (start, end) skill mentions from the NLP
+    stage. Overlaps keep the earliest match; ties go skill > power > fluff.
+    Returns sorted, non-overlapping (start, end, kind) tuples.
+    """
+    pattern = _compile_annotator(tuple(sorted(s for s in detected_skills if s)))
+    found = [(s, e, "skill") for s, e in (skill_spans or []) if 0 <= s < e <= len(text)]
+    found.extend((m.start(), m.end(), m.lastgroup) for m in pattern.finditer(text))
+
+    # Earliest start wins; at equal starts prefer higher priority, then longer
+    found.sort(key=lambda a: (a[0], PRIORITY[a[2]], a[0] - a[1]))
+    resolved: List[Annotation] = []
+    for start, end, kind in found:
+        if resolved and start < resolved[-1][1]:
+            continue  # overlaps a kept highlight
+        resolved.append((start, end, kind))
+    return resolved
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def annotate_html(text: str, annotations: Sequence[Annotation]) -> str:
+    """Builds the highlighted HTML in a single linear pass over `text`."""
+    parts = []
+    pos = 0
+    for start, end, kind in annotations:
+        parts.append(_escape(text[pos:start]))
+        parts.append(f'<span style="{STYLES[kind]}">{_escape(text[start:end])}</span>')
+        pos = end
+    parts.append(_escape(text[pos:]))
+    return "".join(parts)
+
+
+@memoize_render
+def render_resume_heatmap(
+    text: str,
+    detected_skills: List[str],
+    skill_spans: Optional[Sequence[Tuple[int, int]]] = None,
+):
     """
     Annotates the resume text with HTML highlighting.
     - Power Words / Skills -> Green
     - Weak Words / Fluff -> Red
     """
-    
-    # Simple list for MVP V2
-    POWER_WORDS = [
-        "architected", "deployed", "optimized", "scaled", "led", "engineered", 
-        "implemented", "developed", "created", "managed", "orchestrated", "refactored"
-    ]
-    
-    FLUFF_WORDS = [
-        "motivated", "team player", "hard worker", "passionate", "various", 
-        "responsible for", "helped", "assisted", "familiar with"
-    ]
-    
-    # Escape text for HTML
-    annotated = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    
-    # Highlight Skills (Blue)
-    for skill in detected_skills:
-        # Case insensitive replacement preserving case
-        pattern = re.compile(re.escape(skill), re.IGNORECASE)
-        annotated = pattern.sub(f'<span style="background-color: rgba(0, 114, 255, 0.2); border-bottom: 2px solid #0072FF; padding: 0 4px; border-radius: 4px;">{skill}</span>', annotated)
-
-    # Highlight Power Words (Green)
-    for word in POWER_WORDS:
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-        annotated = pattern.sub(f'<span style="background-color: rgba(0, 255, 136, 0.2); color: #00FF88; font-weight: bold;">{word}</span>', annotated)
-
-    # Highlight Fluff (Red)
-    for word in FLUFF_WORDS:
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-        annotated = pattern.sub(f'<span style="background-color: rgba(255, 50, 50, 0.2); color: #FF3232; text-decoration: line-through;">{word}</span>', annotated)
-    
+    annotated = annotate_html(text, find_annotations(text, detected_skills, skill_spans))
+
     return f"""
     <div style="
-        font-family: 'Courier New', monospace; 
-        white-space: pre-wrap; 
-        background: rgba(255,255,255,0.05); 
-        padding: 20px; 
-        border-radius: 12px; 
-        font-size: 14px; 
+        font-family: 'Courier New', monospace;
+        white-space: pre-wrap;
+        background: rgba(255,255,255,0.05);
+        padding: 20px;
+        border-radius: 12px;
+        font-size: 14px;
         line-height: 1.6;
         color: #ddd;
         border: 1px solid rgba(255,255,255,0.1);
@@ -1,73 +1,164 @@
-import networkx as nx
-import plotly.graph_objects as go
-from typing import List
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
-def render_skill_network(user_skills: List[str], missing_skills: List[str]):
+from visualization.render_cache import memoize_render
+
+# Ring radii around the central "YOU" node
+OWNED_RADIUS = 1.0
+MISSING_RADIUS = 1.6
+
+# Respace a ring evenly once its tightest gap falls below this share of an even step
+MIN_GAP_RATIO = 0.35
+
+_LAYOUT_CACHE_SIZE = 64
+_LAYOUT_CACHE: "OrderedDict[Tuple, Dict[str, float]]" = OrderedDict()
+_LAYOUT_LOCK = threading.Lock()
+
+TWO_PI = 2 * math.pi
+
+
+def _even_angles(nodes: Sequence[str], offset: float) -> Dict[str, float]:
+    step = TWO_PI / max(1, len(nodes))
+    return {n: (offset + i * step) % TWO_PI for i, n in enumerate(nodes)}
+
+
+def _ring_angles(nodes: Sequence[str], previous: Dict[str, float], offset: float) -> Dict[str, float]:
+    """
+    Angles for one ring, reusing `previous` angles for nodes that stay and
+    dropping new nodes into the widest free gap, so small edits barely move the graph.
     """
-    Renders a physics-based network graph separating "Owned" (Green) vs "Missing" (Red) skills.
-    Uses NetworkX for layout and Plotly for rendering.
+    kept = {n: previous[n] for n in nodes if n in previous}
+    if not kept:
+        return _even_angles(nodes, offset)
+
+    angles = sorted(kept.values())
+    placed = dict(kept)
+    for node in nodes:
+        if node in placed:
+            continue
+        # Widest gap between consecutive angles (wrapping around the circle)
+        best_i, best_gap = 0, -1.0
+        for i, a in enumerate(angles):
+            gap = (angles[(i + 1) % len(angles)] - a) % TWO_PI or TWO_PI
+            if gap > best_gap:
+                best_i, best_gap = i, gap
+        angle = (angles[best_i] + best_gap / 2) % TWO_PI
+        placed[node] = angle
+        angles.insert(best_i + 1, angle)
+        angles.sort()
+
+    if len(angles) > 1:
+        tightest = min((angles[(i + 1) % len(angles)] - a) % TWO_PI for i, a in enumerate(angles))
+        if tightest < MIN_GAP_RATIO * TWO_PI / len(angles):
+            # Too crowded: respace evenly, keeping the current angular order
+            ordered = sorted(placed, key=placed.get)
+            return _even_angles(ordered, placed[ordered[0]])
+    return placed
+
+
+def layout_angles(
+    owned: Sequence[str],
+    missing: Sequence[str],
+    previous: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
     """
-    G = nx.Graph()
-    
-    # Central Node
-    G.add_node("YOU", type="center", size=20)
-    
-    # User Skills (Owned)
-    for s in user_skills[:15]: # Limit for visual clarity
-        G.add_node(s, type="owned", size=10)
-        G.add_edge("YOU", s, weight=1)
-        
-    # Missing Skills (Target)
-    for s in missing_skills[:10]:
-        G.add_node(s, type="missing", size=15)
-        # We can add edges if we had ontology relations, e.g. Python -> Django
-        # For MVP V2, we connect them to YOU with dashed lines or just visualize them in a cluster
-        G.add_edge("YOU", s, weight=0.5)
-
-    # Spring Layout
-    pos = nx.spring_layout(G, k=0.3, iterations=50, seed=42)
-    
-    edge_x = []
-    edge_y = []
-    edge_colors = []
-
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-        
-        # Color logic
-        target = edge[1] if edge[0] == "YOU" else edge[0]
-        node_type = G.nodes[target].get("type", "center")
-        if node_type == "missing":
-            edge_colors.append("rgba(255, 50, 50, 0.3)")
-        else:
-            edge_colors.append("rgba(0, 209, 255, 0.3)")
-
-    # Draw Nodes
-    node_x = []
-    node_y = []
-    node_text = []
-    node_color = []
-    node_size = []
-    
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(node)
-        
-        ntype = G.nodes[node]["type"]
-        if ntype == "center":
-            node_color.append("#ffffff")
-            node_size.append(25)
-        elif ntype == "owned":
-            node_color.append("#0072FF") # Blue
-            node_size.append(15)
-        elif ntype == "missing":
-            node_color.append("#FF3366") # Red/Pink
-            node_size.append(18)
+    Ring angles for the star graph: owned skills on the inner ring, missing
+    skills on the outer one.
+
+    `previous` holds the angles of the layout this user saw last (kept per
+    session by the caller); a changed node set is laid out incrementally from
+    them. The result depends only on the arguments, so it is cached by them.
+    """
+    previous = previous or {}
+    carried = tuple((n, previous[n]) for n in (*owned, *missing) if n in previous)
+    key = (tuple(owned), tuple(missing), carried)
+    with _LAYOUT_LOCK:
+        angles = _LAYOUT_CACHE.get(key)
+        if angles is not None:
+            _LAYOUT_CACHE.move_to_end(key)
+            return dict(angles)
+
+    start = dict(carried)
+    angles = _ring_angles(owned, start, offset=math.pi / 2)
+    # Outer ring starts half a step off so it interleaves with the inner one
+    angles.update(_ring_angles(missing, start, offset=math.pi / 2 + math.pi / max(1, len(missing))))
+    with _LAYOUT_LOCK:
+        _LAYOUT_CACHE[key] = angles
+        if len(_LAYOUT_CACHE) > _LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+    return dict(angles)
+
+
+def radial_layout(
+    owned: Sequence[str],
+    missing: Sequence[str],
+    previous: Optional[Mapping[str, float]] = None,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Analytical layout for the star graph: "YOU" at the origin, owned skills on
+    an inner ring, missing skills on an outer ring (angles from `layout_angles`).
+    """
+    return _positions(owned, missing, layout_angles(owned, missing, previous))
+
+
+def _positions(owned: Sequence[str], missing: Sequence[str], angles: Mapping[str, float]) -> Dict[str, Tuple[float, float]]:
+    pos = {"YOU": (0.0, 0.0)}
+    for nodes, radius in ((owned, OWNED_RADIUS), (missing, MISSING_RADIUS)):
+        for n in nodes:
+            pos[n] = (radius * math.cos(angles[n]), radius * math.sin(angles[n]))
+    return pos
+
+
+def _ring_nodes(user_skills: List[str], missing_skills: List[str]) -> Tuple[List[str], List[str]]:
+    # Limit for visual clarity; a skill listed in both counts as missing
+    missing = list(dict.fromkeys(missing_skills[:10]))
+    missing_set = set(missing)
+    owned = [s for s in dict.fromkeys(user_skills[:15]) if s not in missing_set]
+    return owned, missing
+
+
+def skill_network_angles(
+    user_skills: List[str],
+    missing_skills: List[str],
+    previous: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
+    """Angles `render_skill_network` draws for these skills, laid out from `previous` (e.g. st.session_state)."""
+    return layout_angles(*_ring_nodes(user_skills, missing_skills), previous)
+
+
+@memoize_render
+def render_skill_network(user_skills: List[str], missing_skills: List[str], angles: Optional[Dict[str, float]] = None):
+    """
+    Renders a radial network graph separating "Owned" (Blue) vs "Missing" (Red) skills.
+    The layout is analytical: `angles` from `skill_network_angles`, or a fresh
+    `layout_angles` when not given. Plotly renders it.
+    """
+    # Deferred: numpy/plotly are only needed once a dashboard is shown
+    import numpy as np
+    import plotly.graph_objects as go
+
+    owned, missing = _ring_nodes(user_skills, missing_skills)
+    if angles is None or any(n not in angles for n in (*owned, *missing)):
+        angles = layout_angles(owned, missing)
+    pos = _positions(owned, missing, angles)
+    nodes = ["YOU", *owned, *missing]
+    n = len(nodes)
+
+    node_xy = np.empty((n, 2))
+    for i, node in enumerate(nodes):
+        node_xy[i] = pos[node]
+
+    # One segment per spoke: (YOU, node, gap); NaN becomes a null break in Plotly
+    edge_x = np.full(3 * (n - 1), np.nan)
+    edge_y = np.full(3 * (n - 1), np.nan)
+    edge_x[0::3], edge_y[0::3] = node_xy[0]
+    edge_x[1::3] = node_xy[1:, 0]
+    edge_y[1::3] = node_xy[1:, 1]
+
+    node_color = ["#ffffff"] + ["#0072FF"] * len(owned) + ["#FF3366"] * len(missing) # Blue / Red-Pink
+    node_size = [25] + [15] * len(owned) + [18] * len(missing)
 
     # Edge Trace (Lines)
     # Plotly Edge trace with single color is easier, multi-color strictly needs segments
@@ -81,10 +172,10 @@ def render_skill_network(user_skills: List[str], missing_skills: List[str]):
 
     # Node Trace
     node_trace = go.Scatter(
-        x=node_x, y=node_y,
+        x=node_xy[:, 0], y=node_xy[:, 1],
         mode='markers+text',
         hoverinfo='text',
-        text=node_text,
+        text=nodes,
         textposition="top center",
         marker=dict(
             showscale=False,
@@ -100,7 +191,7 @@ def render_skill_network(user_skills: List[str], missing_skills: List[str]):
                 paper_bgcolor='rgba(0,0,0,0)',
                 plot_bgcolor='rgba(0,0,0,0)',
                 xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False))
+                yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, scaleanchor="x"))
                 )
-                
+
     return fig
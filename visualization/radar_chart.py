@@ -1,11 +1,13 @@
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, List, Any
 
+from visualization.render_cache import memoize_render
+
+@memoize_render
 def render_radar_chart(user_scores: Dict[str, float], role_scores: Dict[str, float]):
     """
     Creates a high-fidelity cyberpunk-style radar chart comparing User vs Role.
     """
+    import plotly.graph_objects as go  # deferred: not needed for the landing page
     categories = list(user_scores.keys())
     user_values = list(user_scores.values())
     role_values = [role_scores.get(c, 50) for c in categories] # Default baseline
@@ -0,0 +1,101 @@
+"""
+Render-Result Cache
+
+Memoizes visualization outputs keyed on a SHA-256 of their inputs, so a
+Streamlit rerun that doesn't change the profile doesn't rebuild any chart.
+Plotly figures are stored as figure dicts and returned as-is, ready for
+st.plotly_chart: a hit costs a lookup, not a JSON round trip or Figure
+validation. Treat returned dicts as read-only. HTML fragments are stored
+as-is. The cache is an LRU bounded by total payload size
+(RENDER_CACHE_MAX_BYTES; a figure is sized by its JSON length, once, on a miss).
+"""
+
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from config import settings
+from utils.tracing import count
+
+Entry = Tuple[str, Union[str, Dict[str, Any]]]  # (kind: "figure" | "html", payload)
+
+
+class RenderCache:
+    """Thread-safe LRU of render results, bounded by payload bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Entry, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                self._entries.move_to_end(key)
+        count("render_cache_lookups_total", result="hit" if item is not None else "miss")
+        return item[0] if item is not None else None
+
+    def put(self, key: str, entry: Entry, size: Optional[int] = None) -> None:
+        """`size` defaults to the payload length (HTML)."""
+        size = len(entry[1]) if size is None else size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (entry, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                count("render_cache_evictions_total")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+
+RENDER_CACHE = RenderCache(settings.RENDER_CACHE_MAX_BYTES)
+
+
+def input_hash(name: str, args: tuple, kwargs: dict) -> str:
+    """Stable digest of a render call. Dict order is kept: it decides chart axis order."""
+    payload = json.dumps([name, list(args), sorted(kwargs.items())], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _to_entry(result: Any) -> Tuple[Entry, int]:
+    """Cache entry and its size; figures become plain dicts sized by their JSON."""
+    if isinstance(result, str):
+        return ("html", result), len(result)
+    return ("figure", result.to_dict()), len(result.to_json())
+
+
+def memoize_render(fn: Callable) -> Callable:
+    """
+    Decorator: serve `fn(*args)` from RENDER_CACHE when the inputs are unchanged.
+    Figure renderers then return the figure dict (hit or miss alike).
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = input_hash(fn.__qualname__, args, kwargs)
+        entry = RENDER_CACHE.get(key)
+        if entry is None:
+            entry, size = _to_entry(fn(*args, **kwargs))
+            RENDER_CACHE.put(key, entry, size)
+        return entry[1]
+    return wrapper